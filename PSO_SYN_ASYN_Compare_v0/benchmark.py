@@ -0,0 +1,287 @@
+import argparse
+import contextlib
+import csv
+import datetime
+import io
+import json
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+import functions
+from evaluators import Evaluator, make_evaluator
+from functions import bounds_dict, optimum_value
+from pso import PSO
+from seeding import bind_noise, run_generators
+
+_MODES = {"sync": "synchronous_optimize", "async": "asynchronous_optimize"}
+
+
+class TargetEvaluator(Evaluator):
+    # Asıl değerlendiriciyi sarar (numba backend'inde derlenmiş kernel korunur); skorun hedefe ilk ulaştığı
+    # değerlendirmeyi kaydeder. Sayaçlar asıl değerlendiricininkilerdir.
+    def __init__(self, evaluator, target):
+        super().__init__(evaluator.func, evaluator.workers)
+        self.evaluator = evaluator
+        self.target = target
+        self.evaluations_to_target = None
+
+    def __call__(self, positions):
+        scores = self.evaluator(positions)
+        self._check(scores)
+        return scores
+
+    def evaluate_one(self, position):
+        score = self.evaluator.evaluate_one(position)
+        self._check(score)
+        return score
+
+    def _check(self, scores):
+        # self.evaluations bu çağrıdan önceki değerdir; sayaçlar en sonda eşitlenir
+        if self.evaluations_to_target is None:
+            hits = np.flatnonzero(np.ravel(scores) <= self.target)
+            if hits.size:
+                self.evaluations_to_target = self.evaluations + int(hits[0]) + 1
+        self.evaluations = self.evaluator.evaluations
+        self.calls = self.evaluator.calls
+        self.seconds = self.evaluator.seconds
+
+    def close(self):
+        self.evaluator.close()
+
+
+def run_case(func, dimension, num_particle, mode, seed, max_iter=200, target_error=1e-2, velocity_rate=10,
+             backend='numpy', w_min=0.4, w_max=0.9, c1_init=2.5, c1_final=0.5, c2_init=0.5, c2_final=2.5):
+    # Tek bir koşu: senkron ve asenkron aynı seed ve aynı parametrelerle karşılaştırılır
+    f_opt = optimum_value(func, dimension)
+    # Hazır değerlendirici verildiğinden gürültü akışı ona bağlanır: aynı seed'den PSO'nunkiyle aynı akış
+    objective = bind_noise(func, run_generators(seed)["noise"])
+    evaluator = TargetEvaluator(make_evaluator(objective, 'numba' if backend == 'numba' else 'vectorized'),
+                                f_opt + target_error)
+
+    pso = PSO(num_particle=num_particle, max_iter=max_iter, func=func, dimension=dimension,
+              bounds=bounds_dict[func], w_min=w_min, w_max=w_max, c1_init=c1_init, c1_final=c1_final,
+              c2_init=c2_init, c2_final=c2_final, velocity_rate=velocity_rate, headless=True, backend=backend,
+              evaluator=evaluator, seed=seed)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        getattr(pso, _MODES[mode])()
+        seconds = time.perf_counter() - start
+
+    return {"function": func.__name__, "dimension": dimension, "num_particle": num_particle, "mode": mode,
+            "backend": backend, "seed": seed, "max_iter": max_iter, "seconds": seconds, "evaluations": evaluator.evaluations,
+            "evaluations_to_target": evaluator.evaluations_to_target, "final_error": float(pso.gBest_score - f_opt),
+            "seconds_per_iteration": seconds / max_iter, "seconds_per_evaluation": seconds / evaluator.evaluations}
+
+
+def run_benchmark(funcs=None, dimensions=(2, 10, 30), swarm_sizes=(10, 30, 50), seeds=range(10), modes=("sync", "async"),
+                  backends=("numpy",), **options):
+    runs = []
+    for func in funcs or list(bounds_dict):
+        for dimension in dimensions:
+            if optimum_value(func, dimension) is None:
+                continue
+            for num_particle in swarm_sizes:
+                for mode in modes:
+                    for backend in backends:
+                        for seed in seeds:
+                            runs.append(run_case(func, dimension, num_particle, mode, seed, backend=backend, **options))
+                        print(f"{func.__name__}, D={dimension}, N={num_particle}, {mode}, {backend}: "
+                              f"{np.median([run['final_error'] for run in runs[-len(seeds):]]):.3e}")
+    return runs
+
+
+def run_scaling_case(func, dimension, num_particle, mode, seed, max_iter=50, velocity_rate=10, memory_iterations=3,
+                     backend='numpy', w_min=0.4, w_max=0.9, c1_init=2.5, c1_final=0.5, c2_init=0.5, c2_final=2.5):
+    # Süre: toplam, fonksiyon değerlendirme (evaluator.seconds) ve geri kalan sürü güncellemesi.
+    # Bellek: tracemalloc zamanlamayı bozmasın diye ayrı, kısa (memory_iterations) bir koşuda ölçülür.
+    def make_pso(iterations):
+        return PSO(num_particle=num_particle, max_iter=iterations, func=func, dimension=dimension,
+                   bounds=bounds_dict[func], w_min=w_min, w_max=w_max, c1_init=c1_init, c1_final=c1_final,
+                   c2_init=c2_init, c2_final=c2_final, velocity_rate=velocity_rate, headless=True, backend=backend,
+                   seed=seed)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if backend == 'numba':
+            # Derleme süresi ölçüme girmesin diye kernel'ler önce kısa bir koşuda ısıtılır
+            getattr(make_pso(1), _MODES[mode])()
+        pso = make_pso(max_iter)
+        start = time.perf_counter()
+        getattr(pso, _MODES[mode])()
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        memory_pso = make_pso(memory_iterations)
+        getattr(memory_pso, _MODES[mode])()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    swarm_bytes = sum(value.nbytes for value in vars(pso.swarm).values() if isinstance(value, np.ndarray))
+    evaluation_seconds = pso.evaluator.seconds
+    return {"function": func.__name__, "dimension": dimension, "num_particle": num_particle, "mode": mode,
+            "backend": backend, "seed": seed, "max_iter": max_iter, "seconds": seconds, "evaluation_seconds": evaluation_seconds,
+            "update_seconds": seconds - evaluation_seconds, "seconds_per_iteration": seconds / max_iter,
+            "swarm_mb": swarm_bytes / 2 ** 20, "peak_mb": peak / 2 ** 20,
+            "final_error": float(pso.gBest_score - optimum_value(func, dimension))}
+
+
+def run_scaling(funcs=None, dimensions=(10, 100, 1000), swarm_sizes=(30,), seeds=range(3), modes=("sync", "async"),
+                backends=("numpy",), **options):
+    # Boyut büyüdükçe sürenin ve belleğin nereye gittiğini gösteren ölçekleme benchmark'ı
+    runs = []
+    for func in funcs or [functions.sphere, functions.rastrigin, functions.rosenbrock, functions.griewank]:
+        for dimension in dimensions:
+            if optimum_value(func, dimension) is None:
+                continue
+            for num_particle in swarm_sizes:
+                for mode in modes:
+                    for backend in backends:
+                        group = [run_scaling_case(func, dimension, num_particle, mode, seed, backend=backend, **options)
+                                 for seed in seeds]
+                        runs.extend(group)
+                        seconds = np.mean([run["seconds"] for run in group])
+                        evaluation = np.mean([run["evaluation_seconds"] for run in group]) / seconds
+                        print(f"{func.__name__}, D={dimension}, N={num_particle}, {mode}, {backend}: "
+                              f"{np.mean([run['seconds_per_iteration'] for run in group]) * 1e3:.2f} ms/iter, "
+                              f"evaluation {evaluation:.0%}, update {1 - evaluation:.0%}, "
+                              f"swarm {group[0]['swarm_mb']:.2f} MB, peak {max(run['peak_mb'] for run in group):.2f} MB")
+    return runs
+
+
+def summarize(runs):
+    # (fonksiyon, boyut, sürü boyutu, mod, backend) başına dağılım özetleri
+    groups = {}
+    for run in runs:
+        key = (run["function"], run["dimension"], run["num_particle"], run["mode"], run.get("backend", "numpy"))
+        groups.setdefault(key, []).append(run)
+
+    summary = []
+    for (function, dimension, num_particle, mode, backend), group in groups.items():
+        errors = np.array([run["final_error"] for run in group])
+        if "evaluations_to_target" not in group[0]:
+            # Ölçekleme koşuları: hedef başarısı yerine süre dağılımı ve bellek
+            summary.append({
+                "function": function, "dimension": dimension, "num_particle": num_particle, "mode": mode,
+                "backend": backend, "runs": len(group), "error_median": float(np.median(errors)),
+                "seconds_mean": float(np.mean([run["seconds"] for run in group])),
+                "seconds_per_iteration": float(np.mean([run["seconds_per_iteration"] for run in group])),
+                "evaluation_seconds": float(np.mean([run["evaluation_seconds"] for run in group])),
+                "update_seconds": float(np.mean([run["update_seconds"] for run in group])),
+                "swarm_mb": group[0]["swarm_mb"], "peak_mb": float(max(run["peak_mb"] for run in group)),
+            })
+            continue
+        to_target = [run["evaluations_to_target"] for run in group if run["evaluations_to_target"] is not None]
+        summary.append({
+            "function": function, "dimension": dimension, "num_particle": num_particle, "mode": mode,
+            "backend": backend, "runs": len(group),
+            "success_rate": len(to_target) / len(group),
+            "median_evaluations_to_target": float(np.median(to_target)) if to_target else None,
+            "error_mean": float(errors.mean()), "error_median": float(np.median(errors)),
+            "error_std": float(errors.std()), "error_best": float(errors.min()), "error_worst": float(errors.max()),
+            "error_q25": float(np.percentile(errors, 25)), "error_q75": float(np.percentile(errors, 75)),
+            "seconds_mean": float(np.mean([run["seconds"] for run in group])),
+            "seconds_per_iteration": float(np.mean([run["seconds_per_iteration"] for run in group])),
+            "seconds_per_evaluation": float(np.mean([run["seconds_per_evaluation"] for run in group])),
+        })
+    return summary
+
+
+def save_results(runs, path, csv_path=None, **settings):
+    summary = summarize(runs)
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "settings": settings,
+        "summary": summary,
+        "runs": runs,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    if csv_path is not None:
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(summary[0]))
+            writer.writeheader()
+            writer.writerows(summary)
+    return report
+
+
+def compare_results(old_path, new_path):
+    # İki benchmark çıktısını karşılaştır: süre oranı (>1 hızlanma) ve medyan hata değişimi
+    def load(path):
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        return {(row["function"], row["dimension"], row["num_particle"], row["mode"], row.get("backend", "numpy")): row
+                for row in report["summary"]}
+
+    old, new = load(old_path), load(new_path)
+    for key in sorted(old.keys() & new.keys()):
+        speedup = old[key]["seconds_mean"] / new[key]["seconds_mean"]
+        print(f"{key[0]}, D={key[1]}, N={key[2]}, {key[3]}, {key[4]}: speedup={speedup:.2f}x, "
+              f"median error {old[key]['error_median']:.3e} -> {new[key]['error_median']:.3e}")
+
+
+def compare_backends(runs, baseline="numpy"):
+    # Aynı sonuç dosyasındaki backend'leri baseline'a göre karşılaştır: süre oranı ve medyan hata
+    rows = {tuple(row[k] for k in ("function", "dimension", "num_particle", "mode", "backend")): row
+            for row in summarize(runs)}
+    for key, row in sorted(rows.items()):
+        base = rows.get(key[:4] + (baseline,))
+        if key[4] == baseline or base is None:
+            continue
+        print(f"{key[0]}, D={key[1]}, N={key[2]}, {key[3]}: {key[4]} / {baseline} "
+              f"speedup={base['seconds_mean'] / row['seconds_mean']:.2f}x, "
+              f"median error {base['error_median']:.3e} -> {row['error_median']:.3e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Senkron / asenkron PSO benchmark")
+    parser.add_argument("--functions", nargs="+", default=None, help="Varsayılan: bounds_dict içindeki tüm fonksiyonlar")
+    parser.add_argument("--dimensions", nargs="+", type=int, default=None,
+                        help="Varsayılan: 2 10 30, --scaling ile 10 100 1000")
+    parser.add_argument("--swarm-sizes", nargs="+", type=int, default=None,
+                        help="Varsayılan: 10 30 50, --scaling ile 30")
+    parser.add_argument("--seeds", type=int, default=None, help="Varsayılan: 10, --scaling ile 3")
+    parser.add_argument("--max-iter", type=int, default=None, help="Varsayılan: 200, --scaling ile 50")
+    parser.add_argument("--target-error", type=float, default=1e-2)
+    parser.add_argument("--velocity-rate", type=float, default=10)
+    parser.add_argument("--backends", nargs="+", default=["numpy"], choices=["numpy", "numba"],
+                        help="Birden fazla verilirse numpy'a göre hızlanma ve hata karşılaştırması basılır")
+    parser.add_argument("--scaling", action="store_true",
+                        help="Yakınsama yerine boyuta göre süre (değerlendirme / güncelleme) ve bellek ölçümü")
+    parser.add_argument("--output", default=None,
+                        help="Varsayılan: benchmark_results.json, --scaling ile scaling_results.json")
+    parser.add_argument("--csv", default=None, help="Özet tablonun yazılacağı CSV dosyası")
+    parser.add_argument("--compare", default=None, help="Karşılaştırılacak önceki benchmark JSON dosyası")
+    args = parser.parse_args()
+
+    funcs = [getattr(functions, name) for name in args.functions] if args.functions else None
+    if args.scaling:
+        dimensions = args.dimensions or [10, 100, 1000]
+        swarm_sizes = args.swarm_sizes or [30]
+        seeds = args.seeds or 3
+        output = args.output or "scaling_results.json"
+        options = dict(max_iter=args.max_iter or 50, velocity_rate=args.velocity_rate, backends=args.backends)
+        runs = run_scaling(funcs, dimensions, swarm_sizes, range(seeds), **options)
+    else:
+        dimensions = args.dimensions or [2, 10, 30]
+        swarm_sizes = args.swarm_sizes or [10, 30, 50]
+        seeds = args.seeds or 10
+        output = args.output or "benchmark_results.json"
+        options = dict(max_iter=args.max_iter or 200, target_error=args.target_error, velocity_rate=args.velocity_rate,
+                       backends=args.backends)
+        runs = run_benchmark(funcs, dimensions, swarm_sizes, range(seeds), **options)
+    save_results(runs, output, args.csv, dimensions=dimensions, swarm_sizes=swarm_sizes, seeds=seeds,
+                 scaling=args.scaling, **options)
+    print(f"Sonuçlar kaydedildi: {output}")
+
+    if len(args.backends) > 1:
+        compare_backends(runs, args.backends[0])
+
+    if args.compare:
+        compare_results(args.compare, output)
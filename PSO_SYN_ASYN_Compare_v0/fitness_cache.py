@@ -0,0 +1,82 @@
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FitnessCache:
+    """Daha önce değerlendirilmiş konumların skorlarını saklayan LRU önbellek.
+
+    key:
+        'exact'     : konumun kendisi (float64 baytları) anahtar olur
+        'quantized' : konum resolution adımlarına yuvarlanır; tamsayıya kırpılan
+                      alanlar (katman / nöron sayısı gibi) için resolution=1
+        'mask'      : konum threshold'a göre ikili maskeye çevrilip bitlere
+                      paketlenir (öznitelik seçimi)
+    max_size: En fazla tutulacak kayıt sayısı; dolunca en uzun süre kullanılmayan silinir.
+    path: Verilirse önbellek açılışta bu dosyadan yüklenir, save() ile diske yazılır.
+    """
+
+    def __init__(self, key='exact', resolution=1.0, threshold=0.5, max_size=None, path=None):
+        if key not in ('exact', 'quantized', 'mask'):
+            raise ValueError(f"Geçersiz anahtar türü: {key!r}")
+        self.key = key
+        self.resolution = resolution
+        self.threshold = threshold
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _settings(self):
+        return {"key": self.key, "resolution": self.resolution, "threshold": self.threshold}
+
+    def make_key(self, position):
+        position = np.asarray(position, dtype=float)
+        if self.key == 'quantized':
+            return np.round(position / self.resolution).astype(np.int64).tobytes()
+        if self.key == 'mask':
+            # Boyut da anahtara eklenir, packbits son baytı sıfırla doldurduğu için
+            return position.size.to_bytes(4, "little") + np.packbits(position > self.threshold).tobytes()
+        return position.tobytes()
+
+    def get(self, key):
+        score = self._entries.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key, score):
+        self._entries[key] = float(score)
+        self._entries.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def load(self, path):
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data["settings"] != self._settings():
+            print(f"Fitness cache ayarları uyuşmuyor, {path} yüklenmedi: {data['settings']}")
+            return
+        self._entries.update(data["entries"])
+
+    def save(self, path=None):
+        path = path or self.path
+        if path is None:
+            return
+        # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazıp yer değiştir
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            pickle.dump({"settings": self._settings(), "entries": self._entries}, f)
+        os.replace(path + ".tmp", path)
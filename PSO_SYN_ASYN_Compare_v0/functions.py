@@ -1,67 +1,133 @@
 import numpy as np
 
 # Test fonksiyonları
+# Her fonksiyon tek bir nokta (D,) ya da tüm sürüyü/ızgarayı (N, D) dizi olarak alabilir.
+# Tek nokta için skaler, (N, D) dizi için N elemanlı skor dizisi döner.
+# optimum_position çağrıdaki boyut (x.shape[-1]) kadar uzunluktadır; yalnızca
+# 2 boyut için tanımlı fonksiyonlar dimensions_dict'te listelenir.
 
 def schwefel(x):
-    schwefel.optimum_position = [420.9687] * len(x)  # Her boyut için optimum pozisyon
-    return 418.9829 * len(x) - sum([xi * np.sin(np.sqrt(abs(xi))) for xi in x])
-
-def noisy_rastrigin(x, A=10):
-    # Gürültü ekliyoruz
-    noise = np.random.uniform(-0.5, 0.5)
-    noisy_rastrigin.optimum_position = [0, 0]
-    return A * len(x) + sum([(xi ** 2 - A * np.cos(2 * np.pi * xi)) for xi in x]) + noise
-
-def rastrigin(x):
-    A = 30
+    x = np.asarray(x, dtype=float)
+    schwefel.optimum_position = [420.968746] * x.shape[-1]  # Her boyut için optimum pozisyon
+    # Sabit yüksek boyutlarda da optimumda ~0 verecek hassasiyette
+    return 418.98288727 * x.shape[-1] - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=-1)
+
+def noisy_rastrigin(x, A=10, rng=None):
+    x = np.asarray(x, dtype=float)
+    # Gürültü ekliyoruz (her nokta için ayrı); tüm noktaların gürültüsü tek çağrıda çekilir.
+    # rng: koşunun gürültü akışı (PSO kendi akışını bağlar, bkz. seeding.bind_noise); verilmezse
+    # (ör. yüzey çizimi) sabit tohumlu yeni bir akış kullanılır ve hiçbir koşunun akışı tüketilmez
+    if rng is None:
+        rng = np.random.default_rng(0)
+    noise = rng.uniform(-0.5, 0.5, x.shape[:-1])
+    noisy_rastrigin.optimum_position = [0.0] * x.shape[-1]
+    return A * x.shape[-1] + np.sum(x ** 2 - A * np.cos(2 * np.pi * x), axis=-1) + noise
+
+def rastrigin(x, A=30):
     # A = 30
-    rastrigin.optimum_position = [0, 0]
-    return A * len(x) + sum([(xi ** 2 - A * np.cos(2 * np.pi * xi)) for xi in x])
+    x = np.asarray(x, dtype=float)
+    rastrigin.optimum_position = [0.0] * x.shape[-1]
+    return A * x.shape[-1] + np.sum(x ** 2 - A * np.cos(2 * np.pi * x), axis=-1)
 
 def ackley(x):
-    ackley.optimum_position = [0, 0]
-    return -20 * np.exp(-0.2 * np.sqrt(0.5 * sum([xi ** 2 for xi in x]))) - np.exp(0.5 * sum([np.cos(2 * np.pi * xi) for xi in x])) + 20 + np.e
+    x = np.asarray(x, dtype=float)
+    ackley.optimum_position = [0.0] * x.shape[-1]
+    # 0.5 * sum yerine mean: D = 2'de aynı, D boyutta optimum değer 0 kalır
+    return -20 * np.exp(-0.2 * np.sqrt(np.mean(x ** 2, axis=-1))) - np.exp(np.mean(np.cos(2 * np.pi * x), axis=-1)) + 20 + np.e
 
 def sphere(x):
-    sphere.optimum_position = [0, 0]
-    return sum([xi ** 2 for xi in x])
+    x = np.asarray(x, dtype=float)
+    sphere.optimum_position = [0.0] * x.shape[-1]
+    return np.sum(x ** 2, axis=-1)
 
 def rosenbrock(x):
-    rosenbrock.optimum_position = [1, 1]
-    return sum([100 * (x[i + 1] - xi ** 2) ** 2 + (1 - xi) ** 2 for i, xi in enumerate(x[:-1])])
+    x = np.asarray(x, dtype=float)
+    rosenbrock.optimum_position = [1.0] * x.shape[-1]
+    return np.sum(100 * (x[..., 1:] - x[..., :-1] ** 2) ** 2 + (1 - x[..., :-1]) ** 2, axis=-1)
 
 def griewank(x):
-    griewank.optimum_position = [0, 0]
-    return 1 + sum([xi ** 2 / 4000 for xi in x]) - np.prod([np.cos(xi / np.sqrt(i + 1)) for i, xi in enumerate(x)])
+    x = np.asarray(x, dtype=float)
+    griewank.optimum_position = [0.0] * x.shape[-1]
+    i = np.arange(1, x.shape[-1] + 1)
+    return 1 + np.sum(x ** 2 / 4000, axis=-1) - np.prod(np.cos(x / np.sqrt(i)), axis=-1)
 
 def schaffer_n2(x):
-    schaffer_n2.optimum_position = [0, 0]
-    return 0.5 + (np.sin(x[0] ** 2 - x[1] ** 2) ** 2 - 0.5) / (1 + 0.001 * (x[0] ** 2 + x[1] ** 2)) ** 2
+    x = np.asarray(x, dtype=float)
+    schaffer_n2.optimum_position = [0.0] * x.shape[-1]
+    # D boyutta ardışık (x_i, x_i+1) çiftleri üzerinden toplam (expanded Schaffer); D = 2'de orijinal fonksiyon
+    x0, x1 = x[..., :-1], x[..., 1:]
+    return np.sum(0.5 + (np.sin(x0 ** 2 - x1 ** 2) ** 2 - 0.5) / (1 + 0.001 * (x0 ** 2 + x1 ** 2)) ** 2, axis=-1)
 
 def beale(x):
+    x = np.asarray(x, dtype=float)
     beale.optimum_position = [3, 0.5]
-    return (1.5 - x[0] + x[0] * x[1])**2 + (2.25 - x[0] + x[0] * x[1]**2)**2 + (2.625 - x[0] + x[0] * x[1]**3)**2
+    x0, x1 = x[..., 0], x[..., 1]
+    return (1.5 - x0 + x0 * x1)**2 + (2.25 - x0 + x0 * x1**2)**2 + (2.625 - x0 + x0 * x1**3)**2
 
 def levi_n13(x):
-    levi_n13.optimum_position = [1, 1]
-    return np.sin(3 * np.pi * x[0])**2 + (x[0] - 1)**2 * (1 + np.sin(3 * np.pi * x[1])**2) + (x[1] - 1)**2 * (1 + np.sin(2 * np.pi * x[1])**2)
+    x = np.asarray(x, dtype=float)
+    levi_n13.optimum_position = [1.0] * x.shape[-1]
+    # D boyutlu genelleme: ilk ve son terim uçlardaki koordinatlar, ortadaki toplam ardışık çiftler üzerinden
+    first, last = x[..., 0], x[..., -1]
+    return (np.sin(3 * np.pi * first)**2
+            + np.sum((x[..., :-1] - 1)**2 * (1 + np.sin(3 * np.pi * x[..., 1:])**2), axis=-1)
+            + (last - 1)**2 * (1 + np.sin(2 * np.pi * last)**2))
 
 def easom(x):
-    easom.optimum_position = [np.pi, np.pi]
-    return -np.cos(x[0]) * np.cos(x[1]) * np.exp(-((x[0] - np.pi)**2 + (x[1] - np.pi)**2))
+    x = np.asarray(x, dtype=float)
+    easom.optimum_position = [np.pi] * x.shape[-1]
+    # (-1)^D çarpanı optimum değeri her boyutta -1'de tutar; D = 2'de orijinal fonksiyon
+    sign = -1.0 if x.shape[-1] % 2 == 0 else 1.0
+    return sign * np.prod(np.cos(x), axis=-1) * np.exp(-np.sum((x - np.pi)**2, axis=-1))
 
 def michalewicz(x):
-    michalewicz.optimum_position = [2.20, 1.57]
+    x = np.asarray(x, dtype=float)
+    michalewicz.optimum_position = [2.20, 1.57]  # Yalnızca D = 2 için bilinen optimum nokta
     m = 10
-    return -sum([np.sin(xi) * (np.sin(i * xi**2 / np.pi)**(2 * m)) for i, xi in enumerate(x, 1)])
+    i = np.arange(1, x.shape[-1] + 1)
+    return -np.sum(np.sin(x) * (np.sin(i * x**2 / np.pi)**(2 * m)), axis=-1)
 
 def booth(x):
+    x = np.asarray(x, dtype=float)
     booth.optimum_position = [1, 3]
-    return (x[0] + 2 * x[1] - 7)**2 + (2 * x[0] + x[1] - 5)**2
+    x0, x1 = x[..., 0], x[..., 1]
+    return (x0 + 2 * x1 - 7)**2 + (2 * x0 + x1 - 5)**2
 
 def himmelblau(x):
+    x = np.asarray(x, dtype=float)
     himmelblau.optimum_position = [3, 2]
-    return (x[0]**2 + x[1] - 11)**2 + (x[0] + x[1]**2 - 7)**2
+    x0, x1 = x[..., 0], x[..., 1]
+    return (x0**2 + x1 - 11)**2 + (x0 + x1**2 - 7)**2
+
+def supports_dimension(func, dimensions):
+    # dimensions_dict'te olmayan fonksiyonlar her boyutta tanımlıdır
+    return dimensions_dict.get(func, dimensions) == dimensions
+
+def optimum_value(func, dimensions):
+    # Fonksiyonun bu boyuttaki bilinen global minimum değeri; bilinmiyorsa ya da boyut desteklenmiyorsa None
+    if not supports_dimension(func, dimensions):
+        return None
+    known = optima_dict.get(func)
+    if isinstance(known, dict):
+        return known.get(dimensions)
+    if known is not None:
+        return known
+    position = optimum_position(func, dimensions)
+    if position is None:
+        return None
+    return float(func(position))
+
+def optimum_position(func, dimensions=2):
+    # Fonksiyonun bilinen optimum konumu (dimensions uzunlukta); fonksiyonu çağırmadan okunur, bilinmiyorsa None
+    known = optimum_positions.get(func, getattr(func, "optimum_position", None))
+    if known is None:
+        return None
+    return np.resize(np.asarray(known, dtype=float), dimensions)
+
+def evaluate_grid(func, X, Y):
+    # Meshgrid üzerindeki tüm noktaları tek bir vektörel çağrıyla hesapla
+    points = np.column_stack([np.ravel(X), np.ravel(Y)])
+    return np.asarray(func(points)).reshape(X.shape)
 
 # Fonksiyonlara göre bounds (sınır) değerleri
 bounds_dict = {
@@ -81,3 +147,35 @@ bounds_dict = {
     booth: (-5, 5),
     himmelblau: (-5, 5)
 }
+
+# Yalnızca sabit bir boyutta tanımlı fonksiyonlar (bounds her koordinata aynen uygulanır)
+dimensions_dict = {
+    beale: 2,
+    booth: 2,
+    himmelblau: 2
+}
+
+# Optimum değeri optimum_position'dan hesaplanamayan fonksiyonlar (boyuta göre değişen ya da gürültülü)
+optima_dict = {
+    michalewicz: {2: -1.8013, 5: -4.687658, 10: -9.66015},
+    noisy_rastrigin: 0.0
+}
+
+# Optimum konumları: yüzey diskteki önbellekten okunup fonksiyon hiç çağrılmadığında da işaretlenebilsin diye.
+# Tek sayı her koordinata uygulanır; liste yalnızca 2 boyut için bilinen optimum noktadır.
+optimum_positions = {
+    schwefel: 420.968746,
+    noisy_rastrigin: 0.0,
+    rastrigin: 0.0,
+    ackley: 0.0,
+    sphere: 0.0,
+    rosenbrock: 1.0,
+    griewank: 0.0,
+    schaffer_n2: 0.0,
+    beale: [3, 0.5],
+    levi_n13: 1.0,
+    easom: np.pi,
+    michalewicz: [2.20, 1.57],
+    booth: [1, 3],
+    himmelblau: [3, 2]
+}
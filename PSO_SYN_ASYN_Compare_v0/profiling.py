@@ -0,0 +1,125 @@
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+_NULL_PHASE = nullcontext()
+
+
+class Profiler:
+    """optimize() içindeki aşamaların (evaluation, update, record, stop_check,
+    draw, encode, gif, print...) süre, çağrı sayısı ve tepe bellek ölçümü.
+
+    phase(name) bağlam yöneticisi aşamanın süresini biriktirir; hooks içindeki
+    her fonksiyon her aşama bittiğinde hook(name, seconds) ile çağrılır.
+    count(name, n) serbest sayaçlar (evaluations, frames...) içindir.
+    memory=True ise koşu boyunca tracemalloc açık tutulur ve her iterasyon
+    sonunda tepe bellek örneklenir (tracemalloc koşuyu belirgin yavaşlatır).
+    report() koşu sonunda basılan özet tabloyu, summary() aynı bilgiyi dict
+    olarak döndürür.
+    """
+
+    enabled = True
+
+    def __init__(self, hooks=(), memory=False):
+        self.hooks = list(hooks)
+        self.memory = memory
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.peak_memory = None
+        self.total = 0.0
+        self._start = None
+        self._tracing = False
+
+    def start(self):
+        self.seconds.clear()
+        self.calls.clear()
+        self.counters.clear()
+        self.peak_memory = None
+        self.total = 0.0
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.seconds[name] += seconds
+            self.calls[name] += 1
+            for hook in self.hooks:
+                hook(name, seconds)
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def sample_memory(self):
+        if self.memory and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_memory = peak if self.peak_memory is None else max(self.peak_memory, peak)
+
+    def stop(self):
+        self.total = time.perf_counter() - self._start
+        self.sample_memory()
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def summary(self):
+        phases = {name: {"seconds": seconds, "calls": self.calls[name]} for name, seconds in self.seconds.items()}
+        return {"total": self.total, "other": self.total - sum(self.seconds.values()), "phases": phases,
+                "counters": dict(self.counters), "peak_memory": self.peak_memory}
+
+    def report(self):
+        lines = [f"Profil: toplam {self.total:.3f}s"]
+        for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1]):
+            calls = self.calls[name]
+            lines.append(f"  {name:<14}{seconds:9.3f}s {100 * seconds / max(self.total, 1e-12):6.1f}% "
+                         f"{calls:8d} çağrı {1e3 * seconds / calls:9.3f} ms/çağrı")
+        other = self.total - sum(self.seconds.values())
+        lines.append(f"  {'diğer':<14}{other:9.3f}s {100 * other / max(self.total, 1e-12):6.1f}%")
+        if self.counters:
+            lines.append("  " + ", ".join(f"{name}: {value}" for name, value in self.counters.items()))
+        if self.peak_memory is not None:
+            lines.append(f"  tepe bellek: {self.peak_memory / 2 ** 20:.1f} MB")
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    # Profil kapalıyken kullanılır: phase() hazır bir boş bağlam döndürür, diğer çağrılar hiçbir şey yapmaz
+    enabled = False
+
+    def start(self):
+        pass
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def count(self, name, n=1):
+        pass
+
+    def sample_memory(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+def make_profiler(profile):
+    # None / False: kapalı; True: açık; dict: Profiler argümanları; fonksiyon: hook(name, seconds); ya da Profiler nesnesi
+    if not profile:
+        return NullProfiler()
+    if profile is True:
+        return Profiler()
+    if isinstance(profile, dict):
+        return Profiler(**profile)
+    if isinstance(profile, (Profiler, NullProfiler)):
+        return profile
+    if callable(profile):
+        return Profiler(hooks=[profile])
+    raise ValueError(f"Geçersiz profile değeri: {profile!r}")
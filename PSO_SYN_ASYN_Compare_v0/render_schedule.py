@@ -0,0 +1,24 @@
+import numpy as np
+
+
+def make_render_schedule(render_every, max_iter, log_frames=50):
+    # Hangi iterasyonlarda kare üretileceğine karar veren fonksiyonu döndürür: f(iteration, improved) -> bool
+    #   int k     : her k iterasyonda bir
+    #   'log'     : logaritmik aralıklı iterasyonlarda (başta sık, sonda seyrek), yaklaşık log_frames kare
+    #   'improve' : yalnızca gBest iyileştiğinde
+    #   callable  : kullanıcı fonksiyonu f(iteration, improved)
+    # İlk ve son iterasyon her zaman çizilir.
+    if callable(render_every):
+        return render_every
+
+    if render_every == 'log':
+        iterations = set(np.unique(np.round(np.geomspace(1, max_iter, min(max_iter, log_frames)))).astype(int))
+        schedule = lambda iteration, improved: iteration in iterations
+    elif render_every == 'improve':
+        schedule = lambda iteration, improved: improved
+    elif isinstance(render_every, int) and render_every >= 1:
+        schedule = lambda iteration, improved: iteration % render_every == 0
+    else:
+        raise ValueError(f"Geçersiz render_every değeri: {render_every!r}")
+
+    return lambda iteration, improved: iteration == 1 or iteration == max_iter or schedule(iteration, improved)
@@ -0,0 +1,42 @@
+import argparse
+
+import functions
+from animation_writer import GifStreamWriter
+from pso import PSO
+from trajectory import Trajectory
+
+
+def replay(trajectory_path, output_path='replay_animation.gif', every=1, landscape_cache_dir=None):
+    # Kaydedilmiş bir koşuyu optimizasyonu tekrar çalıştırmadan yeniden çizer
+    trajectory = Trajectory(trajectory_path)
+    meta = trajectory.meta
+    func = getattr(functions, meta["function"], None)
+    if func is None:
+        raise ValueError(f"functions.py içinde '{meta['function']}' bulunamadı")
+
+    # w, c1, c2 her karede kayıttan okunur; yapıcıya yalnızca ilk/son değerler verilir
+    w, c1, c2 = trajectory.params[0, :3]
+    w_final, c1_final, c2_final = trajectory.params[-1, :3]
+    pso = PSO(num_particle=meta["num_particles"], max_iter=len(trajectory), func=func, dimension=meta["dimensions"],
+              bounds=meta["bounds"], w_min=w_final, w_max=w, c1_init=c1, c1_final=c1_final, c2_init=c2,
+              c2_final=c2_final, velocity_rate=meta["velocity_rate"], landscape_cache_dir=landscape_cache_dir)
+
+    with GifStreamWriter(output_path, duration=300) as writer:
+        for snapshot in trajectory.snapshots(every):
+            for frames in pso.render_snapshot(snapshot):
+                for frame in frames:
+                    writer.append(frame)
+
+    print(f"GIF kaydedildi: {output_path}")
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kaydedilmiş PSO koşusunu GIF olarak yeniden çiz")
+    parser.add_argument("trajectory_path")
+    parser.add_argument("-o", "--output", default="replay_animation.gif")
+    parser.add_argument("--every", type=int, default=1, help="Her kaç iterasyonda bir kare çizileceği")
+    parser.add_argument("--landscape-cache", default=".landscape_cache")
+    args = parser.parse_args()
+
+    replay(args.trajectory_path, args.output, every=args.every, landscape_cache_dir=args.landscape_cache)
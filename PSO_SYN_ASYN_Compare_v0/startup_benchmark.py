@@ -0,0 +1,111 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Alt süreçte çalışır: her aşamada bir işaret satırı basar; süreler ana süreçte, satır geldiği anda ölçülür
+_CHILD = """
+import os
+print("interpreter", flush=True)
+from functions import bounds_dict, rastrigin
+from pso import PSO
+print("import", flush=True)
+
+
+def first_iteration(event):
+    print("first_iteration", flush=True)
+    os._exit(0)
+
+
+pso = PSO(num_particle={num_particle}, max_iter=100, func=rastrigin, dimension={dimension}, bounds=bounds_dict[rastrigin],
+          w_min=0.4, w_max=0.9, c1_init=2.5, c1_final=0.5, c2_init=0.5, c2_final=2.5, velocity_rate=10,
+          headless={headless}, output_path={output_path!r}, progress=first_iteration)
+pso.synchronous_optimize()
+"""
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _time_markers(command, cwd, timeout=120):
+    # Süreç başlangıcından her işaret satırının gelişine kadar geçen süre (saniye)
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    markers = {}
+    try:
+        for line in process.stdout:
+            markers[line.strip()] = time.perf_counter() - start
+    finally:
+        process.wait(timeout=timeout)
+    return markers
+
+
+def run_startup_case(headless, num_particle=30, dimension=2):
+    # Süreç başlangıcından ilk iterasyonun sonuna kadar (headless=False ise ilk karenin çizimi dahil)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        code = _CHILD.format(num_particle=num_particle, dimension=dimension, headless=headless,
+                             output_path=os.path.join(tmp_dir, "startup.gif"))
+        markers = _time_markers([sys.executable, "-c", code], _PACKAGE_DIR)
+    return {"case": "headless" if headless else "render", "interpreter": markers.get("interpreter"),
+            "import": markers.get("import"), "first_iteration": markers.get("first_iteration")}
+
+
+def run_gui_case(gui_main):
+    # GUI'nin main.py --startup-benchmark ile açılıp ilk boyamayı bitirmesine kadar geçen süre
+    markers = _time_markers([sys.executable, gui_main, "--startup-benchmark"], os.path.dirname(gui_main))
+    return {"case": "gui", "first_paint": markers.get("first_paint")}
+
+
+def run_startup(repeats=5, gui_main=None):
+    runs = []
+    for repeat in range(repeats):
+        cases = [run_startup_case(headless=True), run_startup_case(headless=False)]
+        if gui_main:
+            cases.append(run_gui_case(gui_main))
+        for case in cases:
+            case["repeat"] = repeat
+            print(", ".join(f"{key}={value:.3f}s" if isinstance(value, float) else f"{key}={value}"
+                            for key, value in case.items()))
+        runs.extend(cases)
+    return runs
+
+
+def summarize_startup(runs):
+    # Aşama başına medyan ve en iyi süre; işaret gelmediyse (ör. PyQt5 kurulu değilse) None
+    summary = []
+    for case in dict.fromkeys(run["case"] for run in runs):
+        group = [run for run in runs if run["case"] == case]
+        row = {"case": case, "runs": len(group)}
+        for key in ("interpreter", "import", "first_iteration", "first_paint"):
+            values = [run[key] for run in group if run.get(key) is not None]
+            if key in group[0]:
+                row[f"{key}_median"] = float(np.median(values)) if values else None
+                row[f"{key}_best"] = float(min(values)) if values else None
+        summary.append(row)
+    return summary
+
+
+if __name__ == "__main__":
+    default_gui = os.path.join(os.path.dirname(_PACKAGE_DIR), "PSO_TestFunc_Animation_Adaptive_v4", "main.py")
+    parser = argparse.ArgumentParser(description="Süreç başlangıcından ilk iterasyona / ilk pencere boyamasına süre")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--gui", default=default_gui if os.path.exists(default_gui) else None,
+                        help="GUI main.py yolu (PyQt5 gerekir); 'none' verilirse GUI ölçülmez")
+    parser.add_argument("--output", default="startup_results.json")
+    args = parser.parse_args()
+
+    runs = run_startup(args.repeats, None if args.gui == "none" else args.gui)
+    summary = summarize_startup(runs)
+    report = {"created": datetime.datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+              "machine": platform.platform(), "summary": summary, "runs": runs}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    for row in summary:
+        print(row)
+    print(f"Sonuçlar kaydedildi: {args.output}")
@@ -0,0 +1,175 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+import functions
+from animation_writer import GifStreamWriter, combine_frames, read_gif_frames
+from pso import PSO
+
+
+def expand_grid(**axes):
+    # expand_grid(w_max=[0.1, 0.5], c1_init=[0.5, 2.5]) -> 4 konfigürasyon (tüm kombinasyonlar)
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def load_configs(path):
+    """JSON dosyasından (configs, seeds) okur.
+
+    {
+        "base": {"func": "rastrigin", "max_iter": 100, "velocity_rate": 20, ...},
+        "grid": {"w_max": [0.1, 0.5, 0.9], "num_particle": [5, 10]},   # ya da
+        "configs": [{"w_max": 0.1, ...}, ...],
+        "seeds": 30                                                    # ya da [0, 1, 2]
+    }
+    base her konfigürasyonla birleştirilir; grid ve configs birlikte verilirse ikisi de eklenir.
+    """
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+
+    base = spec.get("base", {})
+    configs = [dict(base, **config) for config in spec.get("configs", [])]
+    if "grid" in spec:
+        configs += [dict(base, **config) for config in expand_grid(**spec["grid"])]
+    seeds = spec.get("seeds", [0])
+    if isinstance(seeds, int):
+        seeds = list(range(seeds))
+    return configs, seeds
+
+
+def _resolve(config):
+    # Dosyadan gelen fonksiyon adlarını gerçek fonksiyona çevir, eksik bounds'u bounds_dict'ten al
+    config = dict(config)
+    if isinstance(config.get("func"), str):
+        config["func"] = getattr(functions, config["func"])
+    if "bounds" not in config:
+        config["bounds"] = functions.bounds_dict[config["func"]]
+    # Sabit parametreli koşular için w / c1 / c2 kısayolları
+    for name, (start, end) in {"w": ("w_max", "w_min"), "c1": ("c1_init", "c1_final"),
+                               "c2": ("c2_init", "c2_final")}.items():
+        if name in config:
+            value = config.pop(name)
+            config.setdefault(start, value)
+            config.setdefault(end, value)
+    config.setdefault("dimension", 2)
+    return config
+
+
+def _run(job):
+    index, seed, config, method, output_path = job
+
+    # Koşunun tüm rastgeleliği PSO'ya verilen seed'den türetilir; hangi işçide çalıştığı sonucu değiştirmez
+    config = dict(_resolve(config), seed=seed)
+    method = config.pop("method", method)
+    if output_path is None:
+        config["headless"] = True
+    else:
+        config["output_path"] = output_path
+
+    pso = PSO(**config)
+    start = time.perf_counter()
+    getattr(pso, method)()
+    seconds = time.perf_counter() - start
+
+    return {"config": index, "seed": seed, "method": method, "score": float(pso.gBest_score),
+            "position": pso.gBest_position.tolist(), "seconds": seconds, "iterations": pso.stop_iteration,
+            "evaluations": pso.evaluator.evaluations, "stop_reason": pso.stop_reason, "output_path": output_path}
+
+
+def run_sweep(configs, seeds=(0,), method="synchronous_optimize", workers=None, frames=False, output_dir=".",
+              results_path=None):
+    """Her (konfigürasyon, seed) çiftini süreç havuzunda bağımsız bir koşu olarak çalıştırır.
+
+    configs: PSO anahtar kelime argümanlarından oluşan dict listesi; "func" bir
+        fonksiyon ya da functions.py içindeki adı olabilir, "method" verilirse o
+        konfigürasyon için çağrılacak optimize metodunu belirler.
+    frames: True ise her konfigürasyonun ilk seed'i GIF olarak çizilir
+        (output_dir/<func>_run<i>.gif), diğer koşular headless çalışır.
+    workers: 1 ise koşular bu süreçte sırayla çalıştırılır; sonuçlar havuzla
+        çalıştırılanlarla aynıdır.
+    results_path: Verilirse sonuçlar bu JSON dosyasına da yazılır.
+
+    Sonuçlar (config, seed) sırasıyla dict listesi olarak döner.
+    """
+    jobs = []
+    for index, config in enumerate(configs):
+        for seed in seeds:
+            output_path = None
+            if frames and seed == seeds[0]:
+                func = _resolve(config)["func"]
+                output_path = os.path.join(output_dir, f"{func.__name__}_run{index}.gif")
+            jobs.append((index, seed, config, method, output_path))
+
+    workers = min(workers or multiprocessing.cpu_count(), len(jobs))
+    if workers == 1:
+        results = [_run(job) for job in jobs]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = list(pool.imap_unordered(_run, jobs))
+    results.sort(key=lambda result: (result["config"], seeds.index(result["seed"])))
+
+    if results_path is not None:
+        with open(results_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+def summarize(results):
+    # Konfigürasyon başına skor istatistikleri ve ortalama süre
+    summary = []
+    for index, group in itertools.groupby(results, key=lambda result: result["config"]):
+        group = list(group)
+        scores = np.array([result["score"] for result in group])
+        summary.append({"config": index, "runs": len(group), "mean": float(scores.mean()),
+                        "median": float(np.median(scores)), "best": float(scores.min()),
+                        "worst": float(scores.max()),
+                        "seconds": float(np.mean([result["seconds"] for result in group]))})
+    return summary
+
+
+def print_summary(configs, results):
+    for row in summarize(results):
+        config = {name: value for name, value in configs[row['config']].items() if not callable(value)}
+        print(f"({row['config']}) {config}: runs={row['runs']}, mean={row['mean']:.4e}, "
+              f"median={row['median']:.4e}, best={row['best']:.4e}, worst={row['worst']:.4e}, "
+              f"time={row['seconds']:.2f}s")
+
+
+def combine_gifs(paths, output_path='combined_anim.gif', columns=3):
+    # Koşuların GIF'leri kare kare (tembel okunarak) N panelli tek bir GIF'te birleştirilir
+    try:
+        with GifStreamWriter(output_path, duration=300) as writer:
+            for frames in zip(*(read_gif_frames(path) for path in paths)):
+                writer.append(combine_frames(list(frames), columns=columns))
+
+        if writer.frame_count:
+            return output_path
+        else:
+            print("No frames were generated for the animation.")
+            return None
+    except Exception as e:
+        print(f"Error in combine_gifs: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PSO parametre taramasını süreç havuzunda çalıştır")
+    parser.add_argument("config_path")
+    parser.add_argument("--method", default="synchronous_optimize", help="Çağrılacak PSO metodu")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--frames", action="store_true", help="Her konfigürasyonun ilk seed'ini GIF olarak çiz")
+    parser.add_argument("--columns", type=int, default=3)
+    parser.add_argument("--results", default="sweep_results.json")
+    args = parser.parse_args()
+
+    configs, seeds = load_configs(args.config_path)
+    results = run_sweep(configs, seeds, method=args.method, workers=args.workers, frames=args.frames, results_path=args.results)
+    print_summary(configs, results)
+    if args.frames:
+        paths = [result["output_path"] for result in results if result["output_path"]]
+        combine_gifs(paths, output_path='combined_anim.gif', columns=args.columns)
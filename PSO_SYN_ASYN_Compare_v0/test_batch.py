@@ -0,0 +1,42 @@
+import numpy as np
+from functions import bounds_dict, noisy_rastrigin, rastrigin
+from pso import PSO
+
+# optimize_batch'teki her koşu, aynı seed'le tek başına çalıştırılan PSO ile aynı sonucu vermeli
+SEEDS = [1, 2, 3]
+TOPOLOGIES = [None, 'ring', 'von_neumann', 'random', 'dynamic']
+
+
+def make_pso(func, topology, seed=None):
+    return PSO(num_particle=12, max_iter=30, func=func, dimension=3, bounds=bounds_dict[func], w_min=0.4, w_max=0.9,
+               c1_init=2.5, c1_final=0.5, c2_init=0.5, c2_final=2.5, velocity_rate=10, topology=topology,
+               headless=True, seed=seed)
+
+
+def check_batch_matches_singles(synchronous):
+    for func in [rastrigin, noisy_rastrigin]:
+        for topology in TOPOLOGIES:
+            batch = make_pso(func, topology).optimize_batch(SEEDS, synchronous=synchronous)
+            for r, seed in enumerate(SEEDS):
+                single = make_pso(func, topology, seed=seed)
+                if synchronous:
+                    single.synchronous_optimize()
+                else:
+                    single.asynchronous_optimize()
+                label = f"{func.__name__}, topology={topology}, seed={seed}"
+                assert batch['gbest_scores'][r] == single.gBest_score, label
+                assert np.array_equal(batch['gbest_positions'][r], single.gBest_position), label
+
+
+def test_synchronous_batch_matches_singles():
+    check_batch_matches_singles(synchronous=True)
+
+
+def test_asynchronous_batch_matches_singles():
+    check_batch_matches_singles(synchronous=False)
+
+
+if __name__ == "__main__":
+    test_synchronous_batch_matches_singles()
+    test_asynchronous_batch_matches_singles()
+    print("optimize_batch == tekil koşular: OK")
@@ -0,0 +1,32 @@
+import numpy as np
+from landscape import _function_key, get_landscape
+
+
+def rastrigin_a10(x, A=10):
+    x = np.asarray(x, dtype=float)
+    return A * x.shape[-1] + np.sum(x ** 2 - A * np.cos(2 * np.pi * x), axis=-1)
+
+
+def rastrigin_a30(x, A=30):
+    x = np.asarray(x, dtype=float)
+    return A * x.shape[-1] + np.sum(x ** 2 - A * np.cos(2 * np.pi * x), axis=-1)
+
+
+# Aynı isim ve aynı gövde; yalnızca A'nın varsayılan değeri farklı
+rastrigin_a30.__name__ = rastrigin_a10.__name__
+
+
+def test_function_key_includes_defaults(tmp_path):
+    # Yalnızca varsayılan argümanı farklı iki fonksiyon diskte aynı yüzeyi paylaşmamalı
+    assert _function_key(rastrigin_a10) != _function_key(rastrigin_a30)
+    low = get_landscape(rastrigin_a10, (-5.12, 5.12), 20, cache_dir=str(tmp_path))
+    high = get_landscape(rastrigin_a30, (-5.12, 5.12), 20, cache_dir=str(tmp_path))
+    assert not np.array_equal(low.Z, high.Z)
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_function_key_includes_defaults(pathlib.Path(tempfile.mkdtemp()))
+    print("yüzey anahtarı varsayılan argümanları içeriyor: OK")
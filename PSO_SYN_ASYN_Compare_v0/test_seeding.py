@@ -0,0 +1,33 @@
+import contextlib
+import io
+
+from functions import bounds_dict, noisy_rastrigin
+from pso import PSO
+
+# Gürültü akışı koşuya aittir: sonradan kurulan bir PSO önceki koşunun sonucunu değiştirmemeli
+
+
+def make_pso(seed):
+    return PSO(num_particle=12, max_iter=30, func=noisy_rastrigin, dimension=3, bounds=bounds_dict[noisy_rastrigin],
+               w_min=0.4, w_max=0.9, c1_init=2.5, c1_final=0.5, c2_init=0.5, c2_final=2.5, velocity_rate=10,
+               headless=True, seed=seed)
+
+
+def run(pso, method):
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(pso, method)()
+    return pso.gBest_score
+
+
+def test_later_pso_does_not_change_noise_stream():
+    for method in ["synchronous_optimize", "asynchronous_optimize"]:
+        alone = run(make_pso(1), method)
+        first = make_pso(1)
+        second = make_pso(2)
+        assert run(first, method) == alone, method
+        assert run(second, method) == run(make_pso(2), method), method
+
+
+if __name__ == "__main__":
+    test_later_pso_does_not_change_noise_stream()
+    print("gürültü akışı koşuya ait: OK")
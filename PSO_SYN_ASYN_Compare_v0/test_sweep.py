@@ -0,0 +1,15 @@
+from sweep import run_sweep
+
+
+def test_run_sweep_defaults():
+    # Varsayılan method / seeds / workers ile tek konfigürasyonluk küçük bir tarama
+    config = dict(func="sphere", num_particle=5, max_iter=5, velocity_rate=10, w=0.7, c1=1.5, c2=1.5)
+    results = run_sweep([config])
+    assert len(results) == 1
+    assert results[0]["method"] == "synchronous_optimize"
+    assert results[0]["iterations"] == 5
+
+
+if __name__ == "__main__":
+    test_run_sweep_defaults()
+    print("run_sweep varsayılanları: OK")
@@ -0,0 +1,174 @@
+import copy
+
+import numpy as np
+
+from seeding import generator_state, set_generator_state
+
+
+class Topology:
+    """Komşuluk (lbest) topolojisi.
+
+    neighbors (N, K) dizisinin i. satırı i. parçacığın komşularının (kendisi dahil)
+    indeksleridir. Sosyal terimde gBest yerine her parçacığın komşuları arasındaki
+    en iyi pbest konumu kullanılır; bu, tüm sürü için tek bir gather + argmin ile
+    bulunur. Diziler (N, ...) ya da toplu koşularda (R, N, ...) olabilir.
+    """
+
+    def __init__(self, neighbors):
+        self.neighbors = np.asarray(neighbors, dtype=np.intp)
+        self._rows = np.arange(len(self.neighbors))
+
+    def local_best(self, best_scores, best_positions):
+        # Her parçacık için komşularındaki en iyi pbest konumu: (..., N, D)
+        choice = np.argmin(best_scores[..., self.neighbors], axis=-1)
+        index = self.neighbors[self._rows, choice]
+        return np.take_along_axis(best_positions, index[..., None], axis=-2)
+
+    def particle_best(self, i, best_scores, best_positions):
+        # Asenkron güncelleme için yalnızca i. parçacığın komşuluğundaki en iyi pbest: (..., D)
+        neighbors = self.neighbors[i]
+        index = neighbors[np.argmin(best_scores[..., neighbors], axis=-1)]
+        return np.take_along_axis(best_positions, np.asarray(index)[..., None, None], axis=-2)[..., 0, :]
+
+    def advance(self):
+        # Her iterasyon sonunda çağrılır; sabit topolojilerde bir şey yapmaz
+        pass
+
+    def state_dict(self):
+        return {"topology_neighbors": self.neighbors}
+
+    def load_state_dict(self, state):
+        self.neighbors = np.array(state["topology_neighbors"], dtype=np.intp)
+
+
+class DynamicTopology(Topology):
+    # Sürü her regroup_every iterasyonda rastgele group_size'lık gruplara yeniden bölünür (DMS-PSO)
+    def __init__(self, num_particles, group_size=3, regroup_every=5, rng=None):
+        self.rng = np.random.default_rng(rng)
+        self.num_particles = num_particles
+        self.group_size = group_size
+        self.regroup_every = regroup_every
+        self._iteration = 0
+        super().__init__(self._regroup())
+
+    def _regroup(self):
+        order = self.rng.permutation(self.num_particles)
+        # Son grup eksik kalırsa baştaki parçacıklarla tamamlanır
+        padded = np.resize(order, -(-self.num_particles // self.group_size) * self.group_size)
+        groups = padded.reshape(-1, self.group_size)
+        neighbors = np.empty((self.num_particles, self.group_size), dtype=np.intp)
+        for group in groups:
+            neighbors[group] = group
+        return neighbors
+
+    def advance(self):
+        self._iteration += 1
+        if self._iteration % self.regroup_every == 0:
+            self.neighbors = self._regroup()
+
+    def state_dict(self):
+        return dict(super().state_dict(), topology_iteration=self._iteration, topology_rng=generator_state(self.rng))
+
+    def load_state_dict(self, state):
+        super().load_state_dict(state)
+        self._iteration = int(state["topology_iteration"])
+        set_generator_state(self.rng, state["topology_rng"])
+
+
+class BatchTopology:
+    """Toplu koşularda (R, N, ...) her koşunun kendi rastgele topolojisi.
+
+    Yalnızca komşulukları rastgele kurulan topolojiler ('random', 'dynamic')
+    için kullanılır: her biri koşunun kendi topoloji akışından kurulur ve ayrı
+    ilerler; böylece bir koşu, aynı seed'le tek başına çalıştırılan PSO ile
+    aynı komşulukları görür. Sabit komşuluklar tüm koşularda tek bir Topology
+    ile paylaşılır (bkz. make_batch_topology).
+    """
+
+    def __init__(self, topologies):
+        self.topologies = list(topologies)
+
+    def local_best(self, best_scores, best_positions):
+        return np.stack([topology.local_best(scores, positions)
+                         for topology, scores, positions in zip(self.topologies, best_scores, best_positions)])
+
+    def particle_best(self, i, best_scores, best_positions):
+        return np.stack([topology.particle_best(i, scores, positions)
+                         for topology, scores, positions in zip(self.topologies, best_scores, best_positions)])
+
+    def advance(self):
+        for topology in self.topologies:
+            topology.advance()
+
+
+def ring_neighbors(num_particles, k=1):
+    # Her parçacık iki yanındaki k komşuyla (ve kendisiyle) bağlı
+    offsets = np.arange(-k, k + 1)
+    return (np.arange(num_particles)[:, None] + offsets) % num_particles
+
+
+def von_neumann_neighbors(num_particles):
+    # Parçacıklar kareye en yakın rows x cols ızgaraya (kenarları sarmal) dizilir; üst/alt/sol/sağ komşular
+    rows = int(np.sqrt(num_particles))
+    while num_particles % rows:
+        rows -= 1
+    cols = num_particles // rows
+    index = np.arange(num_particles)
+    row, col = index // cols, index % cols
+    return np.column_stack([index,
+                            ((row - 1) % rows) * cols + col, ((row + 1) % rows) * cols + col,
+                            row * cols + (col - 1) % cols, row * cols + (col + 1) % cols])
+
+
+def random_neighbors(num_particles, k=3, rng=None):
+    # Her parçacık kendisi dışında rastgele seçilmiş k parçacığı bilgilendirir
+    # Her satıra 1..N-1 aralığında k farklı kaydırma toplu çekilir (i + kaydırma mod N hiçbir zaman i değildir);
+    # aynı kaydırma iki kez gelen satırlar yeniden çekilir. Bellek O(N * k)
+    rng = np.random.default_rng(rng)
+    k = min(k, num_particles - 1)
+    if 2 * k >= num_particles - 1:
+        # Küçük sürülerde tekrar olasılığı yüksek: her satırda kaydırmalar karıştırılıp ilk k tanesi alınır
+        offsets = rng.permuted(np.tile(np.arange(1, num_particles), (num_particles, 1)), axis=1)[:, :k]
+    else:
+        offsets = rng.integers(1, num_particles, size=(num_particles, k))
+        while True:
+            ordered = np.sort(offsets, axis=1)
+            repeated = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+            if repeated.size == 0:
+                break
+            offsets[repeated] = rng.integers(1, num_particles, size=(repeated.size, k))
+    index = np.arange(num_particles)
+    return np.column_stack([index, (index[:, None] + offsets) % num_particles])
+
+
+def make_topology(topology, num_particles, rng=None):
+    # None / 'global': gBest; 'ring', 'von_neumann', 'random', 'dynamic' ya da hazır bir Topology nesnesi
+    # rng: rastgele kurulan topolojilerin ('random', 'dynamic') akışı ya da seed'i
+    if topology is None or topology == 'global':
+        return None
+    if isinstance(topology, Topology):
+        return topology
+    if topology == 'ring':
+        return Topology(ring_neighbors(num_particles))
+    if topology == 'von_neumann':
+        return Topology(von_neumann_neighbors(num_particles))
+    if topology == 'random':
+        return Topology(random_neighbors(num_particles, rng=rng))
+    if topology == 'dynamic':
+        return DynamicTopology(num_particles, rng=rng)
+    raise ValueError(f"Geçersiz topoloji: {topology!r}")
+
+
+def make_batch_topology(topology, num_particles, rngs):
+    # rngs: koşuların topoloji akışları. Akıştan bağımsız komşuluklar ('ring', 'von_neumann', sabit bir Topology)
+    # tüm koşularda tek bir (N, K) dizisiyle paylaşılır ve (R, N, K) üzerinde tek gather + argmin ile bulunur;
+    # 'random' / 'dynamic' ve diğer Topology alt sınıfları koşu başına ayrı kurulur (ya da kopyalanır)
+    if topology is None or topology == 'global':
+        return None
+    if isinstance(topology, Topology):
+        if type(topology) is Topology:
+            return Topology(topology.neighbors)
+        return BatchTopology(copy.deepcopy(topology) for _ in rngs)
+    if topology in ('ring', 'von_neumann'):
+        return make_topology(topology, num_particles)
+    return BatchTopology(make_topology(topology, num_particles, rng=rng) for rng in rngs)
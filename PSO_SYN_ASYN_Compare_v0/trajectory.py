@@ -0,0 +1,113 @@
+import json
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from render_pipeline import SwarmSnapshot
+
+_META_FILE = "meta.json"
+
+
+class TrajectoryRecorder:
+    """Sürü geçmişini iterasyon iterasyon diske yazan kayıtçı.
+
+    path bir klasördür; her dizi ayrı bir .npy dosyasında bellek eşlemeli (memmap)
+    tutulur, böylece kayıt ne kadar büyük olursa olsun RAM'de birikmez:
+        positions, velocities, best_positions (T, N, D)  float32
+        best_scores (T, N)                              float32
+        gbest_positions (T, D)                          float32
+        params (T, 4): w, c1, c2, gbest_score           float64
+    meta.json fonksiyon adını, bounds'u ve kaydedilen iterasyon sayısını içerir;
+    meta içindeki ek alanlar (ör. options) olduğu gibi saklanır.
+    resume=True ise mevcut dosyalar silinmeden açılır (checkpoint'ten devam);
+    count'u checkpoint anındaki değere geri almak çağıranın işidir.
+    """
+
+    def __init__(self, path, num_particles, dimensions, max_iter, resume=False, **meta):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.meta = dict(meta, num_particles=num_particles, dimensions=dimensions, max_iter=max_iter)
+        self.count = 0
+        self._mode = "r+" if resume and os.path.exists(os.path.join(path, _META_FILE)) else "w+"
+
+        swarm_shape = (max_iter, num_particles, dimensions)
+        self.positions = self._open("positions", swarm_shape)
+        self.velocities = self._open("velocities", swarm_shape)
+        self.best_positions = self._open("best_positions", swarm_shape)
+        self.best_scores = self._open("best_scores", (max_iter, num_particles))
+        self.gbest_positions = self._open("gbest_positions", (max_iter, dimensions))
+        self.params = self._open("params", (max_iter, 4), dtype=np.float64)
+
+    def _open(self, name, shape, dtype=np.float32):
+        if self._mode == "r+":
+            return open_memmap(os.path.join(self.path, f"{name}.npy"), mode="r+")
+        return open_memmap(os.path.join(self.path, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record(self, swarm, w, c1, c2):
+        i = self.count
+        self.positions[i] = swarm.positions
+        self.velocities[i] = swarm.velocities
+        self.best_positions[i] = swarm.best_positions
+        self.best_scores[i] = swarm.best_scores
+        self.gbest_positions[i] = swarm.gbest_position
+        self.params[i] = (w, c1, c2, swarm.gbest_score)
+        self.count += 1
+
+    def flush(self):
+        # Diziler ve meta.json diske aktarılır; checkpoint öncesi ve close() içinde çağrılır
+        for name in ("positions", "velocities", "best_positions", "best_scores", "gbest_positions", "params"):
+            getattr(self, name).flush()
+
+        # Kayıt yarıda kesilse bile meta.json ya eski ya yeni haliyle bulunur
+        meta_path = os.path.join(self.path, _META_FILE)
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(dict(self.meta, iterations=self.count), f, indent=2)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def close(self):
+        if self.positions is None:
+            return
+        self.flush()
+        for name in ("positions", "velocities", "best_positions", "best_scores", "gbest_positions", "params"):
+            setattr(self, name, None)
+
+
+class Trajectory:
+    # Kaydedilmiş bir sürü geçmişini salt okunur memmap olarak açar; kareler istendikçe diskten okunur
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, _META_FILE), encoding="utf-8") as f:
+            self.meta = json.load(f)
+
+        count = self.meta["iterations"]
+        self.positions = self._load("positions")[:count]
+        self.velocities = self._load("velocities")[:count]
+        self.best_positions = self._load("best_positions")[:count]
+        self.best_scores = self._load("best_scores")[:count]
+        self.gbest_positions = self._load("gbest_positions")[:count]
+        self.params = self._load("params")[:count]
+
+    def _load(self, name):
+        return np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+
+    def __len__(self):
+        return len(self.params)
+
+    def snapshot(self, index):
+        w, c1, c2, gbest_score = self.params[index]
+        return SwarmSnapshot(index + 1, np.array(self.positions[index], dtype=float),
+                             np.array(self.gbest_positions[index], dtype=float), float(gbest_score),
+                             float(w), float(c1), float(c2), **self.meta.get("options", {}))
+
+    def snapshots(self, every=1):
+        # Her every iterasyonda bir anlık görüntü; son iterasyon her zaman dahil
+        for index in range(len(self)):
+            if index % every == 0 or index == len(self) - 1:
+                yield self.snapshot(index)
@@ -0,0 +1,175 @@
+import struct
+from io import BytesIO
+
+import numpy as np
+
+# PIL ilk kare kodlanırken yüklenir; headless koşular ve çizim yapmayan araçlar yüklemez
+
+# Değişmeyen pikseller için ayrılan saydam palet indeksi
+_TRANSPARENT_INDEX = 255
+
+
+class GifStreamWriter:
+    # Kareleri bellekte biriktirmeden, üretildikleri anda diske yazan GIF yazıcısı.
+    # Her kare PIL ile tek karelik GIF olarak kodlanır, paleti yerel renk tablosuna
+    # taşınarak dosyanın sonuna eklenir; bellekte yalnızca bir önceki kare tutulur.
+    def __init__(self, output_path, duration=200, loop=0):
+        self.output_path = output_path
+        self.duration = duration
+        self.loop = loop
+        self.frame_count = 0
+        self._file = None
+        self._previous = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, frame):
+        from PIL import Image
+
+        pixels = np.asarray(frame.convert("RGB"))
+
+        # Önceki kareden yalnızca değişen bölge kodlanır; bölge içindeki değişmeyen
+        # pikseller saydam yapılır (disposal=1 sayesinde önceki kare ekranda kalır)
+        changed = None
+        box = (0, 0, pixels.shape[1], pixels.shape[0])
+        if self._previous is not None and self._previous.shape == pixels.shape:
+            changed = np.any(pixels != self._previous, axis=2)
+            rows, cols = np.any(changed, axis=1), np.any(changed, axis=0)
+            if rows.any():
+                top, bottom = np.argmax(rows), len(rows) - np.argmax(rows[::-1])
+                left, right = np.argmax(cols), len(cols) - np.argmax(cols[::-1])
+                box = (int(left), int(top), int(right), int(bottom))
+            else:
+                box = (0, 0, 1, 1)
+        self._previous = pixels
+
+        crop = Image.fromarray(pixels[box[1]:box[3], box[0]:box[2]])
+        if changed is None:
+            single_frame = crop
+            save_args = {}
+        else:
+            single_frame = crop.quantize(colors=_TRANSPARENT_INDEX)
+            indices = np.array(single_frame)
+            indices[~changed[box[1]:box[3], box[0]:box[2]]] = _TRANSPARENT_INDEX
+            palette = single_frame.getpalette()[:3 * _TRANSPARENT_INDEX]
+            single_frame = Image.fromarray(indices, "P")
+            single_frame.putpalette(palette + [0] * (3 * 256 - len(palette)))
+            save_args = {"transparency": _TRANSPARENT_INDEX}
+
+        buf = BytesIO()
+        single_frame.save(buf, format="GIF", interlace=False, **save_args)
+        color_table, color_table_size, interlace, transparency, image_data = _split_single_frame_gif(buf.getvalue())
+
+        if self._file is None:
+            self._file = open(self.output_path, "wb")
+            self._write_header(pixels.shape[1], pixels.shape[0])
+
+        # Graphic Control Extension: kare süresi (1/100 sn), disposal=1 (üzerine çiz), saydamlık
+        flags = (1 << 2) | (1 if transparency is not None else 0)
+        self._file.write(struct.pack("<4BHBB", 0x21, 0xF9, 4, flags, int(round(self.duration / 10)),
+                                     transparency or 0, 0))
+        # Image Descriptor + yerel renk tablosu
+        self._file.write(struct.pack("<B4HB", 0x2C, box[0], box[1], box[2] - box[0], box[3] - box[1],
+                                     0x80 | interlace | color_table_size))
+        self._file.write(color_table)
+        self._file.write(image_data)
+        self._file.flush()
+        self.frame_count += 1
+
+    def state_dict(self):
+        # Checkpoint için: yazılan bayt sayısı (kapanış baytı hariç), kare sayısı ve fark kodlamasının
+        # karşılaştırdığı son kare; devam eden koşu aynı baytları üretir
+        previous = self._previous if self._previous is not None else np.zeros((0, 0, 3), dtype=np.uint8)
+        return {"offset": self._file.tell() if self._file is not None else 0, "frame_count": self.frame_count,
+                "previous": previous}
+
+    def load_state_dict(self, state):
+        # Checkpoint'ten devam: dosya checkpoint anındaki uzunluğuna kesilir, yeni kareler arkasına eklenir
+        offset = int(state["offset"])
+        if not offset:
+            return
+        self._file = open(self.output_path, "r+b")
+        self._file.truncate(offset)
+        self._file.seek(offset)
+        self.frame_count = int(state["frame_count"])
+        self._previous = state["previous"] if state["previous"].size else None
+
+    def close(self):
+        if self._file is not None:
+            self._file.write(b"\x3B")
+            self._file.close()
+            self._file = None
+        self._previous = None
+
+    def _write_header(self, width, height):
+        self._file.write(b"GIF89a")
+        # Logical Screen Descriptor (global renk tablosu yok)
+        self._file.write(struct.pack("<2H3B", width, height, 0, 0, 0))
+        # NETSCAPE2.0 döngü uzantısı
+        self._file.write(b"\x21\xFF\x0BNETSCAPE2.0" + struct.pack("<2BHB", 3, 1, self.loop, 0))
+
+
+def _skip_sub_blocks(data, pos):
+    while data[pos] != 0:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+def _split_single_frame_gif(data):
+    # Tek karelik GIF'ten renk tablosunu, saydam indeksi ve LZW görüntü verisini ayıkla
+    flags = data[10]
+    pos = 13
+    color_table = b""
+    color_table_size = 0
+    transparency = None
+    if flags & 0x80:
+        color_table_size = flags & 0x07
+        length = 3 * (2 ** (color_table_size + 1))
+        color_table = data[pos:pos + length]
+        pos += length
+
+    while pos < len(data):
+        block = data[pos]
+        if block == 0x21:
+            if data[pos + 1] == 0xF9 and data[pos + 3] & 0x01:
+                transparency = data[pos + 6]
+            pos = _skip_sub_blocks(data, pos + 2)
+        elif block == 0x2C:
+            packed = data[pos + 9]
+            interlace = packed & 0x40
+            pos += 10
+            if packed & 0x80:
+                color_table_size = packed & 0x07
+                length = 3 * (2 ** (color_table_size + 1))
+                color_table = data[pos:pos + length]
+                pos += length
+            end = _skip_sub_blocks(data, pos + 1)
+            return color_table, color_table_size, interlace, transparency, data[pos:end]
+        else:
+            break
+    raise ValueError("GIF verisinde görüntü bloğu bulunamadı")
+
+
+def read_gif_frames(path):
+    # GIF karelerini tek tek (tamamını belleğe almadan) RGBA olarak döndür
+    from PIL import Image, ImageSequence
+
+    with Image.open(path) as gif:
+        for frame in ImageSequence.Iterator(gif):
+            yield frame.convert("RGBA")
+
+
+def combine_frames(frames, columns):
+    # Aynı boyuttaki kareleri satır satır (columns sütunlu) tek bir kareye yerleştir
+    from PIL import Image
+
+    width, height = frames[0].width, frames[0].height
+    rows = (len(frames) + columns - 1) // columns
+    combined_frame = Image.new('RGBA', (width * min(columns, len(frames)), height * rows))
+    for i, frame in enumerate(frames):
+        combined_frame.paste(frame, ((i % columns) * width, (i // columns) * height))
+    return combined_frame
@@ -0,0 +1,141 @@
+import os
+import time
+
+import numpy as np
+
+from seeding import generator_state, set_generator_state
+
+
+class Checkpointer:
+    """optimize() döngüsünün tam durumunu periyodik olarak tek bir .npz dosyasına yazar.
+
+    Dosyada yalnızca düz NumPy dizileri bulunur (pickle yok): sürü dizileri
+    (konum, hız, pbest, gBest), iterasyon, RNG akışlarının durumu, topoloji,
+    durdurma kriteri sayaçları, değerlendirme sayısı ile GIF ve trajectory
+    kayıtlarının checkpoint anındaki uzunlukları. Yazma önce geçici dosyaya
+    yapılıp yer değiştirilir; süreç yazma sırasında ölse de dosya ya eski ya
+    yeni haliyle bulunur. Fitness önbelleği yalnızca path'i verildiyse
+    checkpoint ile birlikte kaydedilir; aksi halde devam eden koşu önbellekte
+    olan konumları yeniden değerlendirir (sonuç aynı, evaluations farklı olur).
+
+    interval: İki checkpoint arasındaki en az süre (saniye).
+    every: Verilirse süre yerine her every iterasyonda bir yazılır.
+    """
+
+    def __init__(self, path, interval=5.0, every=None):
+        self.path = path
+        self.interval = interval
+        self.every = every
+        self.saves = 0
+        self._last = time.perf_counter()
+
+    def start(self):
+        self._last = time.perf_counter()
+
+    def due(self, iteration):
+        if self.every is not None:
+            return iteration % self.every == 0
+        return time.perf_counter() - self._last >= self.interval
+
+    def save(self, state):
+        save_checkpoint(self.path, state)
+        self._last = time.perf_counter()
+        self.saves += 1
+
+
+def make_checkpointer(checkpoint):
+    # None: kapalı; dosya yolu; Checkpointer argümanları (dict) ya da Checkpointer nesnesi
+    if checkpoint is None:
+        return None
+    if isinstance(checkpoint, Checkpointer):
+        return checkpoint
+    if isinstance(checkpoint, dict):
+        return Checkpointer(**checkpoint)
+    if isinstance(checkpoint, str):
+        return Checkpointer(checkpoint)
+    raise ValueError(f"Geçersiz checkpoint değeri: {checkpoint!r}")
+
+
+def save_checkpoint(path, state):
+    # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazıp yer değiştir
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **state)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with np.load(path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+
+def capture_state(pso, iteration, method, writers=(), recorder=None):
+    # iteration. iterasyonun sonundaki durum; render hattı varsa önce boşaltılmış (drain) olmalı
+    if recorder is not None:
+        recorder.flush()
+    pso.evaluator.flush()
+    swarm = pso.swarm
+    state = {
+        "method": method, "iteration": iteration, "function": pso.func.__name__,
+        "positions": swarm.positions, "velocities": swarm.velocities, "best_positions": swarm.best_positions,
+        "best_scores": swarm.best_scores, "gbest_position": swarm.gbest_position, "gbest_score": swarm.gbest_score,
+        "rng_swarm": generator_state(swarm.rng), "rng_noise": generator_state(pso.rngs["noise"]),
+        "evaluations": pso.evaluator.evaluations, "evaluation_seconds": pso.evaluator.seconds,
+        "recorded": recorder.count if recorder is not None else 0,
+    }
+    state.update(run_settings(pso))
+    state.update(pso.stop_criteria.state_dict())
+    for i, writer in enumerate(writers):
+        if writer is not None:
+            state.update({f"gif{i}_{name}": value for name, value in writer.state_dict().items()})
+    if pso.topology is not None:
+        state.update(pso.topology.state_dict())
+    return state
+
+
+def run_settings(pso):
+    # Devam eden koşunun checkpoint'i yazan koşuyla aynı kurulduğunu doğrulamak için saklanan ayarlar.
+    # w / c1 / c2 takvimleri doğrusal olduğundan ilk ve son iterasyondaki değerleri takvimi belirler.
+    topology = pso.topology
+    return {
+        "setting_max_iter": np.array(pso.max_iter),
+        "setting_bounds": np.asarray(pso.bounds, dtype=float),
+        "setting_velocity_rate": np.array(np.nan if pso.velocity_rate is None else pso.velocity_rate, dtype=float),
+        "setting_schedule": np.array([pso.coefficients(0), pso.coefficients(pso.max_iter)], dtype=float),
+        "setting_topology": "global" if topology is None else f"{type(topology).__name__}{topology.neighbors.shape}",
+    }
+
+
+def restore_state(pso, state, writers=(), recorder=None):
+    # capture_state'in tersi; kalınan iterasyonu döndürür. PSO aynı ayarlarla kurulmuş olmalıdır.
+    swarm = pso.swarm
+    if str(state["function"]) != pso.func.__name__ or state["positions"].shape != swarm.positions.shape:
+        raise ValueError(f"Checkpoint bu PSO ayarlarıyla uyuşmuyor: {state['function']}, "
+                         f"{state['positions'].shape} != {pso.func.__name__}, {swarm.positions.shape}")
+    for name, value in run_settings(pso).items():
+        saved = state.get(name)
+        same = str(saved) == value if isinstance(value, str) else (
+            saved is not None and np.array_equal(saved, value, equal_nan=True))
+        if not same:
+            raise ValueError(f"Checkpoint bu PSO ayarlarıyla uyuşmuyor: {name[8:]} "
+                             f"{np.asarray(saved).tolist()} != {np.asarray(value).tolist()}")
+
+    for name in ("positions", "velocities", "best_positions", "best_scores", "gbest_position"):
+        getattr(swarm, name)[...] = state[name]
+    swarm.gbest_score = float(state["gbest_score"])
+    set_generator_state(swarm.rng, state["rng_swarm"])
+    if "rng_noise" in state:
+        set_generator_state(pso.rngs["noise"], state["rng_noise"])
+    pso.evaluator.restore_counters(int(state["evaluations"]), float(state["evaluation_seconds"]))
+    pso.stop_criteria.load_state_dict(state)
+    if pso.topology is not None:
+        pso.topology.load_state_dict(state)
+
+    # Checkpoint'ten sonra yazılmış (tekrar üretilecek) kareler ve kayıtlar atılır
+    for i, writer in enumerate(writers):
+        if writer is not None and f"gif{i}_offset" in state:
+            writer.load_state_dict({name: state[f"gif{i}_{name}"] for name in ("offset", "frame_count", "previous")})
+    if recorder is not None:
+        recorder.count = int(state["recorded"])
+    return int(state["iteration"])
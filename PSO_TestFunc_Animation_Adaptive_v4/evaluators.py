@@ -0,0 +1,250 @@
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from fitness_cache import FitnessCache
+
+
+class Evaluator:
+    """Sürünün (N, D) konumlarını skorlara çeviren değerlendirici.
+
+    Alt sınıflar yalnızca _evaluate() metodunu tanımlar; değerlendirme sayısı
+    (evaluations), çağrı sayısı (calls) ve toplam süre (seconds) burada tutulur.
+    Havuz kullanan değerlendiriciler havuzu ilk çağrıda kurar, close() ile kapatır.
+    """
+
+    def __init__(self, func, workers=None):
+        self.func = func
+        self.workers = workers
+        self.evaluations = 0
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __call__(self, positions):
+        start = time.perf_counter()
+        scores = np.asarray(self._evaluate(positions), dtype=float)
+        self.seconds += time.perf_counter() - start
+        self.evaluations += scores.size
+        self.calls += 1
+        return scores
+
+    def evaluate_one(self, position):
+        # Asenkron güncellemede tek parçacığın değerlendirilmesi
+        start = time.perf_counter()
+        score = self.func(position)
+        self.seconds += time.perf_counter() - start
+        self.evaluations += 1
+        self.calls += 1
+        return score
+
+    def _evaluate(self, positions):
+        raise NotImplementedError
+
+    def lookup(self, position):
+        # Konumları havuza kendisi gönderen steady-state PSO için: (önbellekteki skor ya da None, anahtar)
+        return None, None
+
+    def record(self, key, score):
+        # Havuzda yapılmış tek bir değerlendirmenin sayaçlara (ve varsa önbelleğe) işlenmesi; key lookup()'tan gelir
+        self.evaluations += 1
+        self.calls += 1
+
+    def restore_counters(self, evaluations, seconds):
+        # Checkpoint'ten devam ederken sayaçlar kaldığı yerden sürer
+        self.evaluations = evaluations
+        self.seconds = seconds
+
+    def flush(self):
+        # Checkpoint öncesi çağrılır; diske yazılacak bir durumu olan değerlendiriciler için
+        pass
+
+    def close(self):
+        pass
+
+
+class VectorizedEvaluator(Evaluator):
+    # Tüm sürü tek bir func((N, D)) çağrısıyla değerlendirilir (functions.py fonksiyonları)
+    def _evaluate(self, positions):
+        return self.func(positions)
+
+
+class NumbaEvaluator(Evaluator):
+    # functions.py fonksiyonları kernels.py'deki derlenmiş, parçacıklar üzerinde paralel karşılıklarıyla
+    # değerlendirilir; kernel'i olmayan fonksiyonlarda ya da Numba kurulu değilse func((N, D)) kullanılır
+    def __init__(self, func, workers=None):
+        super().__init__(func, workers)
+        self._kernel = None
+
+    def _evaluate(self, positions):
+        if self._kernel is None:
+            import kernels
+            self._kernel = kernels.compile_objective(self.func)
+        return self._kernel(positions)
+
+
+class SerialEvaluator(Evaluator):
+    # Vektörel olmayan fonksiyonlar için parçacık parçacık değerlendirme
+    def _evaluate(self, positions):
+        return [self.func(position) for position in positions]
+
+
+class ThreadPoolEvaluator(Evaluator):
+    # GIL'i bırakan işler (NumPy, XGBoost, Keras...) için iş parçacığı havuzu
+    def __init__(self, func, workers=None):
+        super().__init__(func, workers)
+        self._executor = None
+
+    def _evaluate(self, positions):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return list(self._executor.map(self.func, positions))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ProcessPoolEvaluator(Evaluator):
+    # Saf Python hedef fonksiyonları için süreç havuzu; func pickle edilebilir olmalıdır
+    def __init__(self, func, workers=None):
+        super().__init__(func, workers)
+        self._pool = None
+
+    def _evaluate(self, positions):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers)
+        workers = self.workers or multiprocessing.cpu_count()
+        chunksize = max(1, len(positions) // (4 * workers))
+        seeds = task_seeds(self.func, len(positions))
+        tasks = [(self.func, positions[start:start + chunksize], seeds[start:start + chunksize])
+                 for start in range(0, len(positions), chunksize)]
+        return [score for scores in self._pool.map(evaluate_positions, tasks) for score in scores]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+def task_seeds(func, count):
+    """Süreç havuzuna gönderilen count konumun gürültü tohumları.
+
+    Gürültülü fonksiyonların (koşunun akışına bağlı seeding.NoisyObjective)
+    akışı işçilere pickle ile aynen kopyalanır; işçi başına tohumlansa bile hangi konumun hangi işçiye
+    düştüğü belirsizdir. Bu yüzden tohumlar konum başına, ana süreçteki
+    koşu akışından gönderim sırasıyla toplu çekilir ve konumla birlikte
+    gönderilir: sonuç işçi sayısından ve zamanlamadan bağımsızdır.
+    Gürültüsüz fonksiyonlar için None listesi döner.
+    """
+    rng = getattr(func, 'rng', None)
+    if rng is None:
+        return [None] * count
+    return rng.integers(2 ** 63, size=count).tolist()
+
+
+def evaluate_positions(task):
+    # İşçide çalışır: (func, konumlar, tohumlar); her konum kendi tohumundan kurulan gürültü akışıyla değerlendirilir
+    func, positions, seeds = task
+    scores = []
+    for position, seed in zip(positions, seeds):
+        scores.append(func(position) if seed is None else func.reseeded(seed)(position))
+    return scores
+
+
+class CachedEvaluator(Evaluator):
+    # Başka bir değerlendiricinin önüne konan önbellek katmanı: yalnızca önbellekte olmayan
+    # konumlar (aynı çağrıdaki tekrarlar bir kez) asıl değerlendiriciye toplu olarak gönderilir.
+    # evaluations / seconds asıl değerlendirmeleri, cache.hits / cache.misses önbelleği sayar.
+    def __init__(self, evaluator, cache):
+        super().__init__(evaluator.func, evaluator.workers)
+        self.evaluator = evaluator
+        self.cache = cache
+
+    def __call__(self, positions):
+        self.calls += 1
+        keys = [self.cache.make_key(position) for position in positions]
+        scores = np.empty(len(keys))
+        missing = {}
+        for i, key in enumerate(keys):
+            score = self.cache.get(key)
+            if score is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                scores[i] = score
+
+        if missing:
+            first = [indices[0] for indices in missing.values()]
+            for (key, indices), score in zip(missing.items(), self.evaluator(np.asarray(positions)[first])):
+                self.cache.put(key, score)
+                scores[indices] = score
+        self._sync_counters()
+        return scores
+
+    def evaluate_one(self, position):
+        self.calls += 1
+        key = self.cache.make_key(position)
+        score = self.cache.get(key)
+        if score is None:
+            score = self.evaluator.evaluate_one(position)
+            self.cache.put(key, score)
+            self._sync_counters()
+        return score
+
+    def lookup(self, position):
+        self.calls += 1
+        key = self.cache.make_key(position)
+        return self.cache.get(key), key
+
+    def record(self, key, score):
+        self.cache.put(key, score)
+        self.evaluator.record(key, score)
+        self._sync_counters()
+
+    def _sync_counters(self):
+        self.evaluations = self.evaluator.evaluations
+        self.seconds = self.evaluator.seconds
+
+    def restore_counters(self, evaluations, seconds):
+        self.evaluator.restore_counters(evaluations, seconds)
+        self._sync_counters()
+
+    def flush(self):
+        # Önbellek path'i verildiyse checkpoint ile birlikte diske yazılır (devam eden koşu aynı skorları görür)
+        self.cache.save()
+
+    def close(self):
+        self.evaluator.close()
+        self.cache.save()
+
+
+EVALUATORS = {
+    'vectorized': VectorizedEvaluator,
+    'numba': NumbaEvaluator,
+    'serial': SerialEvaluator,
+    'thread': ThreadPoolEvaluator,
+    'process': ProcessPoolEvaluator,
+}
+
+
+def make_evaluator(func, evaluator='vectorized', workers=None, cache=None):
+    # evaluator: EVALUATORS içindeki bir isim ya da hazır bir Evaluator nesnesi
+    # cache: FitnessCache nesnesi ya da anahtar türü ('exact', 'quantized', 'mask'); verilirse önbellek eklenir
+    if not isinstance(evaluator, Evaluator):
+        if evaluator not in EVALUATORS:
+            raise ValueError(f"Geçersiz evaluator: {evaluator!r}, seçenekler: {', '.join(EVALUATORS)}")
+        evaluator = EVALUATORS[evaluator](func, workers)
+    if cache is not None:
+        if isinstance(cache, str):
+            cache = FitnessCache(key=cache)
+        evaluator = CachedEvaluator(evaluator, cache)
+    return evaluator
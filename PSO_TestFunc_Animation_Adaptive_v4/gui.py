@@ -1,19 +1,24 @@
+import os
 import sys
 
 from PyQt5.QtCore import QProcess, Qt
 from PyQt5.QtGui import QPixmap, QImage, QMovie
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QComboBox, QSpinBox, \
-    QDoubleSpinBox, QHBoxLayout, QMessageBox, QSizePolicy, QGroupBox, QFormLayout, QTextEdit
+    QDoubleSpinBox, QHBoxLayout, QMessageBox, QSizePolicy, QGroupBox, QFormLayout, QTextEdit, QProgressBar
 # from functions import rastrigin, ackley, sphere, rosenbrock, bounds_dict
-from pso import PSO
 from functions import *
-from pso_thread import PSOThread
+from preview import PreviewCache
+from pso_thread import PreviewThread, PSOThread
 
 class PSOApp(QWidget):
     def __init__(self):
         super().__init__()
+        # Fonksiyon önizlemeleri: bellekte LRU, diskte .landscape_cache altında PNG
+        self.preview_cache = PreviewCache(cache_dir='.landscape_cache')
+        self.preview_threads = []
         self.initUI()
         self.animation_path = 'combined_animation.gif'
+        self.checkpoint_path = 'pso_checkpoint.npz'  # Koşular birkaç saniyede bir (ve durdurulunca) buraya kaydedilir
 
     def initUI(self):
         main_layout = QVBoxLayout()
@@ -41,6 +46,7 @@ class PSOApp(QWidget):
         for name, func in function_dict.items():
             self.functionBox.addItem(name, func)  # Hem isim hem de fonksiyon nesnesini ekleyin
 
+        self.functionBox.currentIndexChanged.connect(self.requestPreview)
         function_layout.addRow("Fonksiyon Seç:", self.functionBox)
         function_group.setLayout(function_layout)
         main_layout.addWidget(function_group)
@@ -155,6 +161,12 @@ class PSOApp(QWidget):
         self.commandOutput.setStyleSheet("background-color: #2b2b2b; color: white;")
         main_layout.addWidget(self.commandOutput)
 
+        # İlerleme çubuğu: iş parçacığından gelen yapılandırılmış ilerleme olaylarıyla güncellenir
+        self.progressBar = QProgressBar()
+        self.progressBar.setFormat("Iter %v/%m")
+        self.progressBar.setValue(0)
+        main_layout.addWidget(self.progressBar)
+
         # Kontrol Butonları Grubu
         button_group = QGroupBox("Kontrol")
         button_layout = QHBoxLayout()
@@ -177,6 +189,24 @@ class PSOApp(QWidget):
         self.startButton.clicked.connect(self.showAnimation)
         button_layout.addWidget(self.startButton)
 
+        self.pauseButton = QPushButton("PSO Pause")
+        self.pauseButton.setFixedSize(90, 50)
+        self.pauseButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.pauseButton.clicked.connect(self.togglePause)
+        button_layout.addWidget(self.pauseButton)
+
+        self.stopButton = QPushButton("PSO Stop")
+        self.stopButton.setFixedSize(90, 50)
+        self.stopButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.stopButton.clicked.connect(self.stopPSO)
+        button_layout.addWidget(self.stopButton)
+
+        self.resumeButton = QPushButton("Resume from\ncheckpoint")
+        self.resumeButton.setFixedSize(90, 50)
+        self.resumeButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.resumeButton.clicked.connect(self.resumePSO)
+        button_layout.addWidget(self.resumeButton)
+
         self.restartButton = QPushButton("PSO Restart")
         self.restartButton.setFixedSize(90, 50)  # Genişlik: 150, Yükseklik: 100
         self.restartButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -221,41 +251,51 @@ class PSOApp(QWidget):
             print(f"Selected Function: {func.__name__ if func else 'None'}")
             print(f"Bounds: {bounds}")
 
-            dimensions = 2
-            num_particles = self.particleSpinBox.value()
-            max_iter = self.iterationSpinBox.value()
-            w_max = self.wMaxSpinBox.value()
-            w_min = self.wMinSpinBox.value()
-            c1_init = self.c1InitSpinBox.value()
-            c1_final = self.c1FinalSpinBox.value()
-            c2_init = self.c2InitSpinBox.value()
-            c2_final = self.c2FinalSpinBox.value()
-
-            print(
-                f"Parameters -> Particles: {num_particles}, Iterations: {max_iter}, w_max: {w_max}, w_min: {w_min}, c1: {c1_init}-{c1_final}, c2: {c2_init}-{c2_final}")
-
-            self.pso = PSO(func, dimensions, bounds, num_particles, max_iter, w_max, w_min, c1_init, c1_final, c2_init,
-                           c2_final)
-
-            # Başlangıç durumunu çiz
-            self.pso.initialize_plot(show_particles=False)
-            combined_frames = self.pso.combine_gifs()
-
-            # Görsel güncellenmesi
-            if combined_frames:
-                self.update_image(combined_frames[0])
-            else:
-                self.show_message("PSO Animation error: No frames generated.")
-                print("No frames were generated during PSO Animation.")
+            # Önizleme daha önce hazırlandıysa hemen, yoksa arka planda çizilip gelince gösterilir
+            self.requestPreview()
         except Exception as e:
             self.show_message(f"PSO Animation error: {e}")
             print(f"Error in showOptimumOnly: {e}")
 
+    def requestPreview(self):
+        func, bounds = self.get_selected_function_and_bounds()
+        image = self.preview_cache.get(func, bounds)
+        if image is not None:
+            self.show_preview((func, bounds), image)
+            return
+        if any(thread.func is func and thread.bounds == bounds for thread in self.preview_threads):
+            return
+
+        thread = PreviewThread(self.preview_cache, func, bounds)
+        thread.ready_signal.connect(self.show_preview)
+        thread.finished.connect(lambda: self.preview_threads.remove(thread))
+        thread.finished.connect(thread.deleteLater)
+        self.preview_threads.append(thread)
+        thread.start()
+
+    def show_preview(self, key, image):
+        # Bu arada başka fonksiyon seçildiyse ya da koşu canlı kare gösteriyorsa önizleme gösterilmez
+        if key != self.get_selected_function_and_bounds():
+            return
+        if hasattr(self, 'pso_thread') and self.pso_thread.isRunning():
+            return
+        self.update_image(image)
+
     def runPSOInitialization(self):
+        self.startPSOThread(resume=False)
+
+    def resumePSO(self):
+        # Son checkpoint'ten devam; parametreler checkpoint alınan koşununkilerle aynı olmalıdır
+        if not os.path.exists(self.checkpoint_path):
+            self.show_message(f"Checkpoint bulunamadı: {self.checkpoint_path}")
+            return
+        self.startPSOThread(resume=True)
+
+    def startPSOThread(self, resume):
         try:
             # Eğer önceki bir iş parçacığı varsa durdur ve temizle
             if hasattr(self, 'pso_thread') and self.pso_thread.isRunning():
-                self.pso_thread.quit()
+                self.pso_thread.cancel()  # Döngü bir sonraki iterasyonun başında durur
                 self.pso_thread.wait()
                 self.pso_thread.deleteLater()
                 del self.pso_thread
@@ -275,13 +315,19 @@ class PSOApp(QWidget):
             # PSOThread iş parçacığını başlat
             self.pso_thread = PSOThread(
                 func, dimensions, bounds, num_particles, max_iter,
-                w_max, w_min, c1_init, c1_final, c2_init, c2_final
+                w_max, w_min, c1_init, c1_final, c2_init, c2_final,
+                checkpoint_path=self.checkpoint_path, resume=resume
             )
 
             # İş parçacığından gelen sinyalleri bağlayın
             self.pso_thread.update_signal.connect(self.show_message)
+            self.pso_thread.progress_signal.connect(self.show_progress)
             self.pso_thread.finished_signal.connect(self.show_message)
             self.pso_thread.finished_signal.connect(self.update_final_image)
+            self.pso_thread.frame_signal.connect(self.show_latest_frame)
+            self.pauseButton.setText("PSO Pause")
+            self.progressBar.setRange(0, max_iter)
+            self.progressBar.setValue(0)
 
             # İş parçacığını başlat
             self.pso_thread.start()
@@ -290,11 +336,46 @@ class PSOApp(QWidget):
             self.show_message(f"PSO Init error: {e}")
             print(f"PSO Init error: {e}")
 
+    def show_progress(self, event):
+        # progress.ProgressEvent: çubuk iterasyonu gösterir, komut ekranına olayın tek satırlık özeti yazılır
+        self.progressBar.setMaximum(event.max_iter)
+        self.progressBar.setValue(event.iteration)
+        self.show_message(event.format('.4e'))
+
+    def show_latest_frame(self):
+        # Koşu sırasında üretilen en yeni kare; arada kalan kareler iş parçacığında atlanmıştır
+        if hasattr(self, 'pso_thread'):
+            frame = self.pso_thread.take_frame()
+            if frame is not None:
+                self.update_image(frame)
+
+    def togglePause(self):
+        if not hasattr(self, 'pso_thread') or not self.pso_thread.isRunning():
+            return
+        if self.pso_thread.control.paused:
+            self.pso_thread.resume()
+            self.pauseButton.setText("PSO Pause")
+        else:
+            self.pso_thread.pause()
+            self.pauseButton.setText("PSO Resume")
+
+    def stopPSO(self):
+        # İptal edilen koşunun o ana kadarki kareleri GIF'e yazılmış olarak kalır
+        if hasattr(self, 'pso_thread') and self.pso_thread.isRunning():
+            self.pso_thread.cancel()
+            self.pauseButton.setText("PSO Pause")
+
     def update_final_image(self):
         """Optimizasyon tamamlandığında animasyonu güncelle."""
-        combined_frames = self.pso_thread.pso.combine_gifs(output_path=self.animation_path)
-        if combined_frames:
-            self.update_image(combined_frames[0])
+        # Kareler koşu sırasında doğrudan GIF'e yazıldı; önizleme için yalnızca ilk kare okunur
+        try:
+            from PIL import Image
+
+            self.animation_path = self.pso_thread.pso.output_path
+            with Image.open(self.animation_path) as gif:
+                self.update_image(gif.convert("RGBA"))
+        except Exception as e:
+            self.show_message(f"Görsel güncellenirken hata: {e}")
 
     def showAnimation(self):
         try:
@@ -312,7 +393,7 @@ class PSOApp(QWidget):
             # Mevcut iş parçacığını durdur ve temizle
             if hasattr(self, 'pso_thread'):
                 if self.pso_thread.isRunning():
-                    self.pso_thread.quit()
+                    self.pso_thread.cancel()
                     self.pso_thread.wait()
                     self.pso_thread.deleteLater()
                 del self.pso_thread
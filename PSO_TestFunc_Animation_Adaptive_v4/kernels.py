@@ -0,0 +1,164 @@
+import numpy as np
+
+import functions
+
+# Numba isteğe bağlıdır; kurulu değilse kernel'ler derlenmez ve çağıranlar NumPy yoluna döner.
+# Bu modül yalnızca backend='numba' istendiğinde içe aktarılır (Numba'nın yüklenmesi yavaştır).
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+_warned = False
+
+
+def available():
+    # Numba yoksa bir kez uyarı basılır
+    global _warned
+    if not NUMBA_AVAILABLE and not _warned:
+        print("Numba kurulu değil, NumPy motoru kullanılıyor")
+        _warned = True
+    return NUMBA_AVAILABLE
+
+
+def _jit(func):
+    if not NUMBA_AVAILABLE:
+        return func
+    return njit(parallel=True, cache=True)(func)
+
+
+@_jit
+def swarm_step(positions, velocities, best_positions, social_target, r1, r2, inertia, c1, c2, max_velocity, low, high):
+    # Hız, hız kırpma, konum ve konum kırpma tek döngüde; tüm diziler (R, N, D) (Swarm için R = 1).
+    # İşlem sırası Swarm.update_velocity / update_position ile aynıdır, sonuçlar NumPy motoruyla birebir örtüşür.
+    runs, particles, dimensions = positions.shape
+    for index in prange(runs * particles):
+        r = index // particles
+        i = index % particles
+        for j in range(dimensions):
+            x = positions[r, i, j]
+            v = velocities[r, i, j] * inertia
+            v += (best_positions[r, i, j] - x) * r1[r, i, j] * c1
+            v += (social_target[r, i, j] - x) * r2[r, i, j] * c2
+            v = min(max(v, -max_velocity), max_velocity)
+            velocities[r, i, j] = v
+            positions[r, i, j] = min(max(x + v, low), high)
+
+
+# functions.py ile aynı tanımlar; x (N, D), parçacıklar üzerinde paralel
+@_jit
+def sphere(x):
+    n, d = x.shape
+    out = np.empty(n)
+    for i in prange(n):
+        total = 0.0
+        for j in range(d):
+            total += x[i, j] * x[i, j]
+        out[i] = total
+    return out
+
+
+@_jit
+def rastrigin(x, A):
+    n, d = x.shape
+    out = np.empty(n)
+    for i in prange(n):
+        total = float(A * d)
+        for j in range(d):
+            total += x[i, j] * x[i, j] - A * np.cos(2 * np.pi * x[i, j])
+        out[i] = total
+    return out
+
+
+@_jit
+def ackley(x):
+    n, d = x.shape
+    out = np.empty(n)
+    for i in prange(n):
+        squares = 0.0
+        cosines = 0.0
+        for j in range(d):
+            squares += x[i, j] * x[i, j]
+            cosines += np.cos(2 * np.pi * x[i, j])
+        out[i] = -20 * np.exp(-0.2 * np.sqrt(squares / d)) - np.exp(cosines / d) + 20 + np.e
+    return out
+
+
+@_jit
+def rosenbrock(x):
+    n, d = x.shape
+    out = np.empty(n)
+    for i in prange(n):
+        total = 0.0
+        for j in range(d - 1):
+            total += 100 * (x[i, j + 1] - x[i, j] ** 2) ** 2 + (1 - x[i, j]) ** 2
+        out[i] = total
+    return out
+
+
+@_jit
+def griewank(x):
+    n, d = x.shape
+    out = np.empty(n)
+    for i in prange(n):
+        total = 0.0
+        product = 1.0
+        for j in range(d):
+            total += x[i, j] * x[i, j] / 4000
+            product *= np.cos(x[i, j] / np.sqrt(j + 1))
+        out[i] = 1 + total - product
+    return out
+
+
+@_jit
+def schwefel(x):
+    n, d = x.shape
+    out = np.empty(n)
+    for i in prange(n):
+        total = 418.98288727 * d
+        for j in range(d):
+            total -= x[i, j] * np.sin(np.sqrt(np.abs(x[i, j])))
+        out[i] = total
+    return out
+
+
+@_jit
+def michalewicz(x):
+    n, d = x.shape
+    out = np.empty(n)
+    for i in prange(n):
+        total = 0.0
+        for j in range(d):
+            total -= np.sin(x[i, j]) * np.sin((j + 1) * x[i, j] ** 2 / np.pi) ** 20
+        out[i] = total
+    return out
+
+
+_OBJECTIVES = {
+    'sphere': sphere,
+    'rastrigin': rastrigin,
+    'ackley': ackley,
+    'rosenbrock': rosenbrock,
+    'griewank': griewank,
+    'schwefel': schwefel,
+    'michalewicz': michalewicz,
+}
+
+
+def compile_objective(func):
+    # functions.py fonksiyonunun derlenmiş karşılığı; kernel'i yoksa ya da Numba kurulu değilse func'ın kendisi.
+    # Fonksiyonun varsayılan argümanları (ör. rastrigin'in A'sı) kernel'e aynen geçirilir.
+    kernel = _OBJECTIVES.get(getattr(func, "__name__", None))
+    if kernel is None or getattr(functions, func.__name__, None) is not func or not available():
+        return func
+    params = func.__defaults__ or ()
+
+    def evaluate(x):
+        x = np.asarray(x, dtype=float)
+        scores = kernel(np.ascontiguousarray(x.reshape(-1, x.shape[-1])), *params)
+        return scores.reshape(x.shape[:-1]) if x.ndim > 1 else scores[0]
+
+    return evaluate
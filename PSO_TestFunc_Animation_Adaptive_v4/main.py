@@ -1,4 +1,5 @@
 from gui import PSOApp
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
 import sys
 import qdarkstyle
@@ -23,4 +24,11 @@ if __name__ == "__main__":
     window = PSOApp()
     #window.show()
     window.showMaximized()  # Uygulamayı tam ekran başlatmak için
+    if "--startup-benchmark" in sys.argv:
+        # startup_benchmark.py için: olay döngüsü ilk boyamayı işledikten sonra işaret basıp çık
+        def report_first_paint():
+            print("first_paint", flush=True)
+            app.quit()
+
+        QTimer.singleShot(0, report_first_paint)
     sys.exit(app.exec_())
@@ -0,0 +1,120 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from animation_writer import combine_frames
+from functions import optimum_position
+from landscape import _function_key, get_landscape
+
+
+class PreviewCache:
+    """GUI fonksiyon seçicisi için yüzey önizlemeleri (contour | 2D, parçacıksız).
+
+    Önizlemeler ilk istendiklerinde çizilir; son max_size tanesi bellekte LRU
+    olarak, tümü cache_dir verildiyse (fonksiyon, bounds, çözünürlük)
+    anahtarıyla PNG olarak diskte tutulur. get() yalnızca bellekteki
+    önizlemeyi döndürür ve GUI iş parçacığında çağrılabilir; load() gerekirse
+    diskten okur ya da çizer, bu yüzden arka plan iş parçacığında çağrılmalıdır.
+    """
+
+    def __init__(self, cache_dir=None, max_size=16, resolution=100):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.resolution = resolution
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, func, bounds):
+        return func, float(bounds[0]), float(bounds[1]), self.resolution
+
+    def get(self, func, bounds):
+        key = self.key(func, bounds)
+        with self._lock:
+            if key not in self._images:
+                return None
+            self._images.move_to_end(key)
+            return self._images[key]
+
+    def load(self, func, bounds):
+        image = self.get(func, bounds)
+        if image is not None:
+            return image
+
+        path = self._path(func, bounds)
+        if path is not None and os.path.exists(path):
+            from PIL import Image
+
+            with Image.open(path) as saved:
+                image = saved.convert("RGBA")
+        else:
+            image = self._render(func, bounds)
+            if path is not None:
+                self._save(image, path)
+
+        with self._lock:
+            self._images[self.key(func, bounds)] = image
+            while len(self._images) > self.max_size:
+                self._images.popitem(last=False)
+        return image
+
+    def _render(self, func, bounds):
+        from matplotlib.figure import Figure
+        from rendering import FrameView
+
+        # PSO'nun contour | 2D görünümlerinin parçacıksız hali; yalnızca yüzey ızgarasından çizilir.
+        # PSO kurulmaz ve fonksiyon çalışan bir koşuyla paylaşılabileceğinden ona hiçbir şey yazılmaz.
+        landscape = get_landscape(func, bounds, self.resolution, cache_dir=self.cache_dir)
+        optimum_xy = optimum_position(func, 2)
+
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
+        cp = ax.contourf(landscape.X, landscape.Y, landscape.Z, cmap='viridis', levels=50, alpha=0.8)
+        color_bar = fig.colorbar(cp, ax=ax, shrink=0.85, aspect=10)
+        color_bar.set_label("Fonksiyon Değeri", fontsize=12)
+        ax.set_xlabel("X", fontsize=12)
+        ax.set_ylabel("Y", fontsize=12)
+        ax.set_title(func.__name__, fontsize=10, loc='center')
+        if optimum_xy is not None:
+            ax.scatter(optimum_xy[0], optimum_xy[1], color='green', marker='s', s=100, label='Optimum', zorder=2)
+        ax.set_xlim(bounds[0], bounds[1])
+        ax.set_ylim(bounds[0], bounds[1])
+        contour = FrameView(fig, {}, blit=False).render()
+
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
+        x, y = landscape.x, landscape.line
+        ax.plot(x, y, 'k-', linewidth=1.5, label="Test Funct")
+        ax.set_title(func.__name__, fontsize=10, loc='center')
+        ax.set_xlabel("Bounds", fontsize=12)
+        ax.set_ylabel("Score", fontsize=12)
+        if optimum_xy is not None:
+            # Optimumun y=0 kesitindeki değeri fonksiyon çağrılmadan kesitten okunur
+            ax.scatter(optimum_xy[0], np.interp(optimum_xy[0], x, y), color='green', marker='s', s=100,
+                       label='Optimum', zorder=2)
+        ax.legend(loc='upper left', bbox_to_anchor=(-0.17, 1.15), borderaxespad=0, fontsize=8, frameon=False,
+                  labelspacing=0.8, handletextpad=0.4, borderpad=1.0)
+        ax.set_xlim(bounds[0], bounds[1])
+        ax.set_ylim(min(y) - 5, max(y) + 5)
+        line = FrameView(fig, {}, blit=False).render()
+
+        return combine_frames([contour, line], columns=2).convert("RGBA")
+
+    def _path(self, func, bounds):
+        key = _function_key(func)
+        if self.cache_dir is None or key is None:
+            return None
+        return os.path.join(self.cache_dir,
+                            f"preview_{key}_{float(bounds[0]):g}_{float(bounds[1]):g}_{self.resolution}.png")
+
+    def _save(self, image, path):
+        # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazıp yer değiştir
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                image.save(f, format="PNG")
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error in PreviewCache._save: {e}")
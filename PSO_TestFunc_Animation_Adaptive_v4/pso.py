@@ -1,18 +1,25 @@
 import numpy as np
-from matplotlib import pyplot as plt
-from PIL import Image
-from io import BytesIO
+from animation_writer import GifStreamWriter, combine_frames
+from checkpoint import capture_state, load_checkpoint, make_checkpointer, restore_state
+from evaluators import make_evaluator
+from functions import optimum_position
+from landscape import get_landscape
+from profiling import NullProfiler, make_profiler
+from progress import make_progress
+from render_pipeline import RenderPipeline, SwarmSnapshot
+from render_schedule import make_render_schedule
+from run_control import RunControl
+from seeding import bind_noise, evaluate_runs, run_generators
+from stopping import make_stop_criteria
+from swarm import BatchSwarm, Swarm, convergence_summary
+from topology import make_batch_topology, make_topology
+from trajectory import TrajectoryRecorder
+
+# matplotlib ve rendering.py ilk figür kurulurken yüklenir (bkz. _build_*_view); headless koşular yüklemez
 
 
-class Particle:
-    def __init__(self, dimensions, bounds):
-        self.position = np.random.uniform(bounds[0], bounds[1], dimensions)
-        self.velocity = np.random.uniform(-1, 1, dimensions)
-        self.best_position = np.copy(self.position)
-        self.best_score = float('inf')
-
 class PSO:
-    def __init__(self, func, dimensions, bounds, num_particles, max_iter, w_max=0.9, w_min=0.4, c1_initial=2.5, c1_final=0.5, c2_initial=0.5, c2_final=2.5, message_callback=None):
+    def __init__(self, func, dimensions, bounds, num_particles, max_iter, w_max=0.9, w_min=0.4, c1_initial=2.5, c1_final=0.5, c2_initial=0.5, c2_final=2.5, message_callback=None, velocity_rate=None, landscape_cache_dir=None, reuse_figures=True, output_path='combined_animation.gif', output_path_3d='pso_3d_animation.gif', headless=False, render_every=1, render_workers=0, trajectory_path=None, evaluator='vectorized', evaluator_workers=None, fitness_cache=None, stop_criteria=None, topology=None, backend='numpy', profile=None, progress=None, print_interval=0.0, message_interval=0.1, control=None, frame_callback=None, landscape_resolution=100, checkpoint=None, seed=None):
         self.func = func
         self.dimensions = dimensions
         self.bounds = bounds
@@ -27,256 +34,466 @@ class PSO:
         self.c1_final = c1_final
         self.c2_initial = c2_initial
         self.c2_final = c2_final
-        self.swarm = [Particle(dimensions, bounds) for _ in range(num_particles)]
-        self.global_best_position = np.random.uniform(bounds[0], bounds[1], dimensions)
-        self.global_best_score = float('inf')
+        self.velocity_rate = velocity_rate
+        # Tekrarlanabilirlik: seed (int, SeedSequence ya da np.random.Generator) sürü, topoloji ve gürültü
+        # için ayrı akışlara bölünür (bkz. seeding.py); aynı seed süreçten bağımsız olarak aynı koşuyu verir
+        self.seed = seed
+        self.rngs = run_generators(seed)
+        # Gürültülü fonksiyonlar (ör. noisy_rastrigin) bu koşunun gürültü akışına bağlanarak değerlendirilir;
+        # func'ın kendisi değiştirilmez (aynı fonksiyonla kurulan diğer PSO'ları etkilemez)
+        self.objective = bind_noise(func, self.rngs["noise"])
+        # None / 'global': gBest, 'ring', 'von_neumann', 'random', 'dynamic' ya da Topology nesnesi (lbest)
+        self.topology_spec = topology  # optimize_batch her koşu için kendi topolojisini kurar
+        self.topology = make_topology(topology, num_particles, rng=self.rngs["topology"])
+        self.swarm = Swarm(num_particles, dimensions, bounds, velocity_rate=velocity_rate, topology=self.topology,
+                           backend=backend, rng=self.rngs["swarm"])
         self.frames_contour = []
         self.frames_2d = []
         self.frames_3d = []
         self.message_callback = message_callback  # Callback fonksiyonu ekledik
+        self.landscape_cache_dir = landscape_cache_dir  # Verilirse yüzey ızgarası diske de kaydedilir
+        self.landscape_resolution = landscape_resolution  # Yüzey ızgarasının eksen başına nokta sayısı
+        self.reuse_figures = reuse_figures  # False: her karede figür baştan kurulur (eski davranış)
+        self._views = {}
+        self.output_path = output_path
+        self.output_path_3d = output_path_3d
+        self.headless = headless  # True: hiç kare çizilmez / yazılmaz, iterasyon çıktısı basılmaz
+        self.render_every = render_every  # int k, 'log', 'improve' veya f(iteration, improved)
+        self.render_schedule = make_render_schedule(render_every, max_iter)
+        self.render_workers = render_workers  # >0: kareler bu sayıda ayrı süreçte, optimizasyonla eş zamanlı çizilir
+        self.trajectory_path = trajectory_path  # Verilirse tüm sürü geçmişi bu klasöre kaydedilir (bkz. replay.py)
+        # 'vectorized', 'serial', 'thread', 'process' ya da bir Evaluator nesnesi (bkz. evaluators.py)
+        # fitness_cache: FitnessCache ya da 'exact' / 'quantized' / 'mask'; aynı konum tekrar değerlendirilmez
+        # backend='numba': sürü adımı ve functions.py fonksiyonları derlenmiş kernel'lerle (bkz. kernels.py)
+        self.backend = backend
+        if backend == 'numba' and evaluator == 'vectorized':
+            evaluator = 'numba'
+        self.evaluator = make_evaluator(self.objective, evaluator, evaluator_workers, cache=fitness_cache)
+        # Erken durdurma: StopCriteria ya da argümanları (dict); durma sebebi stop_reason'da raporlanır
+        self.stop_criteria = make_stop_criteria(stop_criteria)
+        # Aşama süreleri / bellek ölçümü: True, Profiler argümanları (dict), hook(name, seconds) ya da Profiler
+        self.profiler = make_profiler(profile)
+        # İlerleme olayları: abone fonksiyonu ya da (fonksiyon, min_interval) listesi (bkz. progress.py).
+        # Konsol çıktısı da bir abonedir; print_interval > 0 ise en fazla o kadar saniyede bir basılır.
+        self.progress = make_progress(progress)
+        if not headless:
+            self.progress.subscribe(lambda event: print(event.format('.4f')), min_interval=print_interval)
+        # GUI mesajları da bir abonedir; Qt olay döngüsü boğulmasın diye en fazla message_interval saniyede bir
+        if message_callback:
+            self.progress.subscribe(lambda event: message_callback(event.format('.4e')), min_interval=message_interval)
+        # İptal / duraklatma (bkz. run_control.py); her iterasyonun başında denetlenir
+        self.control = control or RunControl()
+        # Canlı önizleme: GIF'e yazılan her contour | 2D karesi üretildiği anda bu fonksiyona da verilir
+        self.frame_callback = frame_callback
+        # Periyodik checkpoint: dosya yolu, Checkpointer argümanları (dict) ya da Checkpointer (bkz. checkpoint.py)
+        self.checkpointer = make_checkpointer(checkpoint)
+        self._resume_state = None
+        self.stop_reason = None
+        self.stop_iteration = None
+
+    def __getstate__(self):
+        # Render süreçlerine yalnızca çizim için gerekenler kopyalanır (figürler, callback vb. hariç)
+        state = self.__dict__.copy()
+        state.update(_views={}, message_callback=None, render_schedule=None, evaluator=None, frames_contour=[], frames_2d=[],
+                     frames_3d=[], profiler=NullProfiler(), progress=None, control=None, frame_callback=None)
+        return state
+
+    @property
+    def global_best_position(self):
+        return self.swarm.gbest_position
+
+    @property
+    def global_best_score(self):
+        return self.swarm.gbest_score
+
+    def resume(self, path=None):
+        # Aynı ayarlarla kurulmuş PSO'da checkpoint'ten devam: kaydedildiği optimize metodu kalınan iterasyondan sürer
+        self._resume_state = load_checkpoint(path or self.checkpointer.path)
+        return getattr(self, str(self._resume_state["method"]))()
+
+    def _restore_checkpoint(self, writers, recorder):
+        # resume() ile başlatıldıysa durumu geri yükler; döngünün başlayacağı iterasyondan bir öncekini döndürür
+        if self.checkpointer is not None:
+            self.checkpointer.start()
+        state, self._resume_state = self._resume_state, None
+        return 0 if state is None else restore_state(self, state, writers, recorder)
+
+    def _save_checkpoint(self, iteration, method, writers, recorder, pipeline):
+        # Render hattındaki kareler yazılmadan GIF uzunluğu checkpoint'e alınmaz
+        if pipeline is not None:
+            pipeline.drain()
+        self.checkpointer.save(capture_state(self, iteration, method, writers, recorder))
 
     def optimize(self):
+        # Kareler üretildikleri anda diske yazılır, koşu boyunca bellekte biriktirilmez.
+        # Yazıcı dosyayı ilk karede açar; headless modda hiç dosya oluşmaz.
+        with GifStreamWriter(self.output_path) as writer, GifStreamWriter(self.output_path_3d) as writer_3d:
+            pipeline = None
+            if self.render_workers and not self.headless:
+                def write_frame(frame):
+                    writer.append(frame)
+                    self.stream_frame(frame)
+
+                pipeline = RenderPipeline(self, [write_frame, writer_3d.append], workers=self.render_workers)
+
+            recorder = None
+            if self.trajectory_path:
+                recorder = TrajectoryRecorder(self.trajectory_path, self.num_particles, self.dimensions, self.max_iter,
+                                              resume=self._resume_state is not None,
+                                              function=self.func.__name__, bounds=[float(b) for b in self.bounds])
+
+            self.profiler.start()
+            self.progress.start()
+            self.stop_criteria.start(self.func, self.dimensions)
+            self.stop_reason, self.stop_iteration = 'max_iter', self.max_iter
+            start = self._restore_checkpoint([writer, writer_3d], recorder)
+            for iter in range(start + 1, self.max_iter + 1):
+                # Duraklatıldıysa burada beklenir; iptal edildiyse döngüden çıkılır
+                if self.control.checkpoint():
+                    self.stop_reason, self.stop_iteration = 'cancelled', iter - 1
+                    # İptal edilen koşu kaldığı yerden resume() ile sürdürülebilsin
+                    if self.checkpointer is not None:
+                        self._save_checkpoint(iter - 1, 'optimize', [writer, writer_3d], recorder, pipeline)
+                    break
+
+                self.w, self.c1, self.c2 = self.coefficients(iter)
+
+                # Tüm sürüyü tek bir vektörel çağrıyla değerlendir, ardından hız/konum güncelle
+                previous_best = self.global_best_score
+                with self.profiler.phase('evaluation'):
+                    scores = self.evaluator(self.swarm.positions)
+                with self.profiler.phase('update'):
+                    self.swarm.evaluate(scores)
+                    self.swarm.step(self.w, self.c1, self.c2)
+                improved = self.global_best_score < previous_best
+
+                if recorder is not None:
+                    with self.profiler.phase('record'):
+                        recorder.record(self.swarm, self.w, self.c1, self.c2)
+
+                with self.profiler.phase('stop_check'):
+                    stop_reason = self.stop_criteria.check(self.swarm, self.evaluator.evaluations)
+
+                # Kareler yalnızca çizim takviminin seçtiği iterasyonlarda (ve durulan iterasyonda) üretilir
+                if not self.headless and (self.render_schedule(iter, improved) or stop_reason):
+                    if pipeline is not None:
+                        with self.profiler.phase('render_submit'):
+                            pipeline.submit(SwarmSnapshot.from_swarm(iter, self.swarm, self.w, self.c1, self.c2))
+                    else:
+                        self.plot_swarm_contour(iter, show_particles=True)
+                        self.plot_swarm_2d(iter, show_particles=True)
+                        self.plot_swarm_3d(iteration=iter, show_particles=True)
+                        with self.profiler.phase('gif'):
+                            self.write_frames(writer, writer_3d)
+
+                with self.profiler.phase('progress'):
+                    self.progress.publish(iter, self.max_iter, self.w, self.c1, self.c2, self.swarm, self.evaluator.evaluations,
+                                          stop_reason)
+
+                self.profiler.sample_memory()
+
+                if self.checkpointer is not None and not stop_reason and self.checkpointer.due(iter):
+                    with self.profiler.phase('checkpoint'):
+                        self._save_checkpoint(iter, 'optimize', [writer, writer_3d], recorder, pipeline)
+
+                if stop_reason:
+                    self.stop_reason, self.stop_iteration = stop_reason, iter
+                    break
+
+            # Kuyrukta bekleyen kareler çizilip yazılana kadar bekle
+            if pipeline is not None:
+                with self.profiler.phase('render_wait'):
+                    pipeline.close()
+            if recorder is not None:
+                recorder.close()
+            self.progress.close()
+            self.evaluator.close()
+            self.profiler.count('evaluations', self.evaluator.evaluations)
+            self.profiler.stop()
+
+        if writer.frame_count:
+            print(f"GIF kaydedildi: {self.output_path}")
+        if writer_3d.frame_count:
+            print(f"GIF kaydedildi: {self.output_path_3d}")
+
+        print(f"{self.func} function best position: {self.global_best_position}")
+        print(f"{self.func} function best score: {self.global_best_score}")
+        print(f"{self.func} function evaluations: {self.evaluator.evaluations} ({self.evaluator.seconds:.2f}s)")
+        print(f"{self.func} stopped at iteration {self.stop_iteration}: {self.stop_reason}")
+        if self.profiler.enabled:
+            print(self.profiler.report())
+
+        return self.output_path if writer.frame_count else None
+
+    def coefficients(self, iter):
+        # Adaptif w, c1, c2 hesaplama
+        w = self.w_max - (self.w_max - self.w_min) * (iter / self.max_iter)
+        c1 = (self.c1_final - self.c1_initial) * (iter / self.max_iter) + self.c1_initial
+        c2 = (self.c2_final - self.c2_initial) * (1 - (iter / self.max_iter)) + self.c2_initial
+        return w, c1, c2
+
+    def optimize_batch(self, seeds):
+        # Aynı konfigürasyonu her seed için bağımsız bir sürüyle, tümünü tek (R, N, D) dizisinde çalıştırır.
+        # Çizim yapılmaz; koşu başına gBest eğrileri ve mean/median/best/worst eğrileri döner.
+        # Her koşu, aynı seed'le tek başına kurulan PSO'nun sürü, topoloji ve gürültü akışlarını kullanır
+        streams = [run_generators(seed) for seed in seeds]
+        noise = [s["noise"] for s in streams]
+        topology = make_batch_topology(self.topology_spec, self.num_particles, [s["topology"] for s in streams])
+        swarm = BatchSwarm(seeds, self.num_particles, self.dimensions, self.bounds, velocity_rate=self.velocity_rate,
+                           topology=topology, backend=self.backend, rngs=[s["swarm"] for s in streams])
+        curves = np.empty((swarm.num_runs, self.max_iter))
         for iter in range(1, self.max_iter + 1):
+            w, c1, c2 = self.coefficients(iter)
+            swarm.evaluate(evaluate_runs(self.func, swarm.positions, noise))
+            swarm.step(w, c1, c2)
+            curves[:, iter - 1] = swarm.gbest_score
 
-            # Adaptif w, c1, c2 hesaplama
-            self.w = self.w_max - (self.w_max - self.w_min) * (iter / self.max_iter)
-            self.c1 = (self.c1_final - self.c1_initial) * (iter / self.max_iter) + self.c1_initial
-            self.c2 = (self.c2_final - self.c2_initial) * (1 - (iter / self.max_iter)) + self.c2_initial
+        return dict(convergence_summary(curves), seeds=swarm.seeds, curves=curves,
+                    gbest_positions=swarm.gbest_position, gbest_scores=swarm.gbest_score)
 
-            for particle in self.swarm:
-                fitness = self.func(particle.position)
-                if fitness < particle.best_score:
-                    particle.best_score = fitness
-                    particle.best_position = np.copy(particle.position)
+    def write_frames(self, writer, writer_3d=None):
+        # Bekleyen kareleri (contour | 2D yan yana ve 3D) yazıcılara aktar ve listeleri boşalt
+        try:
+            for frame_contour, frame_2d in zip(self.frames_contour, self.frames_2d):
+                frame = combine_frames([frame_contour, frame_2d], columns=2)
+                writer.append(frame)
+                self.stream_frame(frame)
+            if writer_3d is not None:
+                for frame in self.frames_3d:
+                    writer_3d.append(frame)
+        except Exception as e:
+            print(f"Error in write_frames: {e}")
+        self.frames_contour.clear()
+        self.frames_2d.clear()
+        self.frames_3d.clear()
+
+    def stream_frame(self, frame):
+        if self.frame_callback is None:
+            return
+        try:
+            self.frame_callback(frame)
+        except Exception as e:
+            print(f"Error in frame_callback: {e}")
+
+    def render_snapshot(self, snapshot):
+        # Render sürecinde çalışır: anlık görüntüyü bu kopyaya uygula, kareleri yazıcı sırasıyla döndür
+        self.swarm.positions = snapshot.positions
+        self.swarm.gbest_position = snapshot.gbest_position
+        self.swarm.gbest_score = snapshot.gbest_score
+        self.w, self.c1, self.c2 = snapshot.w, snapshot.c1, snapshot.c2
+
+        self.plot_swarm_contour(snapshot.iteration, show_particles=True)
+        self.plot_swarm_2d(snapshot.iteration, show_particles=True)
+        self.plot_swarm_3d(iteration=snapshot.iteration, show_particles=True)
+
+        frames = [[combine_frames([frame_contour, frame_2d], columns=2)
+                   for frame_contour, frame_2d in zip(self.frames_contour, self.frames_2d)],
+                  list(self.frames_3d)]
+        self.frames_contour.clear()
+        self.frames_2d.clear()
+        self.frames_3d.clear()
+        return frames
+
+    def _get_view(self, name, show_particles, build):
+        # reuse_figures açıkken figür ve sabit arka plan çalışma boyunca bir kez kurulur
+        key = (name, show_particles)
+        if self.reuse_figures and key in self._views:
+            return self._views[key]
+        view = build(show_particles)
+        if self.reuse_figures:
+            self._views[key] = view
+        return view
+
+    def _build_contour_view(self, show_particles):
+        from matplotlib.figure import Figure
+        from rendering import FrameView
+
+        # Yüzey her karede yeniden hesaplanmaz, önbellekten gelir
+        landscape = get_landscape(self.func, self.bounds, self.landscape_resolution, cache_dir=self.landscape_cache_dir)
+        X, Y, Z = landscape.X, landscape.Y, landscape.Z
+
+        fig = Figure(figsize=(8, 6))  # 6,4
+        ax = fig.subplots()
+        cp = ax.contourf(X, Y, Z, cmap='viridis', levels=50, alpha=0.8)
+
+        # cmap alabileceği değerler; 'viridis', 'plasma', 'inferno', 'magma', 'cividis'
+
+        # Colorbar oluştur ve label ekle
+        color_bar = fig.colorbar(cp, ax=ax, shrink=0.85, aspect=10)
+        color_bar.set_label("Fonksiyon Değeri", fontsize=12)
+
+        # Eksen etiketlerini ekleyelim
+        ax.set_xlabel("X", fontsize=12)
+        ax.set_ylabel("Y", fontsize=12)
+
+        title = ax.set_title("", fontsize=10, loc='center')
+
+        particles = gbest = optimum = None
+        if show_particles:
+            particles = ax.scatter([], [], color='red', marker='o', s=50, alpha=0.6, label='Particles', zorder=1)
+            gbest = ax.scatter([], [], color='blue', marker='H', s=150, label='Global Best', zorder=3)
+
+        optimum_xy = optimum_position(self.func, 2)
+        if optimum_xy is not None:
+            optimum = ax.scatter(optimum_xy[0], optimum_xy[1], color='green', marker='s', s=100, label='Optimum', zorder=2)
+
+        ax.set_xlim(self.bounds[0], self.bounds[1])
+        ax.set_ylim(self.bounds[0], self.bounds[1])
+
+        return FrameView(fig, {'title': title, 'particles': particles, 'gbest': gbest, 'optimum': optimum},
+                         blit=self.reuse_figures)
 
-                if fitness < self.global_best_score:
-                    self.global_best_score = fitness
-                    self.global_best_position = np.copy(particle.position)
+    def plot_swarm_contour(self, iteration, show_particles=False):
+        try:
+            view = self._get_view('contour', show_particles, self._build_contour_view)
 
-            for particle in self.swarm:
-                inertia = self.w * particle.velocity
-                cognitive = self.c1 * np.random.rand(self.dimensions) * (particle.best_position - particle.position)
-                social = self.c2 * np.random.rand(self.dimensions) * (self.global_best_position - particle.position)
-                particle.velocity = inertia + cognitive + social
-                particle.position += particle.velocity
-                particle.position = np.clip(particle.position, self.bounds[0], self.bounds[1])
+            # Parametreleri ve iterasyon numarasını ekleyelim
+            view.artists['title'].set_text(f"Iteration= {iteration}, w={self.w:.2f}, c1={self.c1:.2f}, c2={self.c2:.2f}, Best Score={self.global_best_score:.2e}")
 
+            if show_particles:
+                view.artists['particles'].set_offsets(self.swarm.positions[:, :2])
+                view.artists['gbest'].set_offsets(self.global_best_position[:2])
 
-            self.plot_swarm_contour(iter, show_particles=True)
-            self.plot_swarm_2d(iter, show_particles=True)
+            with self.profiler.phase('draw'):
+                view.draw()
+            with self.profiler.phase('encode'):
+                self.frames_contour.append(view.encode())
+        except Exception as e:
+            print(f"Error in plot_swarm_contour: {e}")
 
-            # 3D görseli her iterasyonda kaydet
-            self.plot_swarm_3d(iteration=iter, show_particles=True)
+    def _build_2d_view(self, show_particles):
+        from matplotlib.figure import Figure
+        from rendering import FrameView
 
-            print(f"Iter {iter}/{self.max_iter}, w={self.w:.4f}, c1={self.c1:.4f}, c2={self.c2:.4f}, Best Score: {self.global_best_score:.4f}")
+        fig = Figure(figsize=(8, 6))  #8,4
+        ax = fig.subplots()
+        landscape = get_landscape(self.func, self.bounds, self.landscape_resolution, cache_dir=self.landscape_cache_dir)
+        x, y = landscape.x, landscape.line
+        ax.plot(x, y, 'k-', linewidth=1.5, label="Test Funct")
 
-            # Her iterasyon sonrası mesaj gönder
-            if self.message_callback:
-                message = f"Iter {iter}/{self.max_iter}, w={self.w:.4f}, c1={self.c1:.4f}, c2={self.c2:.4f}, Best Score: {self.global_best_score:.4e}"
-                self.message_callback(message)
+        title = ax.set_title("", fontsize=10, loc='center')
 
-        # Optimize tamamlandığında gif oluştur
-        self.combine_gifs_3d(output_path='pso_3d_animation.gif')
+        # Eksen etiketlerini ekleyelim
+        ax.set_xlabel("Bounds", fontsize=12)
+        ax.set_ylabel("Score", fontsize=12)
 
-        print(f"{self.func} function best position: {self.global_best_position}")
-        print(f"{self.func} function best score: {self.global_best_score}")
+        particles = gbest = optimum = None
+        if show_particles:
+            particles = ax.scatter([], [], color='red', s=50, alpha=0.6, label='Particles', zorder=1)
+            gbest = ax.scatter([], [], color='blue', marker='H', s=150, label='Global Best', zorder=3)
 
+        optimum_xy = optimum_position(self.func, 2)
+        if optimum_xy is not None:
+            optimum = ax.scatter(optimum_xy[0], self.func([optimum_xy[0], 0]), color='green', marker='s', s=100,  label='Optimum', zorder=2)
 
+        ax.legend(loc='upper left', bbox_to_anchor=(-0.17, 1.15), borderaxespad=0, fontsize=8, frameon=False, labelspacing=0.8, handletextpad=0.4, borderpad=1.0)
 
-        return self.combine_gifs()
+        ax.set_xlim(self.bounds[0], self.bounds[1])
+        ax.set_ylim(min(y) - 5, max(y) + 5)
 
-    def initialize_plot(self, show_particles=False):
-        # Başlangıç durumunu göster
-        self.plot_swarm_contour(0, show_particles)
-        self.plot_swarm_2d(0, show_particles)
+        return FrameView(fig, {'title': title, 'particles': particles, 'gbest': gbest, 'optimum': optimum},
+                         blit=self.reuse_figures)
 
-    def plot_swarm_contour(self, iteration, show_particles=False):
+    def plot_swarm_2d(self, iteration, show_particles=False):
         try:
-            x = np.linspace(self.bounds[0], self.bounds[1], 100)
-            y = np.linspace(self.bounds[0], self.bounds[1], 100)
-            X, Y = np.meshgrid(x, y)
-            Z = np.array([self.func([x, y]) for x, y in zip(np.ravel(X), np.ravel(Y))]).reshape(X.shape)
-
-            fig, ax = plt.subplots(figsize=(8, 6))  # 6,4
-            cp = ax.contourf(X, Y, Z, cmap='viridis', levels=50, alpha=0.8)
-
-            # cmap alabileceği değerler; 'viridis', 'plasma', 'inferno', 'magma', 'cividis'
-
-            #fig.colorbar(cp, ax=ax, shrink=0.85, aspect=10)
-
-            # Colorbar oluştur ve label ekle
-            color_bar = fig.colorbar(cp, ax=ax, shrink=0.85, aspect=10)
-            color_bar.set_label("Fonksiyon Değeri", fontsize=12)
-
-            # Eksen etiketlerini ekleyelim
-            ax.set_xlabel("X", fontsize=12)
-            ax.set_ylabel("Y", fontsize=12)
+            view = self._get_view('2d', show_particles, self._build_2d_view)
 
             # Parametreleri ve iterasyon numarasını ekleyelim
-            #ax.set_title(f"Iteration= {iteration}, w={self.w}, c1={self.c1}, c2={self.c2}", fontsize=12, loc='center')
-            ax.set_title(f"Iteration= {iteration}, w={self.w:.2f}, c1={self.c1:.2f}, c2={self.c2:.2f}, Best Score={self.global_best_score:.2e}", fontsize=10, loc='center')
+            view.artists['title'].set_text(f"Iteration={iteration}, w={self.w:.2f}, c1={self.c1:.2f}, c2={self.c2:.2f}, Best Score={self.global_best_score:.2e}")
 
             if show_particles:
-                ax.scatter([p.position[0] for p in self.swarm], [p.position[1] for p in self.swarm], color='red', marker='o', s=50, alpha=0.6, label='Particles', zorder=1)
-                ax.scatter(self.global_best_position[0], self.global_best_position[1], color='blue', marker='H', s=150,
-                           label='Global Best', zorder=3)
-
-
-            if hasattr(self.func, "optimum_position"):
-                ax.scatter(self.func.optimum_position[0], self.func.optimum_position[1], color='green', marker='s', s=100, label='Optimum', zorder=2)
-
-            #x_margin = (self.bounds[1] - self.bounds[0]) * 0.1  # %10 marj ekleyerek genişletiyoruz
-            #plt.xlim(self.bounds[0] - x_margin, self.bounds[1] + x_margin)
+                particles_x = self.swarm.positions[:, 0]
+                particles_y = self.func(np.column_stack([particles_x, np.zeros_like(particles_x)]))
+                view.artists['particles'].set_offsets(np.column_stack([particles_x, particles_y]))
+                gbest_x = self.global_best_position[0]
+                view.artists['gbest'].set_offsets([gbest_x, self.func([gbest_x, 0])])
+
+            with self.profiler.phase('draw'):
+                view.draw()
+            with self.profiler.phase('encode'):
+                self.frames_2d.append(view.encode())
+        except Exception as e:
+            print(f"Error in plot_swarm_2d: {e}")
 
-            plt.xlim(self.bounds[0], self.bounds[1])
-            plt.ylim(self.bounds[0], self.bounds[1])
-            plt.close(fig)
+    def _build_3d_view(self, show_particles):
+        from matplotlib.figure import Figure
+        from rendering import FrameView
 
-            buf = BytesIO()
-            fig.savefig(buf, format="PNG")
-            self.frames_contour.append(Image.open(buf))
-        except Exception as e:
-            print(f"Error in plot_swarm_contour: {e}")
+        # Yüzey her karede yeniden hesaplanmaz, önbellekten gelir
+        landscape = get_landscape(self.func, self.bounds, self.landscape_resolution, cache_dir=self.landscape_cache_dir)
+        X, Y, Z = landscape.X, landscape.Y, landscape.Z
 
-    def plot_swarm_2d(self, iteration, show_particles=False):
-        try:
-            fig, ax = plt.subplots(figsize=(8, 6))  #8,4
-            x = np.linspace(self.bounds[0], self.bounds[1], 100)
-            y = [self.func([xi, 0]) for xi in x]
-            ax.plot(x, y, 'k-', linewidth=1.5, label="Test Funct")
+        fig = Figure(figsize=(10, 8))
+        ax = fig.add_subplot(111, projection='3d')
 
-            # Parametreleri ve iterasyon numarasını ekleyelim
-            #ax.set_title(f"Iteration={iteration}, w={self.w}, c1={self.c1}, c2={self.c2}", fontsize=12, loc='center')
-            ax.set_title(f"Iteration={iteration}, w={self.w:.2f}, c1={self.c1:.2f}, c2={self.c2:.2f}, Best Score={self.global_best_score:.2e}", fontsize=10, loc='center')
+        # Yüzey grafiği (alpha değeri düşük, zorder=1 ile)
+        surf = ax.plot_surface(X, Y, Z, cmap='viridis', edgecolor='none', alpha=0.3, zorder=1)
+        ax.contourf(X, Y, Z, zdir='z', offset=np.min(Z) - 10, cmap='viridis', levels=50, alpha=0.5)
 
-            # Eksen etiketlerini ekleyelim
-            ax.set_xlabel("Bounds", fontsize=12)
-            ax.set_ylabel("Score", fontsize=12)
+        # Colorbar ekleyelim
+        color_bar = fig.colorbar(surf, shrink=0.6, aspect=10)
+        color_bar.set_label("Fonksiyon Değeri", fontsize=12)
 
-            if show_particles:
-                ax.scatter([p.position[0] for p in self.swarm], [self.func([p.position[0], 0]) for p in self.swarm], color='red', s=50, alpha=0.6, label='Particles', zorder=1)
-                ax.scatter(self.global_best_position[0], self.func([self.global_best_position[0], 0]), color='blue',
-                           marker='H', s=150, label='Global Best', zorder=3)
+        # Eksen etiketleri ve başlık
+        ax.set_xlabel('X', labelpad=10)
+        ax.set_ylabel('Y', labelpad=10)
+        ax.set_zlabel('f(X, Y)', labelpad=10)
+        title = ax.set_title("", fontsize=12, pad=20)
 
+        # Eksen sınırlarını ayarlayarak kaymayı önleyin
+        ax.set_xlim(self.bounds[0], self.bounds[1])
+        ax.set_ylim(self.bounds[0], self.bounds[1])
+        ax.set_zlim(np.min(Z) - 10, np.max(Z) + 10)
 
-            if hasattr(self.func, "optimum_position"):
-                ax.scatter(self.func.optimum_position[0], self.func([self.func.optimum_position[0], 0]), color='green', marker='s', s=100,  label='Optimum', zorder=2)
+        # Parçacıkları göster (daha yüksek zorder ve depthshade kapalı)
+        particles = None
+        if show_particles:
+            particles = ax.scatter([], [], [], color='black', s=80, marker='o', label='Particles',
+                                   zorder=6, depthshade=False)
 
-            #plt.xlim(self.bounds[0], self.bounds[1])
+        # Global best ve optimum noktaları göster (daha yüksek zorder ile)
+        gbest = ax.scatter([], [], [], color='red', marker='*', s=200, label='Global Best', zorder=7,
+                           depthshade=False)
 
-            #ax.legend(loc='upper left', bbox_to_anchor=(1.1, 1.15), fontsize=8, frameon=True, handlelength=1,
-             #         handleheight=1, handletextpad=0.5, borderaxespad=0.5, labelspacing=0.5)
+        optimum_xy = optimum_position(self.func, 2)
+        if optimum_xy is not None:
+            opt_x, opt_y = optimum_xy
+            opt_z = self.func([opt_x, opt_y])
+            ax.scatter(opt_x, opt_y, opt_z, color='lime', marker='s', s=150, label='Optimum', zorder=8,
+                       depthshade=False)
 
-            #ax.legend(loc='upper left')
-            ax.legend(loc='upper left', bbox_to_anchor=(-0.17, 1.15), borderaxespad=0, fontsize=8, frameon=False, labelspacing=0.8, handletextpad=0.4, borderpad=1.0)
+        # Efsane (legend) ekle ve hizalamayı ayarla
+        ax.legend(loc='upper left', fontsize=12, frameon=True, borderpad=1.0)
 
-            #x_margin = (self.bounds[1] - self.bounds[0]) * 0.1  # %10 marj ekleyerek genişletiyoruz
-            #plt.xlim(self.bounds[0] - x_margin, self.bounds[1] + x_margin)
-            plt.xlim(self.bounds[0], self.bounds[1])
-            plt.ylim(min(y) - 5, max(y) + 5)
-            plt.close(fig)
+        # Görüş açısını ayarlayarak daha iyi bir perspektif elde edin
+        ax.view_init(elev=30, azim=45)
 
-            buf = BytesIO()
-            fig.savefig(buf, format="PNG")
-            self.frames_2d.append(Image.open(buf))
-        except Exception as e:
-            print(f"Error in plot_swarm_2d: {e}")
+        fig.tight_layout()
 
-    def combine_gifs(self, output_path='combined_animation.gif'):
-        try:
-            combined_frames = []
-            for frame1, frame2 in zip(self.frames_contour, self.frames_2d):
-                combined_frame = Image.new('RGBA', (frame1.width + frame2.width, frame1.height))
-                combined_frame.paste(frame1, (0, 0))
-                combined_frame.paste(frame2, (frame1.width, 0))
-                combined_frames.append(combined_frame)
-
-            if combined_frames:
-                combined_frames[0].save(output_path, save_all=True, append_images=combined_frames[1:], duration=200, loop=0)
-                #combined_frames[0].save(f'{self.func}_anim.gif', save_all=True, append_images=combined_frames[1:], duration=200,loop=0)
-                return combined_frames
-            else:
-                print("No frames were generated for the animation.")
-                return None
-        except Exception as e:
-            print(f"Error in combine_gifs: {e}")
-            return None
+        # 3D projeksiyon her çizimde yeniden hesaplandığı için blit yapılmaz, figür yine de yeniden kullanılır
+        return FrameView(fig, {'title': title, 'particles': particles, 'gbest': gbest}, blit=False)
 
     def plot_swarm_3d(self, iteration, show_particles=True):
         try:
-            x = np.linspace(self.bounds[0], self.bounds[1], 100)
-            y = np.linspace(self.bounds[0], self.bounds[1], 100)
-            X, Y = np.meshgrid(x, y)
-            Z = np.array([self.func([x, y]) for x, y in zip(np.ravel(X), np.ravel(Y))]).reshape(X.shape)
-
-            fig = plt.figure(figsize=(10, 8))
-            ax = fig.add_subplot(111, projection='3d')
-
-            # Yüzey grafiği (alpha değeri düşük, zorder=1 ile)
-            surf = ax.plot_surface(X, Y, Z, cmap='viridis', edgecolor='none', alpha=0.3, zorder=1)
-            ax.contourf(X, Y, Z, zdir='z', offset=np.min(Z) - 10, cmap='viridis', levels=50, alpha=0.5)
-
-            # Colorbar ekleyelim
-            color_bar = fig.colorbar(surf, shrink=0.6, aspect=10)
-            color_bar.set_label("Fonksiyon Değeri", fontsize=12)
-
-            # Eksen etiketleri ve başlık
-            ax.set_xlabel('X', labelpad=10)
-            ax.set_ylabel('Y', labelpad=10)
-            ax.set_zlabel('f(X, Y)', labelpad=10)
-            ax.set_title(
-                f"Iteration {iteration}, w={self.w:.2f}, c1={self.c1:.2f}, c2={self.c2:.2f}, Best Score={self.global_best_score:.2e}",
-                fontsize=12, pad=20)
-
-            # Eksen sınırlarını ayarlayarak kaymayı önleyin
-            ax.set_xlim(self.bounds[0], self.bounds[1])
-            ax.set_ylim(self.bounds[0], self.bounds[1])
-            ax.set_zlim(np.min(Z) - 10, np.max(Z) + 10)
-
-            # Parçacıkları göster (daha yüksek zorder ve depthshade kapalı)
+            view = self._get_view('3d', show_particles, self._build_3d_view)
+
+            view.artists['title'].set_text(f"Iteration {iteration}, w={self.w:.2f}, c1={self.c1:.2f}, c2={self.c2:.2f}, Best Score={self.global_best_score:.2e}")
+
             if show_particles:
-                particles_x = [p.position[0] for p in self.swarm]
-                particles_y = [p.position[1] for p in self.swarm]
-                particles_z = [self.func([p.position[0], p.position[1]]) for p in self.swarm]
-                ax.scatter(particles_x, particles_y, particles_z, color='black', s=80, marker='o', label='Particles',
-                           zorder=6, depthshade=False)
+                particles_x = self.swarm.positions[:, 0]
+                particles_y = self.swarm.positions[:, 1]
+                particles_z = self.func(np.column_stack([particles_x, particles_y]))
+                view.artists['particles']._offsets3d = (particles_x, particles_y, particles_z)
 
-            # Global best ve optimum noktaları göster (daha yüksek zorder ile)
             gbest_x, gbest_y = self.global_best_position[0], self.global_best_position[1]
             gbest_z = self.func(self.global_best_position)
-            ax.scatter(gbest_x, gbest_y, gbest_z, color='red', marker='*', s=200, label='Global Best', zorder=7,
-                       depthshade=False)
-
-            if hasattr(self.func, "optimum_position"):
-                opt_x, opt_y = self.func.optimum_position
-                opt_z = self.func([opt_x, opt_y])
-                ax.scatter(opt_x, opt_y, opt_z, color='lime', marker='s', s=150, label='Optimum', zorder=8,
-                           depthshade=False)
-
-            # Efsane (legend) ekle ve hizalamayı ayarla
-            ax.legend(loc='upper left', fontsize=12, frameon=True, borderpad=1.0)
-
-            # Görüş açısını ayarlayarak daha iyi bir perspektif elde edin
-            ax.view_init(elev=30, azim=45)
-
-            plt.tight_layout()
-            plt.close(fig)
+            view.artists['gbest']._offsets3d = ([gbest_x], [gbest_y], [gbest_z])
 
             # Görseli bellekte sakla
-            buf = BytesIO()
-            fig.savefig(buf, format="PNG")
-            self.frames_3d.append(Image.open(buf))
+            with self.profiler.phase('draw'):
+                view.draw()
+            with self.profiler.phase('encode'):
+                self.frames_3d.append(view.encode())
 
         except Exception as e:
             print(f"Error in plot_swarm_3d: {e}")
-
-    def combine_gifs_3d(self, output_path='pso_3d_animation.gif'):
-        try:
-            if self.frames_3d:
-                self.frames_3d[0].save(output_path, save_all=True, append_images=self.frames_3d[1:], duration=200,
-                                       loop=0)
-                print(f"GIF kaydedildi: {output_path}")
-            else:
-                print("No frames generated for 3D animation.")
-        except Exception as e:
-            print(f"Error in combine_gifs_3d: {e}")
@@ -1,18 +1,86 @@
+import threading
+
 from PyQt5.QtCore import QThread, pyqtSignal
-from pso import PSO
 
 class PSOThread(QThread):
-    update_signal = pyqtSignal(str)  # Her iterasyonda mesaj göndermek için
+    update_signal = pyqtSignal(str)  # Bilgi ve hata mesajları için
     finished_signal = pyqtSignal(str)  # İşlem tamamlandığında mesaj göndermek için
+    progress_signal = pyqtSignal(object)  # Yapılandırılmış ilerleme olayı (progress.ProgressEvent)
+    frame_signal = pyqtSignal()  # Yeni bir önizleme karesi hazır (take_frame() ile alınır)
 
-    def __init__(self, func, dimensions, bounds, num_particles, max_iter, w_max, w_min, c1_init, c1_final, c2_init, c2_final):
+    def __init__(self, func, dimensions, bounds, num_particles, max_iter, w_max, w_min, c1_init, c1_final, c2_init, c2_final, checkpoint_path=None, resume=False):
         super().__init__()
-        self.pso = PSO(func, dimensions, bounds, num_particles, max_iter, w_max, w_min, c1_init, c1_final, c2_init, c2_final, message_callback=self.send_message)
+        from pso import PSO  # Pencere açılırken değil, ilk koşu başlatılırken yüklenir
+
+        self.pso = PSO(func, dimensions, bounds, num_particles, max_iter, w_max, w_min, c1_init, c1_final, c2_init, c2_final,
+                       progress=(self.send_progress, 0.1), frame_callback=self.send_frame, checkpoint=checkpoint_path)
+        self.resume_run = resume  # True: koşu checkpoint_path'teki checkpoint'ten devam eder
+        self.control = self.pso.control
+        # Arayüze bekleyen en fazla bir kare vardır; GUI geride kalırsa araya giren kareler atlanır
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._frame_pending = False
+        self.dropped_frames = 0
+
+    def send_progress(self, event):
+        self.progress_signal.emit(event)
+
+    def send_frame(self, frame):
+        # Önceki kare henüz gösterilmediyse yalnızca en yeni kare saklanır, yeni sinyal gönderilmez
+        with self._frame_lock:
+            if self._latest_frame is not None:
+                self.dropped_frames += 1
+            self._latest_frame = frame
+            if self._frame_pending:
+                return
+            self._frame_pending = True
+        self.frame_signal.emit()
+
+    def take_frame(self):
+        # GUI iş parçacığında çağrılır: en yeni kareyi al ve yeni sinyallere izin ver
+        with self._frame_lock:
+            frame, self._latest_frame = self._latest_frame, None
+            self._frame_pending = False
+        return frame
+
+    def cancel(self):
+        self.control.cancel()
+
+    def pause(self):
+        self.control.pause()
 
-    def send_message(self, message):
-        self.update_signal.emit(message)  # Her iterasyonda sinyal gönder
+    def resume(self):
+        self.control.resume()
 
     def run(self):
-        self.pso.optimize()
-        final_message = f"PSO Completed\nBest Position: {self.pso.global_best_position}\nBest Score: {self.pso.global_best_score}"
+        try:
+            if self.resume_run:
+                self.pso.resume()
+            else:
+                self.pso.optimize()
+        except Exception as e:
+            self.update_signal.emit(f"PSO error: {e}")
+            return
+        final_message = f"PSO Completed ({self.pso.stop_reason})\nBest Position: {self.pso.global_best_position}\nBest Score: {self.pso.global_best_score}"
+        if self.dropped_frames:
+            # GUI'nin gösteremeden atladığı önizleme kareleri (GIF'e hepsi yazılmıştır)
+            final_message += f"\nSkipped preview frames: {self.dropped_frames}"
         self.finished_signal.emit(final_message)
+
+
+class PreviewThread(QThread):
+    # Fonksiyon önizlemesini GUI'yi bekletmeden (diskten okuyarak ya da çizerek) hazırlar
+    ready_signal = pyqtSignal(object, object)  # (func, bounds) anahtarı, PIL görüntüsü
+
+    def __init__(self, cache, func, bounds):
+        super().__init__()
+        self.cache = cache
+        self.func = func
+        self.bounds = bounds
+
+    def run(self):
+        try:
+            image = self.cache.load(self.func, self.bounds)
+            self.ready_signal.emit((self.func, self.bounds), image)
+        except Exception as e:
+            print(f"Error in PreviewThread: {e}")
@@ -0,0 +1,94 @@
+import multiprocessing
+import queue
+import threading
+
+# Her render sürecinde bir kez kurulan çizici (PSO kopyası); figürler süreç boyunca yeniden kullanılır
+_renderer = None
+
+
+class SwarmSnapshot:
+    # Bir iterasyonun çizimi için gereken hafif durum: konumlar, gBest ve parametreler.
+    # options çiziciye aynen aktarılır (ör. synchronous=True).
+    def __init__(self, iteration, positions, gbest_position, gbest_score, w, c1, c2, **options):
+        self.iteration = iteration
+        self.positions = positions
+        self.gbest_position = gbest_position
+        self.gbest_score = gbest_score
+        self.w = w
+        self.c1 = c1
+        self.c2 = c2
+        self.options = options
+
+    @classmethod
+    def from_swarm(cls, iteration, swarm, w, c1, c2, **options):
+        # Optimizasyon aynı dizileri yerinde güncellemeye devam ettiği için kopya alınır
+        return cls(iteration, swarm.positions.copy(), swarm.gbest_position.copy(), swarm.gbest_score, w, c1, c2,
+                   **options)
+
+
+def _init_worker(renderer):
+    global _renderer
+    _renderer = renderer
+
+
+def _render_snapshot(snapshot):
+    return _renderer.render_snapshot(snapshot)
+
+
+class RenderPipeline:
+    """Optimizasyon döngüsünü çizimden ayıran üretici/tüketici hattı.
+
+    Optimizer submit() ile anlık görüntüleri gönderir; render süreçleri bunları
+    paralel olarak karelere çevirir, toplayıcı iş parçacığı kareleri iterasyon
+    sırasıyla sinks içindeki fonksiyonlara (ör. GifStreamWriter.append) verir.
+
+    renderer: render_snapshot(snapshot) -> [sink başına kare listesi] metodu olan,
+        pickle edilebilir nesne (PSO). Her sürece bir kez kopyalanır.
+    queue_size: Aynı anda işlenmekte olan en fazla anlık görüntü sayısı; dolunca
+        submit() bekler, böylece bellek kullanımı sınırlı kalır.
+    """
+
+    def __init__(self, renderer, sinks, workers=None, queue_size=None):
+        self.sinks = sinks
+        self.workers = workers or multiprocessing.cpu_count()
+        self._pool = multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(renderer,))
+        self._pending = queue.Queue(maxsize=queue_size or 2 * self.workers)
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def submit(self, snapshot):
+        self._pending.put(self._pool.apply_async(_render_snapshot, (snapshot,)))
+
+    def _collect(self):
+        # Sonuçlar gönderildikleri sırayla beklenir, böylece kareler sıralı yazılır
+        while True:
+            result = self._pending.get()
+            if result is None:
+                self._pending.task_done()
+                break
+            try:
+                for sink, frames in zip(self.sinks, result.get()):
+                    for frame in frames:
+                        sink(frame)
+            except Exception as e:
+                print(f"Error in render pipeline: {e}")
+            self._pending.task_done()
+
+    def drain(self):
+        # Gönderilmiş tüm anlık görüntüler çizilip sink'lere verilene kadar bekle (ör. checkpoint öncesi)
+        self._pending.join()
+
+    def close(self):
+        if self._pool is None:
+            return
+        self._pending.put(None)
+        self._collector.join()
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
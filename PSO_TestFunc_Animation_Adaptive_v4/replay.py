@@ -0,0 +1,43 @@
+import argparse
+
+import functions
+from animation_writer import GifStreamWriter
+from pso import PSO
+from trajectory import Trajectory
+
+
+def replay(trajectory_path, output_path='replay_animation.gif', output_path_3d='replay_3d_animation.gif', every=1,
+           landscape_cache_dir=None):
+    # Kaydedilmiş bir koşuyu optimizasyonu tekrar çalıştırmadan yeniden çizer
+    trajectory = Trajectory(trajectory_path)
+    meta = trajectory.meta
+    func = getattr(functions, meta["function"], None)
+    if func is None:
+        raise ValueError(f"functions.py içinde '{meta['function']}' bulunamadı")
+
+    pso = PSO(func, meta["dimensions"], meta["bounds"], meta["num_particles"], len(trajectory),
+              landscape_cache_dir=landscape_cache_dir, output_path=output_path, output_path_3d=output_path_3d)
+
+    with GifStreamWriter(output_path) as writer, GifStreamWriter(output_path_3d) as writer_3d:
+        for snapshot in trajectory.snapshots(every):
+            frames, frames_3d = pso.render_snapshot(snapshot)
+            for frame in frames:
+                writer.append(frame)
+            for frame in frames_3d:
+                writer_3d.append(frame)
+
+    print(f"GIF kaydedildi: {output_path}")
+    print(f"GIF kaydedildi: {output_path_3d}")
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kaydedilmiş PSO koşusunu GIF olarak yeniden çiz")
+    parser.add_argument("trajectory_path")
+    parser.add_argument("-o", "--output", default="replay_animation.gif")
+    parser.add_argument("--output-3d", default="replay_3d_animation.gif")
+    parser.add_argument("--every", type=int, default=1, help="Her kaç iterasyonda bir kare çizileceği")
+    parser.add_argument("--landscape-cache", default=".landscape_cache")
+    args = parser.parse_args()
+
+    replay(args.trajectory_path, args.output, args.output_3d, every=args.every, landscape_cache_dir=args.landscape_cache)
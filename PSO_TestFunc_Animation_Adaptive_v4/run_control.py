@@ -0,0 +1,40 @@
+import threading
+
+
+class RunControl:
+    """optimize() döngüsünü başka bir iş parçacığından (ör. GUI) yönetmek için
+    iş birliğine dayalı iptal / duraklatma.
+
+    Döngü her iterasyonun başında checkpoint() çağırır: duraklatılmışsa
+    resume() ya da cancel() gelene kadar orada bekler, iptal edildiyse True
+    döner ve döngü temiz biçimde (GIF'ler kapatılarak) sona erer. Çağrılar
+    iş parçacığı güvenlidir; iptal edilen koşu tekrar başlatılamaz.
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._running.set()  # Duraklatılmış döngü de uyandırılır
+
+    def pause(self):
+        if not self._cancelled.is_set():
+            self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def checkpoint(self):
+        self._running.wait()
+        return self._cancelled.is_set()
@@ -0,0 +1,70 @@
+import hashlib
+import os
+
+import numpy as np
+
+from functions import evaluate_grid
+
+# (fonksiyon, bounds, çözünürlük) -> Landscape; süreç boyunca bir kez hesaplanır
+_landscapes = {}
+
+
+class Landscape:
+    # Çizimlerde kullanılan sabit fonksiyon yüzeyi: 2D ızgara (X, Y, Z) ve y=0 kesiti (x, line)
+    def __init__(self, x, Z, line):
+        self.x = x
+        self.X, self.Y = np.meshgrid(x, x)
+        self.Z = Z
+        self.line = line
+        for array in (self.x, self.X, self.Y, self.Z, self.line):
+            array.flags.writeable = False
+
+
+def _function_key(func):
+    # Aynı isimli fakat farklı tanımlı fonksiyonlar (ör. A=10 / A=30 rastrigin) karışmasın;
+    # A gibi parametreler varsayılan argüman olduğunda co_consts'ta değil __defaults__'ta durur
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+    defaults = repr((func.__defaults__, func.__kwdefaults__))
+    digest = hashlib.sha1(code.co_code + repr(code.co_consts).encode() + defaults.encode()).hexdigest()[:12]
+    return f"{func.__name__}_{digest}"
+
+
+def _cache_path(func, bounds, resolution, cache_dir):
+    key = _function_key(func)
+    if cache_dir is None or key is None:
+        return None
+    return os.path.join(cache_dir, f"{key}_{float(bounds[0]):g}_{float(bounds[1]):g}_{resolution}.npz")
+
+
+def get_landscape(func, bounds, resolution=100, cache_dir=None):
+    key = (func, float(bounds[0]), float(bounds[1]), resolution)
+    if key in _landscapes:
+        return _landscapes[key]
+
+    x = np.linspace(bounds[0], bounds[1], resolution)
+    path = _cache_path(func, bounds, resolution, cache_dir)
+    if path is not None and os.path.exists(path):
+        with np.load(path) as data:
+            landscape = Landscape(x, data["Z"], data["line"])
+    else:
+        X, Y = np.meshgrid(x, x)
+        # Gürültülü fonksiyonlar rng verilmeden çağrılır: yüzey hiçbir koşunun gürültü akışını tüketmez
+        Z = evaluate_grid(func, X, Y)
+        line = np.asarray(func(np.column_stack([x, np.zeros_like(x)])), dtype=float)
+        landscape = Landscape(x, Z, line)
+        if path is not None:
+            save_landscape(landscape, path)
+
+    _landscapes[key] = landscape
+    return landscape
+
+
+def save_landscape(landscape, path):
+    # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazıp yer değiştir
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, Z=landscape.Z, line=landscape.line)
+    os.replace(tmp_path, path)
@@ -0,0 +1,105 @@
+import time
+
+
+class ProgressEvent:
+    # Bir iterasyonun sonundaki durum; konsol, GUI ve kayıtçılar ihtiyaç duyduğu alanı kullanır
+    def __init__(self, iteration, max_iter, w, c1, c2, gbest_score, gbest_position, elapsed, evaluations,
+                 stop_reason=None):
+        self.iteration = iteration
+        self.max_iter = max_iter
+        self.w = w
+        self.c1 = c1
+        self.c2 = c2
+        self.gbest_score = gbest_score
+        self.gbest_position = gbest_position
+        self.elapsed = elapsed
+        self.evaluations = evaluations
+        self.stop_reason = stop_reason
+
+    @property
+    def final(self):
+        return self.stop_reason is not None or self.iteration >= self.max_iter
+
+    def format(self, score_format='.2e'):
+        return (f"Iter {self.iteration}/{self.max_iter}, w={self.w:.4f}, c1={self.c1:.4f}, c2={self.c2:.4f}, "
+                f"Best Score: {self.gbest_score:{score_format}}")
+
+    def as_dict(self):
+        return dict(vars(self), gbest_position=list(map(float, self.gbest_position)))
+
+
+class _Subscription:
+    def __init__(self, callback, min_interval, every):
+        self.callback = callback
+        self.min_interval = min_interval
+        self.every = every
+        self.last_time = None
+        self.pending = None
+
+
+class ProgressReporter:
+    """İterasyon ilerleme olaylarını abonelere dağıtan yayıncı.
+
+    Her abone subscribe(callback, min_interval, every) ile kendi hızını seçer:
+    son teslimden bu yana min_interval saniye geçmemişse ya da iterasyon
+    every'nin katı değilse olay teslim edilmez, bekleyen olay olarak en
+    yenisiyle değiştirilir (coalescing). Son iterasyonun (ya da erken
+    durulan iterasyonun) olayı her aboneye mutlaka teslim edilir; close()
+    teslim edilmemiş bekleyen olayları da gönderir. Abone yoksa olay hiç
+    oluşturulmaz.
+    """
+
+    def __init__(self):
+        self._subscriptions = []
+        self._start = time.perf_counter()
+
+    def subscribe(self, callback, min_interval=0.0, every=1):
+        self._subscriptions.append(_Subscription(callback, min_interval, every))
+
+    def start(self):
+        self._start = time.perf_counter()
+        for subscription in self._subscriptions:
+            subscription.last_time = None
+            subscription.pending = None
+
+    def publish(self, iteration, max_iter, w, c1, c2, swarm, evaluations, stop_reason=None):
+        if not self._subscriptions:
+            return
+        now = time.perf_counter()
+        event = ProgressEvent(iteration, max_iter, w, c1, c2, float(swarm.gbest_score), swarm.gbest_position.copy(),
+                              now - self._start, evaluations, stop_reason)
+        for subscription in self._subscriptions:
+            due = (event.final or
+                   (iteration % subscription.every == 0 and
+                    (subscription.last_time is None or now - subscription.last_time >= subscription.min_interval)))
+            if due:
+                subscription.pending = None
+                subscription.last_time = now
+                self._deliver(subscription, event)
+            else:
+                subscription.pending = event
+
+    def close(self):
+        for subscription in self._subscriptions:
+            if subscription.pending is not None:
+                event, subscription.pending = subscription.pending, None
+                self._deliver(subscription, event)
+
+    def _deliver(self, subscription, event):
+        try:
+            subscription.callback(event)
+        except Exception as e:
+            print(f"Error in progress subscriber: {e}")
+
+
+def make_progress(progress):
+    # progress: None, bir abone fonksiyonu ya da fonksiyon / (fonksiyon, min_interval) listesi
+    reporter = ProgressReporter()
+    if progress is None:
+        return reporter
+    for subscriber in progress if isinstance(progress, list) else [progress]:
+        if isinstance(subscriber, tuple):
+            reporter.subscribe(*subscriber)
+        else:
+            reporter.subscribe(subscriber)
+    return reporter
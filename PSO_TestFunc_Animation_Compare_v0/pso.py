@@ -1,34 +1,23 @@
 import numpy as np
-from matplotlib import pyplot as plt
-from PIL import Image
-from io import BytesIO
-
-class Particle:
-    def __init__(self, dimension, bounds):
-        self.dimension = dimension
-        self.bounds = bounds
-        self.position = np.random.uniform(bounds[0], bounds[1], dimension)
-        self.velocity = np.random.uniform(-1, 1, dimension)
-        self.best_position = np.copy(self.position)
-        self.best_score = float('inf')
-
-    def update_velocity(self, w, c1, c2, pBest, gBest, velocity_rate):
-        r1, r2 = np.random.rand(2)
-        inertia = w * self.velocity
-        cognitive = c1 * r1 * (self.best_position - self.position)
-        social = c2 * r2 * (gBest - self.position)
-
-        self.velocity += inertia + cognitive + social
-        max_velocity = self.bounds[1] * velocity_rate / 100
-        # print(f"Velocity Limit: [{-max_velocity}, {max_velocity}]")
-        self.velocity = np.clip(self.velocity, -max_velocity, max_velocity)
-
-    def update_position(self):
-        self.position += self.velocity
-        self.position = np.clip(self.position, self.bounds[0], self.bounds[1])
+from animation_writer import GifStreamWriter
+from checkpoint import capture_state, load_checkpoint, make_checkpointer, restore_state
+from evaluators import make_evaluator
+from functions import optimum_position
+from landscape import get_landscape
+from profiling import NullProfiler, make_profiler
+from progress import make_progress
+from render_pipeline import RenderPipeline, SwarmSnapshot
+from render_schedule import make_render_schedule
+from seeding import bind_noise, evaluate_runs, run_generators
+from stopping import make_stop_criteria
+from swarm import BatchSwarm, Swarm, convergence_summary
+from topology import make_batch_topology, make_topology
+from trajectory import TrajectoryRecorder
+
+# matplotlib ve rendering.py ilk figür kurulurken yüklenir (bkz. _build_*_view); headless koşular yüklemez
 
 class PSO:
-    def __init__(self, num_particle, max_iter, func, dimension, bounds, w_min, w_max, c1_init, c1_final, c2_init, c2_final, velocity_rate):
+    def __init__(self, num_particle, max_iter, func, dimension, bounds, w_min, w_max, c1_init, c1_final, c2_init, c2_final, velocity_rate, landscape_cache_dir=None, reuse_figures=True, output_path=None, headless=False, render_every=1, render_workers=0, trajectory_path=None, evaluator='vectorized', evaluator_workers=None, fitness_cache=None, stop_criteria=None, topology=None, backend='numpy', profile=None, progress=None, print_interval=0.0, checkpoint=None, seed=None):
         # print(f"Gelen Değerler, num_particle: {num_particle}, max_iter: {max_iter}, func: {func}, dimension: {dimension}, bounds: {bounds}, w: {w}, c1: {c1}, c2: {c2}")
         # print(f"Function Test, f(1,1):{func([1,1])}, f(0,0):{func([0,0])})")
         self.num_particle = num_particle
@@ -43,90 +32,282 @@ class PSO:
         self.c2_init = c2_init
         self.c2_final = c2_final
         self.velocity_rate = velocity_rate
-
-        self.swarm = [Particle(dimension, bounds) for _ in range(num_particle)]
-        self.gBest_position = np.random.uniform(bounds[0], bounds[1], dimension)
-        self.gBest_score = float('inf')
+        self.landscape_cache_dir = landscape_cache_dir  # Verilirse yüzey ızgarası diske de kaydedilir
+        self.reuse_figures = reuse_figures  # False: her karede figür baştan kurulur (eski davranış)
+        self._views = {}
+        self.output_path = output_path  # Verilirse kareler bellekte tutulmaz, üretildikçe bu GIF'e yazılır
+        self.headless = headless  # True: hiç kare çizilmez / yazılmaz, iterasyon çıktısı basılmaz
+        self.render_every = render_every  # int k, 'log', 'improve' veya f(iteration, improved)
+        self.render_schedule = make_render_schedule(render_every, max_iter)
+        self.render_workers = render_workers  # >0: kareler bu sayıda ayrı süreçte, optimizasyonla eş zamanlı çizilir
+        self.trajectory_path = trajectory_path  # Verilirse tüm sürü geçmişi bu klasöre kaydedilir (bkz. replay.py)
+        # Tekrarlanabilirlik: seed (int, SeedSequence ya da np.random.Generator) sürü, topoloji ve gürültü
+        # için ayrı akışlara bölünür (bkz. seeding.py); aynı seed süreçten bağımsız olarak aynı koşuyu verir
+        self.seed = seed
+        self.rngs = run_generators(seed)
+        # Gürültülü fonksiyonlar (ör. noisy_rastrigin) bu koşunun gürültü akışına bağlanarak değerlendirilir;
+        # func'ın kendisi değiştirilmez (aynı fonksiyonla kurulan diğer PSO'ları etkilemez)
+        self.objective = bind_noise(func, self.rngs["noise"])
+        # 'vectorized', 'serial', 'thread', 'process' ya da bir Evaluator nesnesi (bkz. evaluators.py)
+        # fitness_cache: FitnessCache ya da 'exact' / 'quantized' / 'mask'; aynı konum tekrar değerlendirilmez
+        # backend='numba': sürü adımı ve functions.py fonksiyonları derlenmiş kernel'lerle (bkz. kernels.py)
+        self.backend = backend
+        if backend == 'numba' and evaluator == 'vectorized':
+            evaluator = 'numba'
+        self.evaluator = make_evaluator(self.objective, evaluator, evaluator_workers, cache=fitness_cache)
+        # Erken durdurma: StopCriteria ya da argümanları (dict); durma sebebi stop_reason'da raporlanır
+        self.stop_criteria = make_stop_criteria(stop_criteria)
+        # Aşama süreleri / bellek ölçümü: True, Profiler argümanları (dict), hook(name, seconds) ya da Profiler
+        self.profiler = make_profiler(profile)
+        # İlerleme olayları: abone fonksiyonu ya da (fonksiyon, min_interval) listesi (bkz. progress.py).
+        # Konsol çıktısı da bir abonedir; print_interval > 0 ise en fazla o kadar saniyede bir basılır.
+        self.progress = make_progress(progress)
+        if not headless:
+            self.progress.subscribe(lambda event: print(event.format()), min_interval=print_interval)
+        # Periyodik checkpoint: dosya yolu, Checkpointer argümanları (dict) ya da Checkpointer (bkz. checkpoint.py)
+        self.checkpointer = make_checkpointer(checkpoint)
+        self._resume_state = None
+        self.stop_reason = None
+        self.stop_iteration = None
+        # None / 'global': gBest, 'ring', 'von_neumann', 'random', 'dynamic' ya da Topology nesnesi (lbest)
+        self.topology_spec = topology  # optimize_batch her koşu için kendi topolojisini kurar
+        self.topology = make_topology(topology, num_particle, rng=self.rngs["topology"])
+
+        # Eski Particle davranışı korunur: parçacık başına tek r1/r2 ve v += w*v + ...
+        self.swarm = Swarm(num_particle, dimension, bounds, velocity_rate=velocity_rate, random_per_dimension=False,
+                           accumulate_velocity=True, topology=self.topology, backend=backend,
+                           rng=self.rngs["swarm"])
 
         self.frames_contour = []
 
+    def __getstate__(self):
+        # Render süreçlerine yalnızca çizim için gerekenler kopyalanır (figürler vb. hariç)
+        state = self.__dict__.copy()
+        state.update(_views={}, profiler=NullProfiler(), progress=None, render_schedule=None, evaluator=None, frames_contour=[])
+        return state
+
+    @property
+    def gBest_position(self):
+        return self.swarm.gbest_position
+
+    @property
+    def gBest_score(self):
+        return self.swarm.gbest_score
+
+    def resume(self, path=None):
+        # Aynı ayarlarla kurulmuş PSO'da checkpoint'ten devam: kaydedildiği optimize metodu kalınan iterasyondan sürer
+        self._resume_state = load_checkpoint(path or self.checkpointer.path)
+        return getattr(self, str(self._resume_state["method"]))()
+
+    def _restore_checkpoint(self, writers, recorder):
+        # resume() ile başlatıldıysa durumu geri yükler; döngünün başlayacağı iterasyondan bir öncekini döndürür
+        if self.checkpointer is not None:
+            self.checkpointer.start()
+        state, self._resume_state = self._resume_state, None
+        return 0 if state is None else restore_state(self, state, writers, recorder)
+
+    def _save_checkpoint(self, iteration, method, writers, recorder, pipeline):
+        # Render hattındaki kareler yazılmadan GIF uzunluğu checkpoint'e alınmaz
+        if pipeline is not None:
+            pipeline.drain()
+        self.checkpointer.save(capture_state(self, iteration, method, writers, recorder))
+
     def optimize(self):
-        for iter in range(1, self.max_iter + 1):
+        writer = GifStreamWriter(self.output_path, duration=300) if self.output_path and not self.headless else None
+        pipeline = None
+        if self.render_workers and not self.headless:
+            sink = writer.append if writer is not None else self.frames_contour.append
+            pipeline = RenderPipeline(self, [sink], workers=self.render_workers)
+        self.profiler.start()
+        self.progress.start()
+        self.stop_criteria.start(self.func, self.dimension)
+        self.stop_reason, self.stop_iteration = 'max_iter', self.max_iter
+        recorder = None
+        if self.trajectory_path:
+            recorder = TrajectoryRecorder(self.trajectory_path, self.num_particle, self.dimension, self.max_iter,
+                                          resume=self._resume_state is not None,
+                                          function=self.func.__name__, bounds=[float(b) for b in self.bounds],
+                                          velocity_rate=self.velocity_rate)
+        start = self._restore_checkpoint([writer], recorder)
+        for iter in range(start + 1, self.max_iter + 1):
+
+            w, c1, c2 = self.coefficients(iter)
+
+            # Tüm sürüyü tek bir vektörel çağrıyla değerlendir, ardından hız/konum güncelle
+            previous_best = self.gBest_score
+            with self.profiler.phase('evaluation'):
+                scores = self.evaluator(self.swarm.positions)
+            with self.profiler.phase('update'):
+                self.swarm.evaluate(scores)
+                self.swarm.step(w, c1, c2)
+
+            if recorder is not None:
+                with self.profiler.phase('record'):
+                    recorder.record(self.swarm, w, c1, c2)
+
+            with self.profiler.phase('stop_check'):
+                stop_reason = self.stop_criteria.check(self.swarm, self.evaluator.evaluations)
+
+            # Kareler yalnızca çizim takviminin seçtiği iterasyonlarda (ve durulan iterasyonda) üretilir
+            if not self.headless and (self.render_schedule(iter, self.gBest_score < previous_best) or stop_reason):
+                if pipeline is not None:
+                    with self.profiler.phase('render_submit'):
+                        pipeline.submit(SwarmSnapshot.from_swarm(iter, self.swarm, w, c1, c2))
+                else:
+                    self.plot_swarm_contour(iter, w, c1, c2, show_particles=True)
+                    if writer is not None:
+                        with self.profiler.phase('gif'):
+                            self.write_frames(writer)
+            with self.profiler.phase('progress'):
+                self.progress.publish(iter, self.max_iter, w, c1, c2, self.swarm, self.evaluator.evaluations, stop_reason)
+
+            self.profiler.sample_memory()
+
+            if self.checkpointer is not None and not stop_reason and self.checkpointer.due(iter):
+                with self.profiler.phase('checkpoint'):
+                    self._save_checkpoint(iter, 'optimize', [writer], recorder, pipeline)
+
+            if stop_reason:
+                self.stop_reason, self.stop_iteration = stop_reason, iter
+                break
+
+        # Kuyrukta bekleyen kareler çizilip yazılana kadar bekle
+        if pipeline is not None:
+            with self.profiler.phase('render_wait'):
+                pipeline.close()
+        if recorder is not None:
+            recorder.close()
+        self.progress.close()
+        self.evaluator.close()
+        self.profiler.count('evaluations', self.evaluator.evaluations)
+        self.profiler.stop()
 
-            w = self.w_max - (self.w_max - self.w_min) * (iter / self.max_iter)
-            c1 = self.c1_init - (self.c1_init - self.c1_final) * (iter / self.max_iter)
-            c2 = self.c2_init + (self.c2_final - self.c2_init) * (iter / self.max_iter)
+        print(f"{self.func.__name__} function best position: {self.gBest_position}")
+        print(f"{self.func.__name__} function best score: {self.gBest_score}")
+        print(f"{self.func.__name__} function evaluations: {self.evaluator.evaluations} ({self.evaluator.seconds:.2f}s)")
+        print(f"{self.func.__name__} stopped at iteration {self.stop_iteration}: {self.stop_reason}")
+        if self.profiler.enabled:
+            print(self.profiler.report())
+
+        if writer is not None:
+            writer.close()
+            print(f"GIF kaydedildi: {self.output_path}")
+            return self.output_path
+        return self.frames_contour
 
-            for particle in self.swarm:
 
-                fitness = self.func(particle.position)
-                if fitness < particle.best_score:
-                    particle.best_score = fitness
-                    particle.best_position = np.copy(particle.position)
+    def render_snapshot(self, snapshot):
+        # Render sürecinde çalışır: anlık görüntüyü bu kopyaya uygula ve kareleri döndür
+        self.swarm.positions = snapshot.positions
+        self.swarm.gbest_position = snapshot.gbest_position
+        self.swarm.gbest_score = snapshot.gbest_score
+
+        self.plot_swarm_contour(snapshot.iteration, snapshot.w, snapshot.c1, snapshot.c2, show_particles=True,
+                                **snapshot.options)
+
+        frames = [list(self.frames_contour)]
+        self.frames_contour.clear()
+        return frames
+
+    def coefficients(self, iter):
+        w = self.w_max - (self.w_max - self.w_min) * (iter / self.max_iter)
+        c1 = self.c1_init - (self.c1_init - self.c1_final) * (iter / self.max_iter)
+        c2 = self.c2_init + (self.c2_final - self.c2_init) * (iter / self.max_iter)
+        return w, c1, c2
+
+    def optimize_batch(self, seeds):
+        # Aynı konfigürasyonu her seed için bağımsız bir sürüyle, tümünü tek (R, N, D) dizisinde çalıştırır.
+        # Çizim yapılmaz; koşu başına gBest eğrileri ve mean/median/best/worst eğrileri döner.
+        # Her koşu, aynı seed'le tek başına kurulan PSO'nun sürü, topoloji ve gürültü akışlarını kullanır
+        streams = [run_generators(seed) for seed in seeds]
+        noise = [s["noise"] for s in streams]
+        topology = make_batch_topology(self.topology_spec, self.num_particle, [s["topology"] for s in streams])
+        swarm = BatchSwarm(seeds, self.num_particle, self.dimension, self.bounds, velocity_rate=self.velocity_rate,
+                           random_per_dimension=False, accumulate_velocity=True, topology=topology,
+                           backend=self.backend, rngs=[s["swarm"] for s in streams])
+        curves = np.empty((swarm.num_runs, self.max_iter))
+        for iter in range(1, self.max_iter + 1):
+            w, c1, c2 = self.coefficients(iter)
+            swarm.evaluate(evaluate_runs(self.func, swarm.positions, noise))
+            swarm.step(w, c1, c2)
+            curves[:, iter - 1] = swarm.gbest_score
 
-                if fitness < self.gBest_score:
-                    self.gBest_score = fitness
-                    self.gBest_position = np.copy(particle.position)
+        return dict(convergence_summary(curves), seeds=swarm.seeds, curves=curves,
+                    gbest_positions=swarm.gbest_position, gbest_scores=swarm.gbest_score)
 
-            for particle in self.swarm:
-                particle.update_velocity(w, c1, c2, particle.best_position, self.gBest_position, self.velocity_rate)
-                particle.update_position()
+    def write_frames(self, writer):
+        # Bekleyen kareleri yazıcıya aktar ve listeyi boşalt
+        try:
+            for frame in self.frames_contour:
+                writer.append(frame)
+        except Exception as e:
+            print(f"Error in write_frames: {e}")
+        self.frames_contour.clear()
 
-            self.plot_swarm_contour(iter, w, c1, c2, show_particles=True)
-            print(f"Iter {iter}/{self.max_iter}, w={w:.4f}, c1={c1:.4f}, c2={c2:.4f}, Best Score: {self.gBest_score:.2e}")
+    def _get_view(self, name, show_particles, build):
+        # reuse_figures açıkken figür ve sabit arka plan çalışma boyunca bir kez kurulur
+        key = (name, show_particles)
+        if self.reuse_figures and key in self._views:
+            return self._views[key]
+        view = build(show_particles)
+        if self.reuse_figures:
+            self._views[key] = view
+        return view
 
-        print(f"{self.func.__name__} function best position: {self.gBest_position}")
-        print(f"{self.func.__name__} function best score: {self.gBest_score}")
-
-        return self.frames_contour
+    def _build_contour_view(self, show_particles):
+        from matplotlib.figure import Figure
+        from rendering import FrameView
 
+        # Yüzey her karede yeniden hesaplanmaz, önbellekten gelir
+        landscape = get_landscape(self.func, self.bounds, cache_dir=self.landscape_cache_dir)
+        X, Y, Z = landscape.X, landscape.Y, landscape.Z
 
-    def plot_swarm_contour(self, iter, w, c1, c2, show_particles=False):
-        try:
-            x = np.linspace(self.bounds[0], self.bounds[1], 100)
-            y = np.linspace(self.bounds[0], self.bounds[1], 100)
-            X, Y = np.meshgrid(x, y)
-            Z = np.array([self.func([x, y]) for x, y in zip(np.ravel(X), np.ravel(Y))]).reshape(X.shape)
+        fig = Figure(figsize=(8, 6))  # 6,4
+        ax = fig.subplots()
+        cp = ax.contourf(X, Y, Z, cmap='viridis', levels=50, alpha=0.8)
 
-            fig, ax = plt.subplots(figsize=(8, 6))  # 6,4
-            cp = ax.contourf(X, Y, Z, cmap='viridis', levels=50, alpha=0.8)
+        # cmap alabileceği değerler; 'viridis', 'plasma', 'inferno', 'magma', 'cividis'
 
-            # cmap alabileceği değerler; 'viridis', 'plasma', 'inferno', 'magma', 'cividis'
+        # Colorbar oluştur ve label ekle
+        color_bar = fig.colorbar(cp, ax=ax, shrink=0.85, aspect=10)
+        color_bar.set_label(f"Fonksiyon Değeri ({self.func.__name__})", fontsize=12)
 
-            #fig.colorbar(cp, ax=ax, shrink=0.85, aspect=10)
+        # Eksen etiketlerini ekleyelim
+        ax.set_xlabel("X", fontsize=12)
+        ax.set_ylabel("Y", fontsize=12)
 
-            # Colorbar oluştur ve label ekle
-            color_bar = fig.colorbar(cp, ax=ax, shrink=0.85, aspect=10)
-            color_bar.set_label(f"Fonksiyon Değeri ({self.func.__name__})", fontsize=12)
+        title = ax.set_title("", fontsize=10, loc='center', fontweight='bold')
 
-            # Eksen etiketlerini ekleyelim
-            ax.set_xlabel("X", fontsize=12)
-            ax.set_ylabel("Y", fontsize=12)
+        particles = gbest = optimum = None
+        if show_particles:
+            particles = ax.scatter([], [], color='red', marker='o', s=50, alpha=0.6, label='Particles', zorder=1)
+            gbest = ax.scatter([], [], color='blue', marker='H', s=150, label='Global Best', zorder=3)
 
-            # Parametreleri ve iterasyon numarasını ekleyelim
-            #ax.set_title(f"Iteration= {iteration}, w={self.w}, c1={self.c1}, c2={self.c2}", fontsize=12, loc='center')
-            ax.set_title(f"Iteration= {iter}, w={w:.2f}, c1={c1:.2f}, c2={c2:.2f}, p={self.num_particle}, Best Score={self.gBest_score:.4f}", fontsize=10, loc='center', fontweight='bold')
+        optimum_xy = optimum_position(self.func, 2)
+        if optimum_xy is not None:
+            optimum = ax.scatter(optimum_xy[0], optimum_xy[1], color='green', marker='s', s=100, label='Optimum', zorder=2)
 
-            if show_particles:
-                ax.scatter([p.position[0] for p in self.swarm], [p.position[1] for p in self.swarm], color='red', marker='o', s=50, alpha=0.6, label='Particles', zorder=1)
-                ax.scatter(self.gBest_position[0], self.gBest_position[1], color='blue', marker='H', s=150,
-                           label='Global Best', zorder=3)
+        ax.set_xlim(self.bounds[0], self.bounds[1])
+        ax.set_ylim(self.bounds[0], self.bounds[1])
 
+        return FrameView(fig, {'title': title, 'particles': particles, 'gbest': gbest, 'optimum': optimum},
+                         blit=self.reuse_figures)
 
-            if hasattr(self.func, "optimum_position"):
-                ax.scatter(self.func.optimum_position[0], self.func.optimum_position[1], color='green', marker='s', s=100, label='Optimum', zorder=2)
+    def plot_swarm_contour(self, iter, w, c1, c2, show_particles=False):
+        try:
+            view = self._get_view('contour', show_particles, self._build_contour_view)
 
-            #x_margin = (self.bounds[1] - self.bounds[0]) * 0.1  # %10 marj ekleyerek genişletiyoruz
-            #plt.xlim(self.bounds[0] - x_margin, self.bounds[1] + x_margin)
+            # Parametreleri ve iterasyon numarasını ekleyelim
+            view.artists['title'].set_text(f"Iteration= {iter}, w={w:.2f}, c1={c1:.2f}, c2={c2:.2f}, p={self.num_particle}, Best Score={self.gBest_score:.4f}")
 
-            plt.xlim(self.bounds[0], self.bounds[1])
-            plt.ylim(self.bounds[0], self.bounds[1])
-            plt.close(fig)
+            if show_particles:
+                view.artists['particles'].set_offsets(self.swarm.positions[:, :2])
+                view.artists['gbest'].set_offsets(self.gBest_position[:2])
 
-            buf = BytesIO()
-            fig.savefig(buf, format="PNG")
-            self.frames_contour.append(Image.open(buf))
+            with self.profiler.phase('draw'):
+                view.draw()
+            with self.profiler.phase('encode'):
+                self.frames_contour.append(view.encode())
 
         except Exception as e:
             print(f"Error in plot_swarm_contour: {e}")
-
@@ -0,0 +1,43 @@
+from io import BytesIO
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+
+class FrameView:
+    # Bir çizimin figürü ve her karede değişen artist'leri (parçacıklar, gBest, başlık).
+    # blit=True iken sabit arka plan (contourf, colorbar, legend...) yalnızca bir kez çizilir,
+    # sonraki karelerde arka plan geri yüklenip sadece dinamik artist'ler çizilir.
+    def __init__(self, fig, artists, blit=True):
+        self.fig = fig
+        self.canvas = FigureCanvasAgg(fig)
+        self.artists = {name: artist for name, artist in artists.items() if artist is not None}
+        self.blit = blit
+        self._background = None
+        if blit:
+            for artist in self.artists.values():
+                artist.set_animated(True)
+
+    def render(self):
+        self.draw()
+        return self.encode()
+
+    def draw(self):
+        if self.blit:
+            if self._background is None:
+                self.canvas.draw()
+                self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+            else:
+                self.canvas.restore_region(self._background)
+            for artist in sorted(self.artists.values(), key=lambda a: a.get_zorder()):
+                self.fig.draw_artist(artist)
+        else:
+            self.canvas.draw()
+
+    def encode(self):
+        # savefig yerine hazır tampondan hızlı (düşük sıkıştırmalı) PNG üret
+        width, height = self.canvas.get_width_height()
+        image = Image.frombuffer("RGBA", (width, height), self.canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+        buf = BytesIO()
+        image.save(buf, format="PNG", compress_level=1)
+        return Image.open(buf)
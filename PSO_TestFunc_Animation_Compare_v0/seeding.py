@@ -0,0 +1,87 @@
+import inspect
+import json
+
+import numpy as np
+
+
+def seed_sequence(seed=None):
+    # seed: None (işletim sistemi entropisi), int, SeedSequence ya da np.random.Generator
+    # Generator verilirse kendi SeedSequence'i kullanılır; Generator'ın durumu tüketilmez
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return seed.bit_generator.seed_seq
+    return np.random.SeedSequence(seed)
+
+
+def spawn_generators(seed, count):
+    # Aynı seed'den her zaman aynı, birbiriyle örtüşmeyen count adet bağımsız akış
+    return [np.random.default_rng(child) for child in seed_sequence(seed).spawn(count)]
+
+
+def run_generators(seed=None):
+    """Tek bir PSO koşusunun bileşen akışları: sürü, topoloji ve gürültü.
+
+    Her bileşen kendi akışından çektiği için (ör. dinamik topoloji ya da
+    gürültülü fonksiyon eklemek) diğerlerinin çektiği sayıları değiştirmez ve
+    koşunun sonucu yalnızca seed'e bağlıdır; hangi süreçte ya da hangi sırada
+    çalıştırıldığına bağlı değildir.
+    """
+    swarm, topology, noise = spawn_generators(seed, 3)
+    return {"swarm": swarm, "topology": topology, "noise": noise}
+
+
+def keyed_seed(rng, *key):
+    # rng akışının SeedSequence'inden key'e (ör. (tur, parçacık)) bağlı alt tohum; çekiliş sırasından bağımsızdır
+    parent = rng.bit_generator.seed_seq
+    return np.random.SeedSequence(parent.entropy, spawn_key=parent.spawn_key + tuple(key))
+
+
+def takes_noise(func):
+    # Gürültülü hedef fonksiyonlar gürültü akışını rng argümanıyla alır (ör. noisy_rastrigin)
+    try:
+        return 'rng' in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class NoisyObjective:
+    """Gürültülü bir hedef fonksiyonun tek bir koşunun gürültü akışına bağlanmış hali.
+
+    Akış fonksiyona (modül düzeyindeki ortak nesneye) yazılmaz, bu nesnede
+    tutulur; böylece sonradan kurulan bir PSO daha önce kurulanların gürültü
+    akışını değiştiremez. Pickle edilebilir (süreç havuzları için).
+    """
+
+    def __init__(self, func, rng):
+        self.func = func
+        self.rng = rng
+        self.__name__ = func.__name__
+
+    def __call__(self, x):
+        return self.func(x, rng=self.rng)
+
+    def reseeded(self, seed):
+        # Aynı fonksiyonun seed'den kurulan ayrı bir akışa bağlı kopyası (süreç havuzundaki tek konum için)
+        return NoisyObjective(self.func, np.random.default_rng(seed))
+
+
+def bind_noise(func, rng):
+    # Gürültülü fonksiyonlar koşunun gürültü akışına bağlanır; gürültüsüz fonksiyonlar aynen döner
+    return NoisyObjective(func, rng) if takes_noise(func) else func
+
+
+def evaluate_runs(func, positions, noise_rngs):
+    # Toplu koşular (R, ...): gürültülü fonksiyonlarda her koşunun dilimi kendi gürültü akışıyla değerlendirilir
+    if not takes_noise(func):
+        return func(positions)
+    return np.array([func(run_positions, rng=noise) for run_positions, noise in zip(positions, noise_rngs)])
+
+
+def generator_state(rng):
+    # PCG64 durumundaki 128 bitlik tamsayılar NumPy dizisine sığmaz; checkpoint'e pickle'sız JSON metni olarak yazılır
+    return json.dumps(rng.bit_generator.state)
+
+
+def set_generator_state(rng, state):
+    rng.bit_generator.state = json.loads(str(state))
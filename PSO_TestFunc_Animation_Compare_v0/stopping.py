@@ -0,0 +1,87 @@
+import time
+
+import numpy as np
+
+from functions import optimum_value
+
+
+class StopCriteria:
+    """optimize() döngüsünü max_iter'den önce durduran kriterler.
+
+    target_score: Bu skora (ya da altına) inilince durur; 'optimum' verilirse
+        fonksiyonun bilinen optimum değeri + tolerance kullanılır.
+    stagnation: gBest bu kadar iterasyon boyunca min_improvement'tan fazla
+        iyileşmezse durur.
+    diversity: Parçacıkların merkeze ortalama uzaklığı, arama aralığının
+        (bounds[1] - bounds[0]) bu oranının altına düşerse durur.
+    max_evaluations: Fonksiyon değerlendirme bütçesi.
+    max_seconds: Duvar saati süresi (optimize() başından itibaren).
+
+    check() durma sebebini ('target', 'stagnation', 'diversity',
+    'max_evaluations', 'max_seconds') ya da None döndürür.
+    """
+
+    def __init__(self, target_score=None, tolerance=1e-6, stagnation=None, min_improvement=0.0, diversity=None,
+                 max_evaluations=None, max_seconds=None):
+        self.target_score = target_score
+        self.tolerance = tolerance
+        self.stagnation = stagnation
+        self.min_improvement = min_improvement
+        self.diversity = diversity
+        self.max_evaluations = max_evaluations
+        self.max_seconds = max_seconds
+        self.start()
+
+    def start(self, func=None, dimensions=None):
+        self._start_time = time.perf_counter()
+        self._best = float('inf')
+        self._stagnant = 0
+        self._target = self.target_score
+        if self.target_score == 'optimum':
+            optimum = optimum_value(func, dimensions) if func is not None else None
+            self._target = None if optimum is None else optimum + self.tolerance
+
+    def state_dict(self):
+        # Checkpoint için sayaçlar; max_seconds için geçen süre saklanır
+        return {"stop_best": self._best, "stop_stagnant": self._stagnant,
+                "stop_elapsed": time.perf_counter() - self._start_time}
+
+    def load_state_dict(self, state):
+        self._best = float(state["stop_best"])
+        self._stagnant = int(state["stop_stagnant"])
+        self._start_time = time.perf_counter() - float(state["stop_elapsed"])
+
+    def check(self, swarm, evaluations):
+        if self._target is not None and swarm.gbest_score <= self._target:
+            return 'target'
+
+        if self.stagnation is not None:
+            if swarm.gbest_score < self._best - self.min_improvement:
+                self._best = swarm.gbest_score
+                self._stagnant = 0
+            else:
+                self._stagnant += 1
+                if self._stagnant >= self.stagnation:
+                    return 'stagnation'
+
+        if self.diversity is not None:
+            spread = np.mean(np.linalg.norm(swarm.positions - swarm.positions.mean(axis=0), axis=1))
+            if spread < self.diversity * (swarm.bounds[1] - swarm.bounds[0]):
+                return 'diversity'
+
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return 'max_evaluations'
+
+        if self.max_seconds is not None and time.perf_counter() - self._start_time >= self.max_seconds:
+            return 'max_seconds'
+
+        return None
+
+
+def make_stop_criteria(stop_criteria):
+    # None, StopCriteria nesnesi ya da StopCriteria argümanlarından oluşan dict (ör. sweep config dosyaları)
+    if stop_criteria is None:
+        return StopCriteria()
+    if isinstance(stop_criteria, dict):
+        return StopCriteria(**stop_criteria)
+    return stop_criteria
@@ -0,0 +1,280 @@
+import numpy as np
+
+from seeding import run_generators
+
+
+class Swarm:
+    """Sürünün tüm durumunu bitişik NumPy dizilerinde tutan motor.
+
+    positions / velocities / best_positions (N, D), best_scores (N,) dizileridir.
+    Her iterasyonda hız, konum, kırpma ve pbest/gbest güncellemeleri tüm sürü
+    için tek bir vektörel (yerinde) adımda yapılır; parçacık başına Python
+    döngüsü yoktur.
+
+    velocity_rate: Verilirse hız, bounds[1] * velocity_rate / 100 ile sınırlanır.
+    random_per_dimension: True ise r1, r2 her boyut için ayrı çekilir (Adaptive_v4),
+        False ise parçacık başına tek bir r1, r2 kullanılır (Compare_v0, SYN_ASYN).
+    accumulate_velocity: True ise yeni hız eski hıza eklenir
+        (v += w*v + ...), Compare_v0 / SYN_ASYN Particle davranışı.
+    topology: None ise sosyal terim gBest'e, bir Topology verilirse her
+        parçacığın komşuluğundaki en iyi pbest'e (lbest) göre hesaplanır.
+    backend: 'numba' ise senkron adım (hız, kırpma, konum) kernels.py'deki tek
+        bir derlenmiş döngüyle yapılır; Numba kurulu değilse NumPy kullanılır.
+    rng: Sürünün np.random.Generator akışı ya da seed'i (None: rastgele). Bir
+        iterasyonun r1, r2 sayılarının tümü tek çağrıyla çekilir; asenkron
+        adımlar da num_particles adımda bir toplu çekilen bloktan okur.
+    """
+
+    def __init__(self, num_particles, dimensions, bounds, velocity_rate=None, random_per_dimension=True,
+                 accumulate_velocity=False, topology=None,
+                 backend='numpy', rng=None):
+        self.rng = np.random.default_rng(rng)
+        self.num_particles = num_particles
+        self.dimensions = dimensions
+        self.bounds = bounds
+        self.velocity_rate = velocity_rate
+        self.random_per_dimension = random_per_dimension
+        self.accumulate_velocity = accumulate_velocity
+        self.topology = topology
+        self.backend = backend
+        self._compiled = _use_kernels(backend)
+
+        shape = (num_particles, dimensions)
+        self.positions = self.rng.uniform(bounds[0], bounds[1], shape)
+        self.velocities = self.rng.uniform(-1, 1, shape)
+        self.best_positions = self.positions.copy()
+        self.best_scores = np.full(num_particles, np.inf)
+        self.gbest_position = self.rng.uniform(bounds[0], bounds[1], dimensions)
+        self.gbest_score = float('inf')
+
+        # Geçici diziler her iterasyonda yeniden oluşturulmasın diye bir kez ayrılır
+        self._cognitive = np.empty(shape)
+        self._social = np.empty(shape)
+        self._random_block = None
+        self._random_cursor = num_particles
+
+    @property
+    def max_velocity(self):
+        if self.velocity_rate is None:
+            return None
+        return self.bounds[1] * self.velocity_rate / 100
+
+    def _random_shape(self, count):
+        return (count, self.dimensions) if self.random_per_dimension else (count, 1)
+
+    def _rand_pair(self, count):
+        # r1 ve r2 tek çağrıda: (2, count, D|1)
+        r1, r2 = self.rng.random((2,) + self._random_shape(count))
+        return r1, r2
+
+    def _particle_random(self):
+        # Asenkron adımın r1, r2'si; num_particles adımlık blok bitince yenisi toplu çekilir
+        if self._random_cursor >= self.num_particles:
+            self._random_block = self._rand_pair(self.num_particles)
+            self._random_cursor = 0
+        i = self._random_cursor
+        self._random_cursor += 1
+        r1, r2 = self._random_block
+        return r1[..., i, :], r2[..., i, :]
+
+    def evaluate(self, scores):
+        # Tüm sürünün skorlarıyla pbest ve gbest güncellemesi
+        scores = np.asarray(scores, dtype=float)
+        improved = scores < self.best_scores
+        np.copyto(self.best_scores, scores, where=improved)
+        np.copyto(self.best_positions, self.positions, where=improved[:, None])
+
+        best = int(np.argmin(self.best_scores))
+        if self.best_scores[best] < self.gbest_score:
+            self.gbest_score = float(self.best_scores[best])
+            self.gbest_position[:] = self.best_positions[best]
+        return improved
+
+    def update_velocity(self, w, c1, c2):
+        r1, r2 = self._rand_pair(self.num_particles)
+
+        np.subtract(self.best_positions, self.positions, out=self._cognitive)
+        self._cognitive *= r1
+        self._cognitive *= c1
+        np.subtract(self._social_target(), self.positions, out=self._social)
+        self._social *= r2
+        self._social *= c2
+
+        self.velocities *= (1 + w) if self.accumulate_velocity else w
+        self.velocities += self._cognitive
+        self.velocities += self._social
+
+        max_velocity = self.max_velocity
+        if max_velocity is not None:
+            np.clip(self.velocities, -max_velocity, max_velocity, out=self.velocities)
+
+    def _social_target(self):
+        if self.topology is None:
+            return self.gbest_position[..., None, :]
+        return self.topology.local_best(self.best_scores, self.best_positions)
+
+    def _particle_social_target(self, i):
+        if self.topology is None:
+            return self.gbest_position
+        return self.topology.particle_best(i, self.best_scores, self.best_positions)
+
+    def update_position(self):
+        self.positions += self.velocities
+        np.clip(self.positions, self.bounds[0], self.bounds[1], out=self.positions)
+
+    def step(self, w, c1, c2):
+        if self._compiled:
+            self._step_compiled(w, c1, c2)
+        else:
+            self.update_velocity(w, c1, c2)
+            self.update_position()
+        self.end_iteration()
+
+    def _step_compiled(self, w, c1, c2):
+        import kernels
+
+        # Rastgele sayılar NumPy ile aynı sırada çekilir; kernel (R, N, D) dizileri bekler
+        shape = self.positions.shape
+        r1, r2 = (np.broadcast_to(r, shape) for r in self._rand_pair(self.num_particles))
+        social_target = np.broadcast_to(self._social_target(), shape)
+        arrays = [self.positions, self.velocities, self.best_positions, social_target, r1, r2]
+        if len(shape) == 2:
+            arrays = [array[None] for array in arrays]
+
+        max_velocity = self.max_velocity
+        kernels.swarm_step(*arrays, (1 + w) if self.accumulate_velocity else w, c1, c2,
+                           np.inf if max_velocity is None else max_velocity, self.bounds[0], self.bounds[1])
+
+    def end_iteration(self):
+        # Dinamik topolojiler iterasyon sayısına göre komşulukları yeniden kurar
+        if self.topology is not None:
+            self.topology.advance()
+
+    # Asenkron güncelleme için tek parçacık adımları
+    def evaluate_particle(self, i, score):
+        if score < self.best_scores[i]:
+            self.best_scores[i] = score
+            self.best_positions[i] = self.positions[i]
+        if score < self.gbest_score:
+            self.gbest_score = float(score)
+            self.gbest_position[:] = self.positions[i]
+
+    def step_particle(self, i, w, c1, c2):
+        r1, r2 = self._particle_random()
+        cognitive = c1 * r1 * (self.best_positions[i] - self.positions[i])
+        social = c2 * r2 * (self._particle_social_target(i) - self.positions[i])
+
+        velocity = self.velocities[i]
+        velocity *= (1 + w) if self.accumulate_velocity else w
+        velocity += cognitive + social
+        max_velocity = self.max_velocity
+        if max_velocity is not None:
+            np.clip(velocity, -max_velocity, max_velocity, out=velocity)
+
+        position = self.positions[i]
+        position += velocity
+        np.clip(position, self.bounds[0], self.bounds[1], out=position)
+
+
+class BatchSwarm(Swarm):
+    """R bağımsız sürüyü tek bir (R, N, D) dizisinde birlikte ilerleten motor.
+
+    positions / velocities / best_positions (R, N, D), best_scores (R, N),
+    gbest_position (R, D) ve gbest_score (R,) dizileridir; her koşunun gBest'i
+    ayrı takip edilir. Her koşu, kendi seed'iyle kurulan tek bir PSO'nun
+    sürü akışını (seeding.run_generators; verildiyse rngs) kullanır, böylece
+    bir koşunun sonucu toplu çalıştırılan koşu sayısından bağımsızdır.
+    """
+
+    def __init__(self, seeds, num_particles, dimensions, bounds, velocity_rate=None, random_per_dimension=True,
+                 accumulate_velocity=False, topology=None,
+                 backend='numpy', rngs=None):
+        self.seeds = list(seeds)
+        self.rngs = list(rngs) if rngs is not None else [run_generators(seed)["swarm"] for seed in self.seeds]
+        self.num_runs = len(self.rngs)
+        self.num_particles = num_particles
+        self.dimensions = dimensions
+        self.bounds = bounds
+        self.velocity_rate = velocity_rate
+        self.random_per_dimension = random_per_dimension
+        self.accumulate_velocity = accumulate_velocity
+        self.topology = topology
+        self.backend = backend
+        self._compiled = _use_kernels(backend)
+
+        shape = (num_particles, dimensions)
+        self.positions = self._uniform(bounds[0], bounds[1], shape)
+        self.velocities = self._uniform(-1, 1, shape)
+        self.best_positions = self.positions.copy()
+        self.best_scores = np.full((self.num_runs, num_particles), np.inf)
+        self.gbest_position = self._uniform(bounds[0], bounds[1], (dimensions,))
+        self.gbest_score = np.full(self.num_runs, np.inf)
+
+        self._cognitive = np.empty(self.positions.shape)
+        self._social = np.empty(self.positions.shape)
+        self._random_block = None
+        self._random_cursor = num_particles
+
+    def _uniform(self, low, high, shape):
+        return np.stack([rng.uniform(low, high, shape) for rng in self.rngs])
+
+    def _rand_pair(self, count):
+        # Her koşunun r1, r2'si kendi akışından tek çağrıda: (2, R, count, D|1)
+        r1, r2 = np.stack([rng.random((2,) + self._random_shape(count)) for rng in self.rngs], axis=1)
+        return r1, r2
+
+    def evaluate(self, scores):
+        # scores (R, N): koşu başına pbest ve gbest güncellemesi
+        scores = np.asarray(scores, dtype=float)
+        improved = scores < self.best_scores
+        np.copyto(self.best_scores, scores, where=improved)
+        np.copyto(self.best_positions, self.positions, where=improved[..., None])
+
+        runs = np.arange(self.num_runs)
+        best = np.argmin(self.best_scores, axis=1)
+        better = self.best_scores[runs, best] < self.gbest_score
+        self.gbest_score[better] = self.best_scores[runs[better], best[better]]
+        self.gbest_position[better] = self.best_positions[runs[better], best[better]]
+        return improved
+
+    # Asenkron güncelleme: i. parçacık tüm koşularda aynı anda değerlendirilir ve hareket eder
+    def evaluate_particle(self, i, scores):
+        scores = np.asarray(scores, dtype=float)
+        improved = scores < self.best_scores[:, i]
+        self.best_scores[improved, i] = scores[improved]
+        self.best_positions[improved, i] = self.positions[improved, i]
+        better = scores < self.gbest_score
+        self.gbest_score[better] = scores[better]
+        self.gbest_position[better] = self.positions[better, i]
+
+    def step_particle(self, i, w, c1, c2):
+        r1, r2 = self._particle_random()
+        cognitive = c1 * r1 * (self.best_positions[:, i] - self.positions[:, i])
+        social = c2 * r2 * (self._particle_social_target(i) - self.positions[:, i])
+
+        velocity = self.velocities[:, i]
+        velocity *= (1 + w) if self.accumulate_velocity else w
+        velocity += cognitive + social
+        max_velocity = self.max_velocity
+        if max_velocity is not None:
+            np.clip(velocity, -max_velocity, max_velocity, out=velocity)
+        self.velocities[:, i] = velocity
+
+        position = self.positions[:, i] + velocity
+        np.clip(position, self.bounds[0], self.bounds[1], out=position)
+        self.positions[:, i] = position
+
+
+def _use_kernels(backend):
+    if backend == 'numpy':
+        return False
+    if backend != 'numba':
+        raise ValueError(f"Geçersiz backend: {backend!r}")
+    import kernels
+    return kernels.available()
+
+
+def convergence_summary(curves):
+    # curves (R, T): koşu başına iterasyon iterasyon gBest skoru -> iterasyon başına istatistik eğrileri
+    return {"mean": curves.mean(axis=0), "median": np.median(curves, axis=0), "best": curves.min(axis=0),
+            "worst": curves.max(axis=0)}